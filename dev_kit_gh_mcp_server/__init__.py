@@ -1,12 +1,43 @@
 """Dev-Kit MCP Server package."""
 
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .create_server import start_server
-from .fastmcp_server import arun_server, run_server
+if TYPE_CHECKING:
+    from .create_server import start_server
+    from .fastmcp_server import arun_server, run_server
 
-# from .run_server import arun_server,
-
-__version__ = version("dev-kit-gh-mcp-server")
+# The server entry points pull in FastMCP and PyGithub, they are imported on first access
+# so that importing the package, or one of its subpackages, stays cheap.
+_LAZY_ATTRIBUTES = {
+    "start_server": ".create_server",
+    "run_server": ".fastmcp_server",
+    "arun_server": ".fastmcp_server",
+}
 
 __all__ = ["run_server", "start_server", "arun_server"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the package version and server entry points on first access.
+
+    Args:
+        name: The attribute name.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("dev-kit-gh-mcp-server")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
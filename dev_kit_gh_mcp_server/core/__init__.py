@@ -1,5 +1,9 @@
 """Core functionality for GitHub operations."""
 
+from dev_kit_gh_mcp_server.core.async_base import AsyncGitHubOperation
 from dev_kit_gh_mcp_server.core.base import GitHubOperation
+from dev_kit_gh_mcp_server.core.credentials import CredentialPool
+from dev_kit_gh_mcp_server.core.metadata import RepoMetadataIndex
+from dev_kit_gh_mcp_server.core.shared_cache import SharedCache
 
-__all__ = ["GitHubOperation"]
+__all__ = ["GitHubOperation", "AsyncGitHubOperation", "CredentialPool", "RepoMetadataIndex", "SharedCache"]
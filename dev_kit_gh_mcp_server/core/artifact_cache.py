@@ -0,0 +1,140 @@
+"""On-disk store of downloaded workflow artifact archives."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO, Awaitable, Callable, ClassVar, Dict, Optional, Tuple, Union
+
+
+class ArtifactCache:
+    """Size-capped directory of artifact archives, one zip file per artifact.
+
+    An artifact does not change once uploaded, so its archive is downloaded once and read from
+    disk until evicted. Archives are streamed to a temporary file of the directory, then linked to
+    their path unless another process got there first, so several processes may share a directory.
+    When the store grows past ``max_bytes``, the least recently read archives are removed.
+    """
+
+    _shared: ClassVar[Dict[Tuple[Optional[str], ...], "ArtifactCache"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 2 * 1024 * 1024 * 1024) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: The directory, created readable by the current user only.
+            max_bytes: Total size of the archives kept.
+
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "ArtifactCache":
+        """Return the store configured by environment variables, shared by all operations.
+
+        ``DEV_KIT_GH_ARTIFACT_CACHE`` sets the directory, by default in the user's cache directory,
+        and ``DEV_KIT_GH_ARTIFACT_CACHE_MAX_BYTES`` its size (default 2 GiB).
+
+        Returns:
+            ArtifactCache: The store.
+
+        """
+        config = (os.getenv("DEV_KIT_GH_ARTIFACT_CACHE"), os.getenv("DEV_KIT_GH_ARTIFACT_CACHE_MAX_BYTES"))
+        with cls._shared_lock:
+            cache = cls._shared.get(config)
+            if cache is None:
+                directory, max_bytes = config
+                if not directory:
+                    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+                    directory = str(Path(cache_home) / "dev-kit-gh-mcp-server" / "artifacts")
+                cache = cls._shared[config] = cls(directory, int(max_bytes) if max_bytes else 2 * 1024 * 1024 * 1024)
+        return cache
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.zip"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the path of a stored archive.
+
+        Args:
+            key: The key of the artifact, see ``fetch``.
+
+        Returns:
+            The path, or None if the archive is not stored.
+
+        """
+        path = self._path(key)
+        try:
+            # the modification time orders the archives for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    async def fetch(self, key: str, download: Callable[[IO[bytes]], Awaitable[int]]) -> Path:
+        """Return the path of an archive, downloading it first unless it is stored.
+
+        Args:
+            key: The key of the artifact, a file name naming the repository and artifact.
+            download: Coroutine function writing the archive into a file and returning its size.
+
+        Returns:
+            The path of the archive.
+
+        """
+        path = self.get(key)
+        if path is not None:
+            return path
+        path = self._path(key)
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".part", delete=False) as file:
+            try:
+                size = await download(file)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        try:
+            # linking fails if a concurrent download stored the archive first, it is counted once
+            os.link(file.name, path)
+        except FileExistsError:
+            return path
+        finally:
+            os.unlink(file.name)
+        # scanning the directory is blocking, it runs off the event loop
+        await asyncio.to_thread(self._added, size, path)
+        return path
+
+    def _added(self, size: int, path: Path) -> None:
+        with self._lock:
+            self._size = self._disk_size() if self._size is None else self._size + size
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+
+    def _disk_size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("*.zip"))
+
+    def _evict(self, keep: Path) -> None:
+        archives = []
+        for path in self.directory.glob("*.zip"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            archives.append((stat.st_mtime, stat.st_size, path))
+        archives.sort()
+        size = sum(archive[1] for archive in archives)
+        # evict down to 90% of the cap, the archive just downloaded is being read
+        for _, archive_size, path in archives:
+            if size <= self.max_bytes * 0.9:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            size -= archive_size
+        self._size = size
@@ -0,0 +1,262 @@
+"""Async-native base class for GitHub operations."""
+
+import asyncio
+import hashlib
+import json as jsonlib
+import time
+import weakref
+from dataclasses import dataclass
+from typing import IO, Any, AsyncGenerator, Callable, ClassVar, Dict, Generator, List, Optional, Tuple, Type, TypeVar
+
+import httpx
+from github.GithubObject import CompletableGithubObject
+
+from dev_kit_gh_mcp_server.core.base import GitHubOperation
+from dev_kit_gh_mcp_server.core.cassette import Cassette, CassetteTransport
+from dev_kit_gh_mcp_server.core.circuit import CircuitTransport
+from dev_kit_gh_mcp_server.core.conditional import next_link
+from dev_kit_gh_mcp_server.core.credentials import CredentialPool
+from dev_kit_gh_mcp_server.core.profiling import record_request
+from dev_kit_gh_mcp_server.core.shared_cache import SharedCache, SharedCacheTransport
+
+T = TypeVar("T")
+
+
+class _PoolAuth(httpx.Auth):
+    """Authenticate the requests of an httpx client with a credential pool."""
+
+    def __init__(self, pool: CredentialPool) -> None:
+        self._pool = pool
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        headers: Dict[str, str] = {}
+        self._pool.authentication(headers)
+        request.headers["Authorization"] = headers["Authorization"]
+        response = yield request
+        self._pool.record(headers["Authorization"], {key.lower(): value for key, value in response.headers.items()})
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        headers: Dict[str, str] = {}
+        # installation tokens are minted and refreshed with blocking requests
+        await asyncio.to_thread(self._pool.authentication, headers)
+        request.headers["Authorization"] = headers["Authorization"]
+        response = yield request
+        self._pool.record(headers["Authorization"], {key.lower(): value for key, value in response.headers.items()})
+
+
+async def _mark_sent(request: httpx.Request) -> None:
+    request.extensions["sent"] = time.perf_counter()
+
+
+async def _record_response(response: httpx.Response) -> None:
+    request = response.request
+    elapsed = time.perf_counter() - request.extensions.get("sent", time.perf_counter())
+    record_request(request.method, str(request.url), response.status_code, elapsed)
+
+
+@dataclass
+class AsyncGitHubOperation(GitHubOperation):
+    """Base class for GitHub operations that await their requests on a pooled asyncio HTTP client.
+
+    PyGithub blocks the event loop for every request, here requests are awaited on an
+    ``httpx.AsyncClient`` shared by all operations of an event loop, so thousands of calls can
+    be in flight without threads. Results are wrapped in the PyGithub classes, so tools opting
+    into this base keep their signatures and result shapes. The repository is not fetched on
+    construction, ``self._gh_repo`` only provides its URL and the requester for the wrapped objects.
+    """
+
+    lazy_repository: ClassVar[bool] = True
+    blocking_calls: ClassVar[bool] = False
+    max_connections: ClassVar[int] = 100
+    timeout: ClassVar[float] = 30.0
+    chunk_size: ClassVar[int] = 64 * 1024
+
+    # clients bind their connections to an event loop, so they are kept per loop
+    _clients: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client of the running event loop, shared by operations using the same API URL and token.
+
+        Returns:
+            httpx.AsyncClient: The pooled client.
+
+        """
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        shared_cache = SharedCache.installed()
+        key = (self.base_url, self._auth, shared_cache)
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            headers = {"Accept": "application/vnd.github+json", "User-Agent": "dev-kit-gh-mcp-server"}
+            if isinstance(self._auth, CredentialPool):
+                auth: Optional[httpx.Auth] = _PoolAuth(self._auth)
+            else:
+                auth, headers["Authorization"] = None, f"token {self._auth}"
+            sender: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+            cassette = Cassette.from_env()
+            if cassette is not None:
+                sender = CassetteTransport(cassette, sender)
+            if shared_cache is not None:
+                # the budget and stored responses of PyGithub requests are shared by these requests
+                sender = SharedCacheTransport(shared_cache, sender)
+            client = clients[key] = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                auth=auth,
+                # requests beyond the pool wait for a free connection instead of timing out
+                transport=CircuitTransport(sender),
+                timeout=httpx.Timeout(self.timeout, pool=None),
+                event_hooks={"request": [_mark_sent], "response": [_record_response]},
+            )
+        return client
+
+    @classmethod
+    async def aclose_clients(cls) -> None:
+        """Close the HTTP clients of the running event loop."""
+        for client in cls._clients.pop(asyncio.get_running_loop(), {}).values():
+            await client.aclose()
+
+    def credential_key(self) -> Tuple[str, str]:
+        """Identify the API URL and credentials whose rate limits the operation's requests count against.
+
+        Returns:
+            The API URL and a hash of the token, or of the identity of the credential pool.
+
+        """
+        # tokens are only kept hashed, and a pool is tracked as a whole
+        credential = self._auth if isinstance(self._auth, str) else f"pool-{id(self._auth)}"
+        return self.base_url, hashlib.sha256(credential.encode()).hexdigest()
+
+    def repo_url(self, path: str = "") -> str:
+        """Return the API URL of a repository sub-resource.
+
+        Args:
+            path: Path relative to the repository, e.g. "pulls".
+
+        Returns:
+            The URL, relative to the API URL unless the repository was fetched.
+
+        """
+        return f"{self._gh_repo.url}/{path}" if path else self._gh_repo.url
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Send a request and decode its JSON response.
+
+        Args:
+            method: HTTP method.
+            url: URL, absolute or relative to the API URL.
+            params: Optional query parameters.
+            json: Optional JSON body.
+            headers: Optional request headers, e.g. ``If-None-Match``.
+
+        Returns:
+            A ``(headers, data)`` tuple with lower-cased header names, data is None for an empty
+            body such as a ``304``. Error statuses raise the same ``GithubException`` subclasses as PyGithub.
+
+        """
+        response = await self.client.request(method, url, params=params, json=json, headers=headers)
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        data = response.json() if response.content else None
+        if response.status_code >= 400:
+            raise self._gh_repo._requester.createException(response.status_code, headers, data)
+        return headers, data
+
+    async def download(self, url: str, file: IO[bytes], max_bytes: Optional[int] = None) -> int:
+        """Stream a binary resource into a file, one chunk at a time.
+
+        Archives such as CI logs and artifacts are served through a redirect to a storage host,
+        the redirect is followed without forwarding the token. Only one chunk is held in memory.
+
+        Args:
+            url: URL of the resource, absolute or relative to the API URL.
+            file: Binary file the content is written to.
+            max_bytes: Optional size limit, larger resources raise ValueError.
+
+        Returns:
+            The number of bytes written. Error statuses raise the same ``GithubException``
+            subclasses as PyGithub.
+
+        Raises:
+            ValueError: If the resource is larger than max_bytes.
+
+        """
+        written = 0
+        async with self.client.stream("GET", url, follow_redirects=True) as response:
+            if response.status_code >= 400:
+                content = await response.aread()
+                headers = {key.lower(): value for key, value in response.headers.items()}
+                try:
+                    data = jsonlib.loads(content) if content else None
+                except ValueError:
+                    data = {"message": content.decode(errors="replace")}
+                raise self._gh_repo._requester.createException(response.status_code, headers, data)
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                written += len(chunk)
+                if max_bytes is not None and written > max_bytes:
+                    raise ValueError(f"{url} is larger than {max_bytes} bytes")
+                file.write(chunk)
+        return written
+
+    def as_object(self, klass: Type[T], data: Dict[str, Any], headers: Optional[Dict[str, Any]] = None) -> T:
+        """Wrap raw API data in a PyGithub class.
+
+        Args:
+            klass: The PyGithub class, e.g. ``PullRequest``.
+            data: The raw attributes.
+            headers: Optional response headers.
+
+        Returns:
+            The PyGithub object. Attributes missing from data are None, they are never fetched
+            with a blocking request.
+
+        """
+        if issubclass(klass, CompletableGithubObject):
+            return klass(self._gh_repo._requester, headers or {}, data, completed=True)
+        return klass(self._gh_repo._requester, headers or {}, data)  # type: ignore[call-arg]
+
+    async def paginate(
+        self,
+        klass: Type[T],
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_results: Optional[int] = None,
+        where: Optional[Callable[[T], bool]] = None,
+        list_item: Optional[str] = None,
+    ) -> List[T]:
+        """Await the pages of a listing, stopping as soon as enough items were gathered.
+
+        Args:
+            klass: The PyGithub class of the items.
+            url: URL of the first page.
+            params: Optional query parameters of the first page.
+            max_results: Maximum number of items to return, or None for no limit.
+            where: Optional predicate an item must satisfy to be returned.
+            list_item: Key of the items when pages are objects, e.g. "workflow_runs".
+
+        Returns:
+            A list of at most ``max_results`` matching items.
+
+        """
+        results: List[T] = []
+        next_url: Optional[str] = url
+        params = {"per_page": 100, **(params or {})}
+        while next_url is not None and (max_results is None or len(results) < max_results):
+            headers, data = await self.request_json("GET", next_url, params=params)
+            params = None
+            for raw in data[list_item] if list_item else data:
+                item = self.as_object(klass, raw, headers)
+                if where is None or where(item):
+                    results.append(item)
+            next_url = next_link(headers)
+        return results[:max_results]
@@ -1,28 +1,91 @@
 """Base class for GitHub operations."""
 
 import os
+import threading
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import islice, takewhile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from dev_kit_mcp_server.core import AsyncOperation
-from github import Github
+from github import Auth, Github
+from github.PaginatedList import PaginatedList
 from github.Repository import Repository
 
+from dev_kit_gh_mcp_server.core import transport
+from dev_kit_gh_mcp_server.core.cassette import Cassette
+from dev_kit_gh_mcp_server.core.circuit import circuit_middleware
+from dev_kit_gh_mcp_server.core.credentials import CredentialPool
+from dev_kit_gh_mcp_server.core.deadline import cancellable
+from dev_kit_gh_mcp_server.core.local import LocalCheckout
+from dev_kit_gh_mcp_server.core.metadata import RepoMetadataIndex
+from dev_kit_gh_mcp_server.core.profiling import profiled
+from dev_kit_gh_mcp_server.core.stale import StaleResults, document_stale, serve_stale
+
+T = TypeVar("T")
+
+DEFAULT_BASE_URL = "https://api.github.com"
+
 
 @dataclass
 class GitHubOperation(AsyncOperation):
     """Base class for GitHub repository operations."""
 
+    _repositories: ClassVar[Dict[Tuple[str, Union[str, CredentialPool], str], Repository]] = {}
+    _repositories_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Whether the repository is built without fetching it, the first API call then reveals a wrong name or token
+    lazy_repository: ClassVar[bool] = False
+    # Seconds a call may take, None for the DEV_KIT_GH_CALL_TIMEOUT environment variable or no limit
+    call_timeout: ClassVar[Optional[float]] = None
+    # Whether calls block on PyGithub requests and run in a worker thread, see ``cancellable``
+    blocking_calls: ClassVar[bool] = True
+    # Whether the last result of a call is served, as {"stale": True, "age_seconds": ..., "result": ...},
+    # while GitHub fails with server or connection errors or its circuit is open; see ``serve_stale``
+    serve_stale: ClassVar[bool] = False
+    # Seconds to wait for a fresh result before the last one is served, None to wait as long as GitHub answers
+    serve_stale_after: ClassVar[Optional[float]] = None
+    # Seconds during which the reads patched by a write are served without a request, see ``write_through``
+    write_through_ttl: ClassVar[float] = 60.0
+
     _gh_repo: Repository = field(init=False, default=None)
+    _auth: Union[str, CredentialPool] = field(init=False, default=None, repr=False)
     token: Optional[str] = field(
         default=None,
         metadata={
-            "description": "GitHub token for authentication. "
-            "If not provided, it will be fetched from the environment variable GITHUB_TOKEN."
+            "description": "GitHub token for authentication. If not provided, the pool of credentials is used, "
+            "else the token is fetched from the environment variable GITHUB_TOKEN."
+        },
+    )
+    base_url: Optional[str] = field(
+        default=None,
+        metadata={
+            "description": "GitHub API URL. If not provided, it will be fetched from the environment variable "
+            f"GITHUB_API_URL, defaulting to {DEFAULT_BASE_URL}."
+        },
+    )
+    credentials: Optional[CredentialPool] = field(
+        default=None,
+        repr=False,
+        metadata={
+            "description": "Pool of tokens or GitHub App installations to spread requests over, used when no token "
+            "is provided. If not provided, it is configured by the environment variables GITHUB_TOKENS or GITHUB_APP_*."
         },
     )
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Make the calls of every operation cancellable, profiled and able to serve stale results.
+
+        See ``cancellable``, ``CallProfiler`` and ``serve_stale``.
+        """
+        super().__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__:
+            call = cancellable(profiled(cls.__dict__["__call__"]), in_thread=cls.blocking_calls)
+            cls.__call__ = serve_stale(call)
+            if cls.serve_stale or cls.serve_stale_after is not None:
+                # MCP clients are told the shape of stale results
+                cls.__call__.__doc__ = document_stale(cls.__call__.__doc__, slow=cls.serve_stale_after is not None)
+
     def __post_init__(self) -> None:
         """Post-initialization method to set up the GitHub repository.
 
@@ -30,22 +93,67 @@ class GitHubOperation(AsyncOperation):
             ValueError: If GitHub token is not provided or if repository has no remote URL or multiple remote URLs.
 
         """
-        # Initialize the GitHub repository
-        token = self.token or os.getenv("GITHUB_TOKEN")
-        if not isinstance(token, str):
+        # Initialize the GitHub repository, a pool configured by the environment takes precedence over GITHUB_TOKEN
+        auth = self.token or self.credentials or CredentialPool.from_env() or os.getenv("GITHUB_TOKEN")
+        if not isinstance(auth, (str, CredentialPool)):
             raise ValueError("GitHub token is required. Set it as an environment variable or pass it as an argument.")
-        gh = Github(login_or_token=token)
+        self._auth = auth
+        self.base_url = self.base_url or os.getenv("GITHUB_API_URL") or DEFAULT_BASE_URL
         if self.root_dir_is_a_url():
-            self._gh_repo = gh.get_repo(self.root_dir)
-            return
-        super().__post_init__()
+            full_name = self.root_dir
+        else:
+            super().__post_init__()
+
+            remote_url = self._repo.remotes
+            if len(remote_url) == 0:
+                raise ValueError("No remote URL found for the repository. Use GH repo URL instead.")
+            if len(remote_url) > 1:
+                raise ValueError("Multiple remote URLs found. Use GH repo URL instead.")
+            full_name = remote_url[0].url.split(":")[-1]
+        self._gh_repo = self.shared_repository(auth, full_name, self.base_url, lazy=self.lazy_repository)
+
+    @classmethod
+    def shared_repository(
+        cls,
+        auth: Union[str, CredentialPool],
+        full_name: str,
+        base_url: str = DEFAULT_BASE_URL,
+        lazy: bool = False,
+    ) -> Repository:
+        """Return the repository object shared by all operations using the same credentials.
+
+        The server creates one operation per tool, sharing the client and repository
+        makes startup cost a single repository request instead of one per tool.
+
+        Args:
+            auth: GitHub token, or pool of credentials, for authentication.
+            full_name: Repository full name, e.g. "owner/repo".
+            base_url: GitHub API URL.
+            lazy: Build the repository without fetching it, if it is not shared yet.
+
+        Returns:
+            Repository: The repository, fetched on first request.
+
+        """
+        key = (base_url, auth, full_name)
+        with cls._repositories_lock:
+            repo = cls._repositories.get(key)
+        if repo is None:
+            transport.add_middleware(circuit_middleware)
+            cassette = Cassette.from_env()
+            if cassette is not None:
+                transport.add_middleware(cassette)
+            credentials = auth if isinstance(auth, CredentialPool) else Auth.Token(auth)
+            repo = Github(base_url=base_url, auth=credentials).get_repo(full_name, lazy=lazy)
+            with cls._repositories_lock:
+                repo = cls._repositories.setdefault(key, repo)
+        return repo
 
-        remote_url = self._repo.remotes
-        if len(remote_url) == 0:
-            raise ValueError("No remote URL found for the repository. Use GH repo URL instead.")
-        if len(remote_url) > 1:
-            raise ValueError("Multiple remote URLs found. Use GH repo URL instead.")
-        self._gh_repo = gh.get_repo(remote_url[0].url.split(":")[-1])
+    @classmethod
+    def clear_repositories(cls) -> None:
+        """Drop all shared repository objects."""
+        with cls._repositories_lock:
+            cls._repositories.clear()
 
     def root_dir_is_a_url(self) -> bool:
         """Return True if root_dir is a URL, False if it is a local path.
@@ -56,6 +164,57 @@ class GitHubOperation(AsyncOperation):
         """
         return not Path(self.root_dir).exists()
 
+    @property
+    def metadata(self) -> RepoMetadataIndex:
+        """Shared labels, milestones and assignees index of the repository.
+
+        Returns:
+            RepoMetadataIndex: The index, loaded on first use.
+
+        """
+        return RepoMetadataIndex.for_repo(self._gh_repo)
+
+    @property
+    def local_checkout(self) -> Optional[LocalCheckout]:
+        """Local clone of the repository when root_dir is a path.
+
+        Returns:
+            LocalCheckout: The clone, or None when root_dir is a repository name.
+
+        """
+        repo = getattr(self, "_repo", None)
+        return LocalCheckout(repo, self._gh_repo) if repo is not None else None
+
+    def snapshot_scope(self, **filters: Any) -> Tuple[str, str, str]:
+        """Identify the listings a delta mode snapshot can be compared to.
+
+        Args:
+            filters: The filters of the listing, e.g. ``state``.
+
+        Returns:
+            The operation, repository and filters.
+
+        """
+        return type(self).__name__, self._gh_repo.url, repr(sorted(filters.items()))
+
+    def write_through(self, read_operation: type, patch: Callable[[Dict[str, Any], Any], Any]) -> int:
+        """Patch the stored results of a read operation on the repository with the result of a write.
+
+        The next identical read returns the patched result without a request if it was stored in
+        the last ``write_through_ttl`` seconds, see ``StaleResults.patch``.
+
+        Args:
+            read_operation: The read operation class, e.g. ``ListIssuesOp``.
+            patch: Function of the arguments and result of a call, returning the patched result, the
+                result itself when the write does not change it, or None to drop it.
+
+        Returns:
+            The number of results patched or dropped.
+
+        """
+        scope = (read_operation.__name__, self.base_url, self._gh_repo.url)
+        return StaleResults.patch(scope, patch, fresh_for=self.write_through_ttl)
+
     def uncrooked_params(self, **kwargs: object) -> dict:
         """Uncrooked parameters for GitHub operations.
 
@@ -67,3 +226,108 @@ class GitHubOperation(AsyncOperation):
 
         """
         return {k: v for k, v in kwargs.items() if v is not None}
+
+    def lazy_child(self, klass: Type[T], path: str, **attributes: Any) -> T:
+        """Build a not yet fetched object for a sub-resource of the repository.
+
+        Listing endpoints such as ``issues/{number}/comments`` only need the parent URL,
+        so building the parent lazily saves the request that would fetch it.
+
+        Args:
+            klass: PyGithub class of the sub-resource, e.g. ``Issue`` or ``PullRequest``.
+            path: Path of the sub-resource relative to the repository API URL.
+            attributes: Additional attributes known upfront, e.g. ``number``.
+
+        Returns:
+            An incomplete instance of ``klass`` that is fetched only if needed.
+
+        """
+        url = f"{self._gh_repo.url}/{path}"
+        return klass(self._gh_repo._requester, {}, {"url": url, **attributes}, completed=False)  # type: ignore[call-arg]
+
+    @staticmethod
+    def as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+        """Normalize a datetime to UTC, treating naive values as UTC.
+
+        Args:
+            moment: The datetime to normalize.
+
+        Returns:
+            The timezone aware datetime in UTC, or None.
+
+        """
+        if moment is None:
+            return None
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+        return moment.astimezone(timezone.utc)
+
+    @staticmethod
+    def check_order(order: str) -> str:
+        """Validate a listing order argument.
+
+        Args:
+            order: "asc" for oldest first or "desc" for newest first.
+
+        Returns:
+            The validated order.
+
+        Raises:
+            ValueError: If order is neither "asc" nor "desc".
+
+        """
+        if order not in ("asc", "desc"):
+            raise ValueError(f"order must be 'asc' or 'desc', got: {order}")
+        return order
+
+    def ordered(self, items: PaginatedList, order: str) -> PaginatedList:
+        """Return a paginated listing in chronological or reverse chronological order.
+
+        Args:
+            items: A listing in the API's natural, oldest first, order.
+            order: "asc" for oldest first or "desc" for newest first.
+
+        Returns:
+            The listing, reversed so that the newest page is fetched first for "desc".
+
+        """
+        return items.reversed if self.check_order(order) == "desc" else items
+
+    @staticmethod
+    def authored_by(author: Optional[str]) -> Optional[Callable[[Any], bool]]:
+        """Return a predicate matching objects whose user login is author.
+
+        Args:
+            author: The GitHub login to match, case-insensitively.
+
+        Returns:
+            The predicate, or None when no author filter is requested.
+
+        """
+        if author is None:
+            return None
+        login = author.lower()
+        return lambda item: item.user is not None and item.user.login.lower() == login
+
+    @staticmethod
+    def take(
+        items: Iterable[T],
+        max_results: Optional[int] = None,
+        where: Optional[Callable[[T], bool]] = None,
+        until: Optional[Callable[[T], bool]] = None,
+    ) -> List[T]:
+        """Consume a lazily paginated listing, stopping as soon as enough items were gathered.
+
+        Args:
+            items: Iterable of items, typically a PyGithub ``PaginatedList``.
+            max_results: Maximum number of items to return, or None for no limit.
+            where: Optional predicate an item must satisfy to be returned.
+            until: Optional predicate that ends the listing at the first item it matches.
+
+        Returns:
+            A list of at most ``max_results`` matching items.
+
+        """
+        if until is not None:
+            items = takewhile(lambda item: not until(item), items)
+        return list(islice(filter(where, items), max_results))
@@ -0,0 +1,146 @@
+"""On-disk store of git blob contents addressed by their SHA."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import ClassVar, Dict, Optional, Tuple, Union
+
+
+def blob_sha(content: bytes) -> str:
+    """Return the git object name of a blob.
+
+    Args:
+        content: The blob content.
+
+    Returns:
+        The SHA-1 git and GitHub give the blob.
+
+    """
+    return hashlib.sha1(b"blob %d\0" % len(content) + content, usedforsecurity=False).hexdigest()
+
+
+class BlobCache:
+    """Size-capped directory of blob contents, one file per blob SHA.
+
+    A blob SHA names its content, so entries never go stale: the same file read on any branch
+    or commit where it did not change is served from disk. Contents are checked against their
+    SHA before being stored. When the store grows past ``max_bytes``, the least recently read
+    blobs are removed. Several processes may share a directory, files are written atomically.
+    """
+
+    _shared: ClassVar[Dict[Tuple[Optional[str], ...], "BlobCache"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 256 * 1024 * 1024) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: The directory, created readable by the current user only.
+            max_bytes: Total size of the blobs kept.
+
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "BlobCache":
+        """Return the store configured by environment variables, shared by all operations.
+
+        ``DEV_KIT_GH_BLOB_CACHE`` sets the directory, by default in the user's cache directory,
+        and ``DEV_KIT_GH_BLOB_CACHE_MAX_BYTES`` its size (default 256 MiB).
+
+        Returns:
+            BlobCache: The store.
+
+        """
+        config = (os.getenv("DEV_KIT_GH_BLOB_CACHE"), os.getenv("DEV_KIT_GH_BLOB_CACHE_MAX_BYTES"))
+        with cls._shared_lock:
+            cache = cls._shared.get(config)
+            if cache is None:
+                directory, max_bytes = config
+                if not directory:
+                    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+                    directory = str(Path(cache_home) / "dev-kit-gh-mcp-server" / "blobs")
+                cache = cls._shared[config] = cls(directory, int(max_bytes) if max_bytes else 256 * 1024 * 1024)
+        return cache
+
+    def _path(self, sha: str) -> Path:
+        return self.directory / sha[:2] / sha[2:]
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """Return the content of a blob.
+
+        Args:
+            sha: The blob SHA.
+
+        Returns:
+            The content, or None if the blob is not stored.
+
+        """
+        path = self._path(sha.lower())
+        try:
+            content = path.read_bytes()
+            # the modification time orders the blobs for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def put(self, sha: str, content: bytes) -> None:
+        """Store the content of a blob.
+
+        Args:
+            sha: The blob SHA.
+            content: The content.
+
+        Raises:
+            ValueError: If the content does not match the SHA.
+
+        """
+        sha = sha.lower()
+        if blob_sha(content) != sha:
+            raise ValueError(f"The content does not match blob {sha}.")
+        if len(content) > self.max_bytes:
+            return
+        path = self._path(sha)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            file.write(content)
+        try:
+            # linking fails if another thread or process stored the blob meanwhile, it is counted once
+            os.link(file.name, path)
+        except FileExistsError:
+            return
+        finally:
+            os.unlink(file.name)
+        with self._lock:
+            self._size = self._disk_size() if self._size is None else self._size + len(content)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _disk_size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("??/*"))
+
+    def _evict(self) -> None:
+        blobs = []
+        for path in self.directory.glob("??/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        blobs.sort()
+        size = sum(blob[1] for blob in blobs)
+        # evict down to 90% of the cap, so that every new blob does not trigger a scan
+        for _, blob_size, path in blobs:
+            if size <= self.max_bytes * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            size -= blob_size
+        self._size = size
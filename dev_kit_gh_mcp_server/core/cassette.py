@@ -0,0 +1,328 @@
+"""Recording of GitHub API interactions into cassette files, replayed without network access."""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+from dev_kit_gh_mcp_server.core import transport
+
+# headers that change on every response and matter to no tool, left out of cassettes
+_NOISY_HEADERS = frozenset({
+    "access-control-allow-origin",
+    "access-control-expose-headers",
+    "connection",
+    "content-encoding",
+    "content-length",
+    "content-security-policy",
+    "date",
+    "keep-alive",
+    "referrer-policy",
+    "server",
+    "strict-transport-security",
+    "transfer-encoding",
+    "vary",
+    "x-content-type-options",
+    "x-frame-options",
+    "x-github-request-id",
+    "x-xss-protection",
+})
+
+
+class CassetteMissError(Exception):
+    """Raised in place of a request that a replayed cassette holds no response for."""
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _key(method: str, url: str, body: Any, accept: Optional[str] = None) -> str:
+    # interactions are matched on the method, path, query, media type and body, so a cassette replays against any host
+    parts = urlsplit(url)
+    key = f"{method.upper()} {parts.path}" + (f"?{parts.query}" if parts.query else "")
+    if accept and accept != "*/*":
+        # the same URL answers e.g. a diff or raw content for another media type
+        key += f" ({accept})"
+    if body:
+        content = body.encode() if isinstance(body, str) else bytes(body)
+        key += f" {hashlib.sha256(content).hexdigest()[:16]}"
+    return key
+
+
+def _redacted(content: bytes) -> bytes:
+    # installation and OAuth tokens minted through the API are answered in ``token`` fields
+    if b"token" not in content:
+        return content
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return content
+    found = False
+
+    def redact(value: Any) -> Any:
+        nonlocal found
+        if isinstance(value, dict):
+            redacted = {}
+            for name, item in value.items():
+                if name.endswith("token") and isinstance(item, str):
+                    redacted[name], found = "REDACTED", True
+                else:
+                    redacted[name] = redact(item)
+            return redacted
+        if isinstance(value, list):
+            return [redact(item) for item in value]
+        return value
+
+    data = redact(data)
+    return json.dumps(data).encode() if found else content
+
+
+class Cassette:
+    """Recorded API interactions, written by a recording client and served to a replaying one.
+
+    While recording, every request is sent and its status, headers, body and duration are
+    appended to the cassette, a JSON line per interaction. Headers keep the ``ETag``, ``Link``
+    and rate-limit values, URLs of the API host in headers and bodies are stored relative to
+    it, and tokens are never recorded: neither the request headers nor the ``token`` fields of
+    responses, such as those minting GitHub App installation tokens. Requests are told apart by
+    method, URL, ``Accept`` media type and body. While replaying, requests are answered from the
+    cassette without network access: the interactions of a request are served in the recorded
+    order, the last one repeating once they are all served, and requests missing from the
+    cassette raise ``CassetteMissError``.
+
+    Replayed responses take ``latency`` seconds, or their recorded duration when it is None,
+    which makes the performance of the tools measurable deterministically.
+    """
+
+    _shared: ClassVar[Dict[Tuple[Optional[str], ...], "Cassette"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Union[str, Path], mode: str = "replay", latency: Optional[float] = 0.0) -> None:
+        """Open a cassette.
+
+        Args:
+            path: Path of the cassette file.
+            mode: "record" to send the requests and write a new cassette, "replay" to answer
+                them from an existing one.
+            latency: Seconds a replayed response takes, None for its recorded duration.
+
+        Raises:
+            ValueError: If the mode is unknown.
+
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode {mode!r}, choose among ['record', 'replay'].")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._served: Dict[str, int] = {}
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("")
+        else:
+            with self.path.open() as lines:
+                for line in lines:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions.setdefault(interaction["request"], []).append(interaction)
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassette"]:
+        """Return the cassette configured by environment variables, shared by all operations.
+
+        ``DEV_KIT_GH_CASSETTE`` sets the cassette file and ``DEV_KIT_GH_CASSETTE_MODE`` the mode,
+        by default "replay" when the file exists and "record" otherwise. ``DEV_KIT_GH_CASSETTE_LATENCY``
+        sets the seconds a replayed response takes, or "recorded" for the recorded durations (default 0).
+
+        Returns:
+            Cassette: The cassette, or None when none is configured.
+
+        """
+        config = tuple(
+            os.getenv(name)
+            for name in ("DEV_KIT_GH_CASSETTE", "DEV_KIT_GH_CASSETTE_MODE", "DEV_KIT_GH_CASSETTE_LATENCY")
+        )
+        path, mode, latency = config
+        if not path:
+            return None
+        with cls._shared_lock:
+            cassette = cls._shared.get(config)
+            if cassette is None:
+                cassette = cls._shared[config] = cls(
+                    path,
+                    mode or ("replay" if Path(path).exists() else "record"),
+                    None if latency == "recorded" else float(latency or 0.0),
+                )
+        return cassette
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the cassettes created from environment variables and stop running them."""
+        with cls._shared_lock:
+            cassettes = list(cls._shared.values())
+            cls._shared.clear()
+        for cassette in cassettes:
+            transport.remove_middleware(cassette)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        status: int,
+        headers: Any,
+        content: bytes,
+        elapsed: float,
+        accept: Optional[str] = None,
+    ) -> None:
+        """Append an interaction to the cassette.
+
+        Args:
+            method: The request method.
+            url: The request URL.
+            body: The request body.
+            status: The response status.
+            headers: The ``(name, value)`` pairs of the response headers.
+            content: The decoded response body, its ``token`` fields are redacted.
+            elapsed: Seconds the response took.
+            accept: The ``Accept`` header of the request.
+
+        """
+        origin = _origin(url)
+        content = _redacted(content)
+        interaction: Dict[str, Any] = {
+            "request": _key(method, url, body, accept),
+            "status": status,
+            "headers": {
+                name: value.replace(origin, "{origin}") for name, value in headers if name.lower() not in _NOISY_HEADERS
+            },
+            "elapsed": round(elapsed, 4),
+        }
+        try:
+            interaction["body"] = content.decode().replace(origin, "{origin}")
+        except UnicodeDecodeError:
+            interaction["body"], interaction["base64"] = base64.b64encode(content).decode(), True
+        with self._lock:
+            self._interactions.setdefault(interaction["request"], []).append(interaction)
+            with self.path.open("a") as file:
+                file.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+
+    def replay(
+        self, method: str, url: str, body: Any, accept: Optional[str] = None
+    ) -> Tuple[int, Dict[str, str], bytes, float]:
+        """Return the next recorded response to a request.
+
+        Args:
+            method: The request method.
+            url: The request URL.
+            body: The request body.
+            accept: The ``Accept`` header of the request.
+
+        Returns:
+            The status, headers, body and seconds the response takes.
+
+        Raises:
+            CassetteMissError: If the cassette holds no response to the request.
+
+        """
+        key = _key(method, url, body, accept)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                raise CassetteMissError(f"{self.path} holds no response to {key}.")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        interaction = interactions[min(served, len(interactions) - 1)]
+        origin = _origin(url)
+        headers = {name: value.replace("{origin}", origin) for name, value in interaction["headers"].items()}
+        if interaction.get("base64"):
+            content = base64.b64decode(interaction["body"])
+        else:
+            content = interaction["body"].replace("{origin}", origin).encode()
+        latency = interaction["elapsed"] if self.latency is None else self.latency
+        return interaction["status"], headers, content, latency
+
+    def __call__(self, request: transport.Request, send: transport.Handler) -> Any:
+        """Record or replay a request sent by PyGithub.
+
+        Args:
+            request: The request.
+            send: The next handler.
+
+        Returns:
+            The response.
+
+        """
+        accept = next((value for name, value in request.headers.items() if name.lower() == "accept"), None)
+        if self.mode == "replay":
+            status, headers, content, latency = self.replay(request.method, request.url, request.body, accept)
+            time.sleep(latency)
+            return transport.Response(status, headers, content.decode(errors="replace"))
+        started = time.perf_counter()
+        response = send(request)
+        body = response.read()
+        elapsed = time.perf_counter() - started
+        received = list(response.getheaders())
+        self.record(
+            request.method, request.url, request.body, response.status, received, body.encode(), elapsed, accept
+        )
+        return transport.Response(response.status, dict(received), body)
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx transport recording its requests into a cassette, or answering them from it."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport) -> None:
+        """Wrap a transport.
+
+        Args:
+            cassette: The cassette.
+            transport: The transport sending the requests while recording.
+
+        """
+        self._cassette = cassette
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send and record a request, or replay its recorded response.
+
+        Args:
+            request: The request.
+
+        Returns:
+            httpx.Response: The response.
+
+        """
+        body = await request.aread()
+        accept = request.headers.get("Accept")
+        if self._cassette.mode == "replay":
+            status, headers, content, latency = self._cassette.replay(request.method, str(request.url), body, accept)
+            await asyncio.sleep(latency)
+            return httpx.Response(status, headers=headers, content=content, request=request)
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        # the body is decompressed, its encoding headers are dropped with the noisy ones
+        decoded = httpx.Response(response.status_code, headers=response.headers, stream=response.stream)
+        content = await decoded.aread()
+        elapsed = time.perf_counter() - started
+        kept = [(name, value) for name, value in response.headers.items() if name.lower() not in _NOISY_HEADERS]
+        self._cassette.record(
+            request.method, str(request.url), body, response.status_code, kept, content, elapsed, accept
+        )
+        return httpx.Response(response.status_code, headers=kept, content=content, request=request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
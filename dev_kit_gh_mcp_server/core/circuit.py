@@ -0,0 +1,186 @@
+"""Circuit breaker failing requests fast while a GitHub API host is failing."""
+
+import asyncio
+import threading
+import time
+from typing import Any, ClassVar, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from github.GithubException import GithubException
+
+from dev_kit_gh_mcp_server.core import transport
+
+
+class CircuitOpenError(Exception):
+    """Raised in place of a request to a host whose circuit is open."""
+
+
+def is_outage(error: BaseException) -> bool:
+    """Tell whether an error means the API is failing, rather than the request being wrong.
+
+    Args:
+        error: The error raised by a request or an operation call.
+
+    Returns:
+        True for server errors, connection errors, timeouts and open circuits.
+
+    """
+    if isinstance(error, GithubException):
+        return error.status >= 500
+    return isinstance(
+        error,
+        (CircuitOpenError, requests.RequestException, httpx.TransportError, TimeoutError, asyncio.TimeoutError),
+    )
+
+
+class CircuitBreaker:
+    """Consecutive failures of the requests to one host, opening the circuit past a threshold.
+
+    After ``failure_threshold`` requests in a row fail with a server or connection error, the
+    circuit opens and requests fail at once with ``CircuitOpenError`` instead of waiting for
+    timeouts. Every ``reset_timeout`` seconds one request is let through to probe the host,
+    its success closes the circuit again.
+    """
+
+    failure_threshold: ClassVar[int] = 5
+    reset_timeout: ClassVar[float] = 30.0
+
+    _breakers: ClassVar[Dict[str, "CircuitBreaker"]] = {}
+    _breakers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, host: str) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            host: The host, named in errors.
+
+        """
+        self.host = host
+        self.failures = 0
+        # time the circuit opened or was last probed, None while it is closed
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_url(cls, url: str) -> "CircuitBreaker":
+        """Return the circuit breaker of the host of a URL, shared by all requests to it.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            CircuitBreaker: The breaker.
+
+        """
+        host = urlsplit(url).netloc
+        with cls._breakers_lock:
+            breaker = cls._breakers.get(host)
+            if breaker is None:
+                breaker = cls._breakers[host] = cls(host)
+        return breaker
+
+    @classmethod
+    def reset_all(cls) -> None:
+        """Forget the state of all circuits."""
+        with cls._breakers_lock:
+            cls._breakers.clear()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests currently fail fast."""
+        return self.opened_at is not None
+
+    def before_request(self) -> None:
+        """Let a request through, or fail it fast while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and a probe was sent less than ``reset_timeout`` ago.
+
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            now = time.monotonic()
+            wait = self.opened_at + self.reset_timeout - now
+            if wait > 0:
+                raise CircuitOpenError(
+                    f"{self.host} failed {self.failures} times in a row, requests are retried in {wait:.0f} seconds."
+                )
+            # this request probes the host, the next probe waits for another reset_timeout
+            self.opened_at = now
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            success: False for a server or connection error.
+
+        """
+        with self._lock:
+            if success:
+                self.failures, self.opened_at = 0, None
+                return
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def circuit_middleware(request: transport.Request, send: transport.Handler) -> Any:
+    """Transport middleware failing the requests to a host with an open circuit with ``CircuitOpenError``.
+
+    Args:
+        request: The request.
+        send: The next handler.
+
+    Returns:
+        The response.
+
+    """
+    breaker = CircuitBreaker.for_url(request.url)
+    breaker.before_request()
+    try:
+        response = send(request)
+    except Exception as error:
+        breaker.record(not is_outage(error))
+        raise
+    breaker.record(response.status < 500)
+    return response
+
+
+class CircuitTransport(httpx.AsyncBaseTransport):
+    """httpx transport failing the requests to a host with an open circuit."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: The transport sending the requests.
+
+        """
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, or raise ``CircuitOpenError`` if the circuit of its host is open.
+
+        Args:
+            request: The request.
+
+        Returns:
+            httpx.Response: The response.
+
+        """
+        breaker = CircuitBreaker.for_url(str(request.url))
+        breaker.before_request()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception as error:
+            breaker.record(not is_outage(error))
+            raise
+        breaker.record(response.status_code < 500)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
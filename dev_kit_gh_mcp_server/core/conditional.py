@@ -0,0 +1,97 @@
+"""Conditional GET requests revalidated with ETags."""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
+
+from github.Requester import Requester
+
+_NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def next_link(headers: Dict[str, Any]) -> Optional[str]:
+    """Return the URL of the next page advertised by a ``Link`` response header.
+
+    Args:
+        headers: Response headers with lower-cased keys.
+
+    Returns:
+        The next page URL, or None on the last page.
+
+    """
+    match = _NEXT_LINK.search(str(headers.get("link", "")))
+    return match.group(1) if match else None
+
+
+class ConditionalGet:
+    """GET requests that revalidate the last response of every URL with ``If-None-Match``.
+
+    GitHub answers an unchanged resource with an empty ``304 Not Modified``, which does not
+    count against the rate limit, and the body kept from the previous response is reused. The
+    responses of the ``max_responses`` most recently requested URLs are kept.
+    """
+
+    max_responses: ClassVar[int] = 1024
+
+    def __init__(self, requester: Requester) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            requester: The PyGithub requester used to send the requests.
+
+        """
+        self._requester = requester
+        self._responses: "OrderedDict[str, Tuple[str, Dict[str, Any], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, parameters: Optional[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any], Any]:
+        """Send a conditional GET request.
+
+        Args:
+            url: Absolute or API relative URL of the resource.
+            parameters: Optional query parameters.
+
+        Returns:
+            A ``(modified, headers, data)`` tuple, modified is False when the cached body was reused.
+            Error statuses raise the matching ``GithubException``.
+
+        """
+        key = Requester.add_parameters_to_url(url, parameters or {})
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+        request_headers = {"If-None-Match": cached[0]} if cached else {}
+        status, headers, output = self._requester.requestJson("GET", url, parameters, request_headers)
+        if status == 304 and cached:
+            return False, cached[1], cached[2]
+        data = json.loads(output) if output else None
+        if status >= 400:
+            raise self._requester.createException(status, headers, data)
+        if headers.get("etag"):
+            with self._lock:
+                self._responses[key] = (headers["etag"], headers, data)
+                self._responses.move_to_end(key)
+                while len(self._responses) > self.max_responses:
+                    self._responses.popitem(last=False)
+        return True, headers, data
+
+    def pages(self, url: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """Yield the body of every page of a listing, revalidating each page separately.
+
+        Args:
+            url: Absolute or API relative URL of the listing.
+            parameters: Optional query parameters of the first page.
+
+        Yields:
+            The decoded body of each page.
+
+        """
+        next_url: Optional[str] = url
+        while next_url is not None:
+            _, headers, data = self(next_url, parameters)
+            parameters = None
+            yield data
+            next_url = next_link(headers)
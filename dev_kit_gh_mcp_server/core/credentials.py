@@ -0,0 +1,247 @@
+"""Pools of GitHub credentials rotated by their remaining rate-limit budget."""
+
+import math
+import os
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from github import Auth
+from github.Requester import Requester, WithRequester
+
+from dev_kit_gh_mcp_server.core.transport import add_response_hook
+
+
+@dataclass
+class _Budget:
+    remaining: Optional[int] = None
+    limit: Optional[int] = None
+    reset: float = 0.0
+
+    def estimate(self, now: float) -> float:
+        if self.remaining is None:
+            # credentials that were never used are tried first
+            return math.inf
+        if now >= self.reset and self.limit is not None:
+            return self.limit
+        return self.remaining
+
+
+_pools: "weakref.WeakSet[CredentialPool]" = weakref.WeakSet()
+
+
+def _record_response(method: str, url: str, headers: Dict[str, str], status: int, response: Dict[str, Any]) -> None:
+    authorization = headers.get("Authorization")
+    if authorization is not None:
+        for pool in list(_pools):
+            pool.record(authorization, response)
+
+
+class CredentialPool(Auth.Auth, WithRequester["CredentialPool"]):
+    """Authenticate every request with the credential that has the most rate-limit budget left.
+
+    A single token allows 5,000 requests per hour, a pool of personal access tokens or GitHub App
+    installations multiplies that. The budget of each credential is read from the
+    ``X-RateLimit-*`` headers of its responses and restored at its reset time, requests in flight
+    are deducted upfront so that concurrent requests spread over the pool. Installation tokens are
+    minted on first use and refreshed before they expire.
+    """
+
+    _from_env: ClassVar[Dict[Tuple[Optional[str], ...], "CredentialPool"]] = {}
+    _from_env_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, credentials: Sequence[Auth.Auth]) -> None:
+        """Initialize the pool.
+
+        Args:
+            credentials: The credentials, e.g. ``Auth.Token`` or ``Auth.AppInstallationAuth`` instances.
+
+        Raises:
+            ValueError: If no credential is given.
+
+        """
+        if not credentials:
+            raise ValueError("A credential pool needs at least one credential.")
+        WithRequester.__init__(self)
+        self._credentials = list(credentials)
+        self._budgets = [_Budget() for _ in self._credentials]
+        # the Authorization header each credential sent last, tokens of installations change on refresh
+        self._authorizations: List[Optional[str]] = [None] * len(self._credentials)
+        self._lock = threading.Lock()
+        add_response_hook(_record_response)
+        _pools.add(self)
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> "CredentialPool":
+        """Create a pool of personal access tokens.
+
+        Args:
+            tokens: The tokens.
+
+        Returns:
+            CredentialPool: The pool.
+
+        """
+        return cls([Auth.Token(token) for token in tokens])
+
+    @classmethod
+    def for_app(cls, app_id: str, private_key: str, installation_ids: Iterable[int]) -> "CredentialPool":
+        """Create a pool of GitHub App installations.
+
+        Args:
+            app_id: The GitHub App id.
+            private_key: The PEM private key of the App.
+            installation_ids: Installations to mint tokens for, each has its own budget.
+
+        Returns:
+            CredentialPool: The pool.
+
+        """
+        app = Auth.AppAuth(app_id, private_key)
+        return cls([app.get_installation_auth(int(installation_id)) for installation_id in installation_ids])
+
+    @classmethod
+    def from_env(cls) -> Optional["CredentialPool"]:
+        """Return the pool configured by environment variables, shared by all operations.
+
+        ``GITHUB_TOKENS`` holds comma or whitespace separated tokens. A GitHub App is configured by
+        ``GITHUB_APP_ID``, ``GITHUB_APP_PRIVATE_KEY`` or ``GITHUB_APP_PRIVATE_KEY_PATH`` and
+        ``GITHUB_APP_INSTALLATION_ID``, comma separated for several installations. Both can be combined.
+        Operations use a configured pool instead of ``GITHUB_TOKEN``, add that token to ``GITHUB_TOKENS``
+        to keep it in use.
+
+        Returns:
+            CredentialPool: The pool, or None when no pool is configured.
+
+        """
+        names = (
+            "GITHUB_TOKENS",
+            "GITHUB_APP_ID",
+            "GITHUB_APP_PRIVATE_KEY",
+            "GITHUB_APP_PRIVATE_KEY_PATH",
+            "GITHUB_APP_INSTALLATION_ID",
+        )
+        config = tuple(os.getenv(name) for name in names)
+        tokens, app_id, private_key, private_key_path, installation_ids = config
+        if not tokens and not app_id:
+            return None
+        with cls._from_env_lock:
+            pool = cls._from_env.get(config)
+            if pool is None:
+                credentials: List[Auth.Auth] = [
+                    Auth.Token(token) for token in re.split(r"[\s,]+", tokens or "") if token
+                ]
+                if app_id:
+                    if private_key is None and private_key_path:
+                        private_key = Path(private_key_path).read_text()
+                    app = Auth.AppAuth(app_id, private_key)
+                    credentials.extend(
+                        app.get_installation_auth(int(installation_id))
+                        for installation_id in re.split(r"[\s,]+", installation_ids or "")
+                        if installation_id
+                    )
+                pool = cls._from_env[config] = cls(credentials)
+        return pool
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the pools created from environment variables."""
+        with cls._from_env_lock:
+            cls._from_env.clear()
+
+    def withRequester(self, requester: Requester) -> "CredentialPool":  # noqa: N802
+        """Provide the requester used by installations to mint their tokens.
+
+        Args:
+            requester: The requester of the GitHub client.
+
+        Returns:
+            CredentialPool: The pool.
+
+        """
+        super().withRequester(requester)
+        for credential in self._credentials:
+            if isinstance(credential, WithRequester):
+                credential.withRequester(requester)
+        return self
+
+    @property
+    def token_type(self) -> str:
+        """Type of the tokens of the pool, as used in the Authorization header."""
+        return "token"
+
+    @property
+    def token(self) -> str:
+        """Token of the credential the next request would use."""
+        return self.select().token
+
+    def select(self) -> Auth.Auth:
+        """Pick the credential with the most budget left and deduct one request from it.
+
+        Returns:
+            The credential.
+
+        """
+        return self._credentials[self._select()]
+
+    def _select(self) -> int:
+        now = time.time()
+        with self._lock:
+            index = max(range(len(self._credentials)), key=lambda i: self._budgets[i].estimate(now))
+            budget = self._budgets[index]
+            if budget.remaining is not None:
+                if now >= budget.reset and budget.limit is not None:
+                    # the window was reset, the next response tells the new reset time
+                    budget.remaining, budget.reset = budget.limit, math.inf
+                budget.remaining = max(budget.remaining - 1, 0)
+        return index
+
+    def authentication(self, headers: dict) -> None:
+        """Add the authorization of the selected credential to request headers.
+
+        Args:
+            headers: The request headers.
+
+        """
+        index = self._select()
+        credential = self._credentials[index]
+        authorization = f"{credential.token_type} {credential.token}"
+        with self._lock:
+            self._authorizations[index] = authorization
+        headers["Authorization"] = authorization
+
+    def record(self, authorization: str, headers: Dict[str, Any]) -> None:
+        """Update the budget of a credential from the rate-limit headers of a response.
+
+        Args:
+            authorization: The Authorization header of the request.
+            headers: The response headers with lower-cased keys.
+
+        """
+        if "x-ratelimit-remaining" not in headers or headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        with self._lock:
+            if authorization not in self._authorizations:
+                return
+            budget = self._budgets[self._authorizations.index(authorization)]
+            budget.remaining = int(float(headers["x-ratelimit-remaining"]))
+            budget.limit = int(float(headers.get("x-ratelimit-limit", budget.limit or 0))) or budget.limit
+            budget.reset = float(headers.get("x-ratelimit-reset", budget.reset))
+
+    def budgets(self) -> List[Optional[int]]:
+        """Return the last known remaining budget of every credential.
+
+        Returns:
+            The budgets, None for credentials without a response yet.
+
+        """
+        with self._lock:
+            return [budget.remaining for budget in self._budgets]
+
+    @property
+    def _masked_token(self) -> str:
+        return "token (pooled token removed)"
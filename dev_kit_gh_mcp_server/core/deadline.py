@@ -0,0 +1,130 @@
+"""Deadlines and cancellation of operation calls, enforced before every HTTP request."""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Coroutine[Any, Any, Any]])
+
+
+class CallCancelledError(Exception):
+    """Raised in place of a request of a call that was cancelled or ran past its deadline."""
+
+
+class Deadline:
+    """Time limit and cancellation flag of an operation call, shared with the thread running it."""
+
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        """Start the deadline.
+
+        Args:
+            seconds: Time allowed for the call, or None for no limit.
+
+        """
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel the call, its next request raises ``CallCancelledError``."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the call was cancelled or its deadline has passed."""
+        return self._cancelled.is_set() or (self.expires_at is not None and time.monotonic() >= self.expires_at)
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left before the deadline.
+
+        Returns:
+            The seconds left, or None without a time limit.
+
+        """
+        return None if self.expires_at is None else max(0.0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        """Stop a call that should not send more requests.
+
+        Raises:
+            CallCancelledError: If the call was cancelled or its deadline has passed.
+
+        """
+        if self.cancelled:
+            raise CallCancelledError("The call was cancelled or ran past its deadline.")
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)
+
+
+def current() -> Optional[Deadline]:
+    """Return the deadline of the call running in the current context.
+
+    Returns:
+        The deadline, or None outside of an operation call.
+
+    """
+    return _current.get()
+
+
+def call_timeout(operation: Any) -> Optional[float]:
+    """Return the time allowed for a call of an operation.
+
+    Args:
+        operation: The operation, its ``call_timeout`` class attribute takes precedence over the
+            ``DEV_KIT_GH_CALL_TIMEOUT`` environment variable.
+
+    Returns:
+        The seconds allowed, or None for no limit.
+
+    """
+    seconds = getattr(operation, "call_timeout", None)
+    if seconds is None:
+        seconds = os.getenv("DEV_KIT_GH_CALL_TIMEOUT") or None
+    return float(seconds) if seconds is not None else None
+
+
+def cancellable(call: F, in_thread: bool) -> F:
+    """Wrap the ``__call__`` of an operation class so its calls can be cancelled and time out.
+
+    Operations that block on PyGithub requests are run in a worker thread with an event loop of
+    their own, so that the server's event loop stays free and a cancelled call returns at once.
+    The call's thread then sends no more requests, each page of a listing is checked against
+    the deadline, and requests in flight time out at the deadline. Async operations are cancelled
+    by their event loop, which closes their connections.
+
+    Args:
+        call: The ``__call__`` coroutine function.
+        in_thread: Whether the call blocks and is run in a worker thread.
+
+    Returns:
+        The wrapper, with the signature and docstring of ``call`` so tools are described the same.
+
+    """
+
+    @functools.wraps(call)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        seconds = call_timeout(self)
+        deadline = Deadline(seconds)
+
+        def run() -> Any:
+            _current.set(deadline)
+            return asyncio.run(call(self, *args, **kwargs))
+
+        async def run_here() -> Any:
+            _current.set(deadline)
+            return await call(self, *args, **kwargs)
+
+        # both run in a copy of the current context, setting the deadline does not leak to the caller
+        work = asyncio.to_thread(run) if in_thread else asyncio.ensure_future(run_here())
+        try:
+            return await asyncio.wait_for(work, seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{type(self).__name__} did not finish within {seconds:g} seconds.") from None
+        finally:
+            deadline.cancel()
+
+    return wrapper  # type: ignore[return-value]
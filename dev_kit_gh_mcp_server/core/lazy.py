@@ -0,0 +1,86 @@
+"""Operations instantiated on their first call, so that unused tools cost no startup time."""
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class LazyOperation:
+    """Stand-in for an operation, registered as a tool without instantiating the operation.
+
+    The tool schema and description are taken from the ``__call__`` of the operation class. The
+    operation, and with it its GitHub client and repository lookup, is created in a worker thread
+    on the first call, and is shared by all following calls.
+    """
+
+    def __init__(self, operation_class: type, **kwargs: Any) -> None:
+        """Prepare the operation.
+
+        Args:
+            operation_class: The operation class.
+            **kwargs: Arguments of the operation class, e.g. ``root_dir``.
+
+        """
+        self.operation_class = operation_class
+        self.name: str = operation_class.name  # type: ignore[attr-defined]
+        self._kwargs: Dict[str, Any] = kwargs
+        self._operation: Optional[Any] = None
+        self._lock = threading.Lock()
+        # the tool factory registers ``op.__call__``, it gets the signature of the operation's call
+        self.__call__ = self._tool_function()  # type: ignore[method-assign]
+
+    @property
+    def docstring(self) -> str:
+        """The docstring of the operation's call."""
+        return self.operation_class.__call__.__doc__ or "No docstring provided"
+
+    @property
+    def created(self) -> bool:
+        """Whether the operation was instantiated."""
+        return self._operation is not None
+
+    @property
+    def operation(self) -> Any:
+        """The operation, instantiated on first access.
+
+        Returns:
+            The operation instance.
+
+        """
+        if self._operation is None:
+            with self._lock:
+                if self._operation is None:
+                    self._operation = self.operation_class(**self._kwargs)
+        return self._operation
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the operation, instantiating it first if needed.
+
+        Args:
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result of the operation.
+
+        """
+        operation = self._operation
+        if operation is None:
+            # the setup of an operation sends blocking requests
+            operation = await asyncio.to_thread(lambda: self.operation)
+        return await operation(*args, **kwargs)
+
+    def _tool_function(self) -> Callable[..., Any]:
+        call = type(self).__call__
+
+        @functools.wraps(self.operation_class.__call__)
+        async def tool(*args: Any, **kwargs: Any) -> Any:
+            return await call(self, *args, **kwargs)
+
+        signature = inspect.signature(self.operation_class.__call__)
+        tool.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=list(signature.parameters.values())[1:]
+        )
+        return tool
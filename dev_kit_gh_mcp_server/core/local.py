@@ -0,0 +1,342 @@
+"""Answer repository listings from a local clone instead of the GitHub API."""
+
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from git import BadName, Commit as GitCommit, Repo
+from github.Commit import Commit
+from github.Repository import Repository
+from github.Tag import Tag
+
+# git status letters, as named by the compare API
+_FILE_STATUSES = {"A": "added", "D": "removed", "M": "modified", "R": "renamed", "C": "copied", "T": "changed"}
+
+
+def _iso(moment: datetime) -> str:
+    # naive values are UTC, as everywhere in the tools
+    moment = moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _text(value: Union[str, bytes]) -> str:
+    # GitPython keeps messages it cannot decode as bytes
+    return value if isinstance(value, str) else value.decode(errors="replace")
+
+
+class LocalCheckout:
+    """Build PyGithub objects from the object database of a clone of the repository.
+
+    Remote-tracking refs mirror GitHub as of the last fetch, so refs are resolved through them
+    rather than through local branches, which may hold unpushed commits. The objects carry their
+    API URLs, attributes git does not know, e.g. a commit's files or GitHub author, are fetched
+    on access like for any incomplete PyGithub object.
+    """
+
+    def __init__(self, repo: Repo, gh_repo: Repository) -> None:
+        """Initialize the checkout.
+
+        Args:
+            repo: The local clone.
+            gh_repo: The GitHub repository the clone tracks, its requester and URL are used for the objects.
+
+        """
+        self._repo = repo
+        self._gh_repo = gh_repo
+        self._remote = repo.remotes[0].name
+
+    def resolve(self, ref: Optional[str] = None) -> Optional[GitCommit]:
+        """Resolve a branch, tag or commit SHA to a local commit.
+
+        Args:
+            ref: Branch or tag name, or commit SHA. None for the default branch of the remote.
+
+        Returns:
+            The commit, or None if the ref was not fetched.
+
+        """
+        if ref is None:
+            candidates = [f"refs/remotes/{self._remote}/HEAD"]
+        else:
+            candidates = [f"refs/remotes/{self._remote}/{ref}", f"refs/tags/{ref}"]
+            if all(char in "0123456789abcdef" for char in ref.lower()):
+                candidates.append(ref)
+        for candidate in candidates:
+            try:
+                return self._repo.commit(candidate)
+            except (BadName, ValueError):
+                continue
+        return None
+
+    def commits(
+        self,
+        rev: GitCommit,
+        max_results: Optional[int] = None,
+        path: Optional[str] = None,
+        author_email: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Commit]:
+        """List the history of a commit, newest first, like the commits API.
+
+        Args:
+            rev: The commit to start from.
+            max_results: Maximum number of commits to return, or None for no limit.
+            path: Only commits touching this path.
+            author_email: Only commits authored with this email, case-insensitively.
+            since: Only commits committed at or after this time.
+            until: Only commits committed at or before this time.
+
+        Returns:
+            The commits, git stops walking the history once enough were found.
+
+        """
+        options: Dict[str, Any] = {}
+        if since is not None:
+            options["since"] = _iso(since)
+        if until is not None:
+            options["until"] = _iso(until)
+        history = self._repo.iter_commits(rev, paths=path or "", **options)
+        if author_email is not None:
+            email = author_email.lower()
+            history = (commit for commit in history if (commit.author.email or "").lower() == email)
+        return [self._commit(commit) for commit in islice(history, max_results)]
+
+    def tags(self, max_results: Optional[int] = None) -> Optional[List[Tag]]:
+        """List the tags, highest version first.
+
+        Git does not record where a tag came from, so tags are only listed locally when every tag
+        points at history of a remote-tracking branch: a tag of an unpushed commit was not pushed.
+
+        Args:
+            max_results: Maximum number of tags to return, or None for no limit.
+
+        Returns:
+            The tags, or None if the clone has no tags, e.g. when cloned with ``--no-tags``, or
+            has a tag outside the fetched history.
+
+        """
+        output = self._repo.git.for_each_ref(
+            "refs/tags",
+            sort="-version:refname",
+            format="%(refname:short)%00%(objectname)%00%(*objectname)",
+        )
+        if not output:
+            return None
+        # a ref is listed if it is merged into any of the remote-tracking branches
+        merged = [f"--merged={ref.path}" for ref in self._repo.remotes[self._remote].refs]
+        if not merged:
+            return None
+        fetched = self._repo.git.for_each_ref("refs/tags", *merged, format="%(refname:short)").splitlines()
+        lines = output.splitlines()
+        if len(fetched) < len(lines):
+            return None
+        tags = []
+        for line in islice(lines, max_results):
+            name, sha, peeled = line.split("\0")
+            tags.append(self._tag(name, peeled or sha))
+        return tags
+
+    def compare(self, base: GitCommit, head: GitCommit, max_commits: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Compare two commits like the compare API, from their merge base to head.
+
+        Args:
+            base: The base commit.
+            head: The head commit.
+            max_commits: Maximum number of commit summaries to return, oldest first, or None for no limit.
+
+        Returns:
+            The comparison, with ``status``, ``ahead_by``, ``behind_by``, ``merge_base``,
+            ``total_commits``, ``commits`` summaries and ``files`` stats, or None if the commits
+            have no common history.
+
+        """
+        merge_bases = self._repo.merge_base(base, head)
+        if not merge_bases:
+            return None
+        merge_base = merge_bases[0]
+        behind_by, ahead_by = map(int, self._repo.git.rev_list(f"{base}...{head}", left_right=True, count=True).split())
+        if ahead_by and behind_by:
+            status = "diverged"
+        else:
+            status = "ahead" if ahead_by else "behind" if behind_by else "identical"
+        history = self._repo.iter_commits(f"{base}..{head}", reverse=True)
+        return {
+            "status": status,
+            "ahead_by": ahead_by,
+            "behind_by": behind_by,
+            "merge_base": merge_base.hexsha,
+            "total_commits": ahead_by,
+            "commits": [
+                {
+                    "sha": commit.hexsha,
+                    "message": _text(commit.summary),
+                    "author": commit.author.name,
+                    "date": _iso(commit.authored_datetime),
+                }
+                for commit in islice(history, max_commits)
+            ],
+            "files": self._diff_stats(merge_base, head),
+        }
+
+    def blob(self, commit: GitCommit, path: str) -> Optional[Tuple[str, bytes]]:
+        """Read a file of a commit.
+
+        Args:
+            commit: The commit.
+            path: Path of the file in the repository.
+
+        Returns:
+            A ``(blob SHA, content)`` tuple, or None if the commit has no file at path.
+
+        """
+        try:
+            blob = commit.tree / path.strip("/")
+        except KeyError:
+            return None
+        if blob.type != "blob":
+            return None
+        return blob.hexsha, blob.data_stream.read()
+
+    def blame(self, commit: GitCommit, path: str) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]]:
+        """Tell the commit that last changed each line of a file of a commit, like the GraphQL blame API.
+
+        Args:
+            commit: The commit.
+            path: Path of the file in the repository.
+
+        Returns:
+            A ``(ranges, commits)`` tuple: the ranges of lines, numbered from 1, with their
+            ``start_line``, ``end_line`` and commit ``sha`` in line order, and the ``message``
+            headline, ``author``, ``email``, ``login`` and ``date`` of those commits by SHA.
+            None if the commit has no file at path.
+
+        """
+        path = path.strip("/")
+        try:
+            blob = commit.tree / path
+        except KeyError:
+            return None
+        if blob.type != "blob":
+            return None
+        ranges: List[Dict[str, Any]] = []
+        commits: Dict[str, Dict[str, Any]] = {}
+        for entry in sorted(self._repo.blame_incremental(commit, path), key=lambda entry: entry.linenos.start):
+            sha = entry.commit.hexsha
+            ranges.append({"start_line": entry.linenos.start, "end_line": entry.linenos.stop - 1, "sha": sha})
+            if sha not in commits:
+                commits[sha] = {
+                    "message": _text(entry.commit.summary),
+                    "author": entry.commit.author.name,
+                    "email": entry.commit.author.email,
+                    # the GitHub account of the author is not known locally
+                    "login": None,
+                    "date": _iso(entry.commit.authored_datetime),
+                }
+        return ranges, commits
+
+    def tree(
+        self,
+        commit: GitCommit,
+        path: str = "",
+        descend: Optional[Callable[[str], bool]] = None,
+    ) -> Optional[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """List a directory of a commit recursively, like the git trees API.
+
+        Args:
+            commit: The commit.
+            path: Path of the directory in the repository, the root by default.
+            descend: Optional predicate telling whether the content of a directory path is listed.
+
+        Returns:
+            A ``(tree SHA, entries)`` tuple, entries have a repository ``path``, a ``type`` and the
+            ``size`` of blobs. None if the commit has no directory at path.
+
+        """
+        tree: Any = commit.tree
+        if path:
+            try:
+                tree = tree / path
+            except KeyError:
+                return None
+        if tree.type != "tree":
+            return None
+        items = tree.traverse(
+            prune=lambda item, _: item.type == "tree" and descend is not None and not descend(item.path)
+        )
+        entries = (
+            {
+                "path": item.path,
+                # submodules are commits in the API
+                "type": "commit" if item.type == "submodule" else item.type,
+                "size": item.size if item.type == "blob" else None,
+            }
+            for item in items
+        )
+        return tree.hexsha, entries
+
+    def _diff_stats(self, base: GitCommit, head: GitCommit) -> List[Dict[str, Any]]:
+        # both listings are in the same order, renamed and copied files span two paths
+        statuses = iter(self._repo.git.diff(base, head, name_status=True, find_renames=True, z=True).split("\0"))
+        numstats = iter(self._repo.git.diff(base, head, numstat=True, find_renames=True, z=True).split("\0"))
+        files = []
+        for code in statuses:
+            if not code:
+                break
+            additions, deletions, filename = next(numstats).split("\t")
+            previous = None
+            if code[0] in "RC":
+                previous, filename = next(statuses), next(statuses)
+                next(numstats), next(numstats)
+            else:
+                filename = next(statuses)
+            # binary files have no line counts
+            added, deleted = int(additions.replace("-", "0")), int(deletions.replace("-", "0"))
+            stats = {
+                "filename": filename,
+                "status": _FILE_STATUSES.get(code[0], "modified"),
+                "additions": added,
+                "deletions": deleted,
+                "changes": added + deleted,
+            }
+            if previous is not None:
+                stats["previous_filename"] = previous
+            files.append(stats)
+        return files
+
+    def _commit(self, commit: GitCommit) -> Commit:
+        url = f"{self._gh_repo.url}/commits/{commit.hexsha}"
+        attributes = {
+            "sha": commit.hexsha,
+            "url": url,
+            "commit": {
+                "url": f"{self._gh_repo.url}/git/commits/{commit.hexsha}",
+                "sha": commit.hexsha,
+                "message": _text(commit.message).rstrip("\n"),
+                "author": {
+                    "name": commit.author.name,
+                    "email": commit.author.email,
+                    "date": _iso(commit.authored_datetime),
+                },
+                "committer": {
+                    "name": commit.committer.name,
+                    "email": commit.committer.email,
+                    "date": _iso(commit.committed_datetime),
+                },
+                "tree": {"sha": commit.tree.hexsha},
+            },
+            "parents": [
+                {"sha": parent.hexsha, "url": f"{self._gh_repo.url}/commits/{parent.hexsha}"}
+                for parent in commit.parents
+            ],
+        }
+        return Commit(self._gh_repo._requester, {}, attributes, completed=False)
+
+    def _tag(self, name: str, sha: str) -> Tag:
+        attributes = {
+            "name": name,
+            "commit": {"sha": sha, "url": f"{self._gh_repo.url}/commits/{sha}"},
+            "zipball_url": f"{self._gh_repo.url}/zipball/refs/tags/{name}",
+            "tarball_url": f"{self._gh_repo.url}/tarball/refs/tags/{name}",
+        }
+        return Tag(self._gh_repo._requester, {}, attributes)
@@ -0,0 +1,151 @@
+"""Repository metadata index used to validate and resolve tool arguments locally."""
+
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Union
+
+from github.Label import Label
+from github.Milestone import Milestone
+from github.NamedUser import NamedUser
+from github.Repository import Repository
+
+from dev_kit_gh_mcp_server.core.conditional import ConditionalGet
+
+
+class RepoMetadataIndex:
+    """Labels, milestones, assignable users and default branch of a repository.
+
+    The index is loaded once per repository and shared by all operations. After ``max_age``
+    seconds, or when a name cannot be resolved, it is revalidated with conditional requests,
+    so an unchanged repository costs no rate limit.
+    """
+
+    _indexes: ClassVar[Dict[str, "RepoMetadataIndex"]] = {}
+    _indexes_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, repo: Repository, max_age: float = 300.0) -> None:
+        """Initialize an empty index, loaded on first use.
+
+        Args:
+            repo: The repository to index.
+            max_age: Seconds after which the index is revalidated.
+
+        """
+        self._repo = repo
+        self._get = ConditionalGet(repo._requester)
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self.max_age = max_age
+        self.default_branch = ""
+        self.labels: Dict[str, Label] = {}
+        self.milestones: Dict[str, Milestone] = {}
+        self.assignees: Dict[str, NamedUser] = {}
+
+    @classmethod
+    def for_repo(cls, repo: Repository) -> "RepoMetadataIndex":
+        """Return the shared index of a repository.
+
+        Args:
+            repo: The repository to index.
+
+        Returns:
+            The index, created on first request.
+
+        """
+        with cls._indexes_lock:
+            index = cls._indexes.get(repo.url)
+            if index is None:
+                index = cls._indexes[repo.url] = cls(repo)
+            return index
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all shared indexes."""
+        with cls._indexes_lock:
+            cls._indexes.clear()
+
+    def refresh(self, force: bool = False) -> "RepoMetadataIndex":
+        """Load the index, or revalidate it if it is older than ``max_age``.
+
+        Args:
+            force: Revalidate even if the index is still fresh.
+
+        Returns:
+            The index itself.
+
+        """
+        with self._lock:
+            fresh = self._loaded_at is not None and time.monotonic() - self._loaded_at < self.max_age
+            if fresh and not force:
+                return self
+            requester = self._repo._requester
+            url = self._repo.url
+            _, _, repo_data = self._get(url)
+            self.default_branch = repo_data["default_branch"]
+            self.labels = {
+                raw["name"].lower(): Label(requester, {}, raw, completed=True) for raw in self._items(f"{url}/labels")
+            }
+            self.milestones = {}
+            for raw in self._items(f"{url}/milestones", state="all"):
+                milestone = Milestone(requester, {}, raw, completed=True)
+                self.milestones[str(raw["number"])] = milestone
+                self.milestones.setdefault(raw["title"].lower(), milestone)
+            self.assignees = {
+                raw["login"].lower(): NamedUser(requester, {}, raw, completed=False)
+                for raw in self._items(f"{url}/assignees")
+            }
+            self._loaded_at = time.monotonic()
+            return self
+
+    def _items(self, url: str, **parameters: str) -> Iterable[dict]:
+        for page in self._get.pages(url, {"per_page": 100, **parameters}):
+            yield from page or []
+
+    def _lookup(self, kind: str, names: Iterable[str], display: Callable[[Any], str]) -> list:
+        names = list(names)
+        table = getattr(self.refresh(), kind)
+        if any(name.lower() not in table for name in names):
+            table = getattr(self.refresh(force=True), kind)
+        missing = [name for name in names if name.lower() not in table]
+        if missing:
+            available = ", ".join(sorted({display(value) for value in table.values()})) or "none"
+            raise ValueError(f"Unknown {kind}: {', '.join(missing)}. Available {kind}: {available}")
+        return [table[name.lower()] for name in names]
+
+    def resolve_labels(self, names: Iterable[str]) -> List[str]:
+        """Validate label names and return them with the repository's spelling.
+
+        Args:
+            names: Label names, matched case-insensitively.
+
+        Returns:
+            The label names as defined in the repository.
+
+        """
+        return [label.name for label in self._lookup("labels", names, lambda label: label.name)]
+
+    def resolve_assignees(self, logins: Iterable[str]) -> List[str]:
+        """Validate that users can be assigned to issues in the repository.
+
+        Args:
+            logins: User logins, matched case-insensitively.
+
+        Returns:
+            The logins as spelled by GitHub.
+
+        """
+        return [user.login for user in self._lookup("assignees", logins, lambda user: user.login)]
+
+    def resolve_milestone(self, milestone: str) -> Union[Milestone, str]:
+        """Resolve a milestone given by title or number.
+
+        Args:
+            milestone: Milestone title or number, or the wildcards "none" and "*".
+
+        Returns:
+            The milestone object, or the wildcard unchanged.
+
+        """
+        if milestone in ("none", "*"):
+            return milestone
+        return self._lookup("milestones", [milestone], lambda milestone: milestone.title)[0]
@@ -0,0 +1,191 @@
+"""Opt-in profiling of slow operation calls."""
+
+import asyncio
+import contextvars
+import cProfile
+import functools
+import json
+import os
+import random
+import re
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar
+
+from dev_kit_gh_mcp_server.core import transport
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# HTTP requests of the profiled call running in the current context
+_requests: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "profiled_requests", default=None
+)
+
+
+def record_request(method: str, url: str, status: int, elapsed: float) -> None:
+    """Add a request to the list of the profiled call running in the current context, if any.
+
+    Args:
+        method: The HTTP method.
+        url: The URL, without credentials.
+        status: The response status.
+        elapsed: Seconds from sending the request to receiving the response headers.
+
+    """
+    requests = _requests.get()
+    if requests is not None:
+        requests.append({"method": method, "url": url, "status": status, "seconds": round(elapsed, 4)})
+
+
+def _record_middleware(request: transport.Request, send: transport.Handler) -> Any:
+    if _requests.get() is None:
+        return send(request)
+    start = time.perf_counter()
+    response = send(request)
+    record_request(request.method, request.url, response.status, time.perf_counter() - start)
+    return response
+
+
+@dataclass(frozen=True)
+class CallProfiler:
+    """Profile a sample of operation calls and keep a report of those slower than a threshold.
+
+    A sampled call runs under ``cProfile`` and ``tracemalloc`` and records the HTTP requests it
+    sends. When it takes longer than ``threshold`` seconds, a directory named after the time and
+    the operation is written with ``profile.pstats`` (open it with ``pstats`` or snakeviz),
+    ``allocations.txt`` (the lines that allocated the most memory during the call) and
+    ``call.json`` (arguments, duration and requests). Calls that are not sampled only cost a
+    clock reading, and a single call is profiled at a time since profilers cannot be nested.
+
+    Blocking operations run in a worker thread and their profile only holds the call. Async
+    operations share the server's event loop, so the profile also holds the other tasks that ran
+    while the call awaited; ``other_tasks`` in ``call.json`` counts those alive when it started.
+    """
+
+    directory: Path
+    threshold: float = 5.0
+    sample_rate: float = 0.05
+    top_allocations: int = 25
+
+    _from_env: ClassVar[Dict[Tuple[Optional[str], ...], "CallProfiler"]] = {}
+    _active: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["CallProfiler"]:
+        """Return the profiler configured by environment variables.
+
+        ``DEV_KIT_GH_PROFILE_DIR`` enables profiling and sets the report directory,
+        ``DEV_KIT_GH_PROFILE_THRESHOLD`` the duration in seconds above which a report is kept
+        (default 5) and ``DEV_KIT_GH_PROFILE_SAMPLE_RATE`` the fraction of calls profiled (default 0.05).
+
+        Returns:
+            CallProfiler: The profiler, or None when profiling is not enabled.
+
+        """
+        config = tuple(
+            os.getenv(name)
+            for name in ("DEV_KIT_GH_PROFILE_DIR", "DEV_KIT_GH_PROFILE_THRESHOLD", "DEV_KIT_GH_PROFILE_SAMPLE_RATE")
+        )
+        directory, threshold, sample_rate = config
+        if not directory:
+            return None
+        profiler = cls._from_env.get(config)
+        if profiler is None:
+            profiler = cls._from_env.setdefault(
+                config,
+                cls(Path(directory), float(threshold or cls.threshold), float(sample_rate or cls.sample_rate)),
+            )
+        return profiler
+
+    async def profile(self, name: str, call: Callable[[], Awaitable[Any]], arguments: Dict[str, Any]) -> Any:
+        """Await a call, profiling it if it is sampled.
+
+        Args:
+            name: Name of the operation.
+            call: The call to await.
+            arguments: Arguments of the call, written to the report.
+
+        Returns:
+            The result of the call.
+
+        """
+        if random.random() >= self.sample_rate or not self._active.acquire(blocking=False):
+            return await call()
+        requests: List[Dict[str, Any]] = []
+        token = _requests.set(requests)
+        tracing = tracemalloc.is_tracing()
+        profile = cProfile.Profile()
+        try:
+            transport.add_middleware(_record_middleware)
+            if not tracing:
+                tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            # cProfile records the whole thread, including the tasks that run while the call awaits
+            other_tasks = len(asyncio.all_tasks()) - 1
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                return await call()
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                if elapsed > self.threshold:
+                    after = tracemalloc.take_snapshot()
+                    allocations = after.compare_to(before, "lineno")[: self.top_allocations]
+                    self._write(name, elapsed, arguments, profile, allocations, requests, other_tasks)
+        finally:
+            _requests.reset(token)
+            if not tracing:
+                tracemalloc.stop()
+            self._active.release()
+
+    def _write(
+        self,
+        name: str,
+        elapsed: float,
+        arguments: Dict[str, Any],
+        profile: cProfile.Profile,
+        allocations: List[tracemalloc.StatisticDiff],
+        requests: List[Dict[str, Any]],
+        other_tasks: int,
+    ) -> Path:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+        report = self.directory / f"{stamp}-{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}-{os.getpid()}"
+        report.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(report / "profile.pstats")
+        (report / "allocations.txt").write_text("".join(f"{statistic}\n" for statistic in allocations))
+        call = {
+            "operation": name,
+            "seconds": round(elapsed, 4),
+            "arguments": arguments,
+            "requests": requests,
+            "other_tasks": other_tasks,
+        }
+        (report / "call.json").write_text(json.dumps(call, indent=2, default=repr))
+        return report
+
+
+def profiled(call: F) -> F:
+    """Wrap the ``__call__`` of an operation class with the profiler configured by the environment.
+
+    Args:
+        call: The ``__call__`` coroutine function.
+
+    Returns:
+        The wrapper, with the signature and docstring of ``call`` so tools are described the same.
+
+    """
+
+    @functools.wraps(call)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        profiler = CallProfiler.from_env()
+        if profiler is None:
+            return await call(self, *args, **kwargs)
+        arguments = {**{str(position): value for position, value in enumerate(args)}, **kwargs}
+        return await profiler.profile(type(self).__name__, lambda: call(self, *args, **kwargs), arguments)
+
+    return wrapper  # type: ignore[return-value]
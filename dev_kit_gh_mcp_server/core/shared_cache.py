@@ -0,0 +1,324 @@
+"""Response cache and rate-limit budget shared by the worker processes of a server."""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
+from github.GithubException import RateLimitExceededException
+
+from dev_kit_gh_mcp_server.core import transport
+from dev_kit_gh_mcp_server.core.transport import Handler, Request, Response
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body TEXT NOT NULL,
+    stored REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_stored ON responses (stored);
+CREATE TABLE IF NOT EXISTS budgets (
+    credential TEXT PRIMARY KEY,
+    remaining INTEGER NOT NULL,
+    reset REAL NOT NULL
+);
+"""
+
+
+def _hashed(authorization: str) -> str:
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+# media types GitHub answers with its default JSON representation
+_DEFAULT_MEDIA_TYPES = frozenset({
+    "",
+    "*/*",
+    "application/json",
+    "application/vnd.github+json",
+    "application/vnd.github.v3+json",
+})
+_DEFAULT_PORTS = {"https": 443, "http": 80}
+
+# headers describing the encoding of a body received from GitHub, not of the decoded body served from the cache
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class SharedCache:
+    """Transport middleware revalidating GET responses and spending a rate-limit budget shared through SQLite.
+
+    Every worker process of a server opens the same database. A response with an ``ETag`` is
+    stored once for all workers and revalidated with ``If-None-Match``, GitHub answers an
+    unchanged resource with a ``304`` that does not count against the rate limit. The remaining
+    budget of every credential is shared too, once it is spent no worker sends requests with
+    that credential until the reset time, so that the workers together respect a single quota.
+
+    Revalidation always reaches GitHub with the token of the request, a response is never served
+    to a token that has no access to the resource. Tokens themselves are only stored hashed.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 10_000, reserve: int = 0) -> None:
+        """Open, or create, the database.
+
+        Args:
+            path: Path of the database file, created readable by the current user only.
+            max_entries: Number of responses kept, the least recently stored are evicted.
+            reserve: Requests of each credential's budget kept for other clients of the same tokens.
+
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.reserve = reserve
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.path.touch(mode=0o600, exist_ok=True)
+        with self._connection() as db:
+            db.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # connections cannot be shared between threads
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    @staticmethod
+    def _credential(request: Request) -> str:
+        return _hashed(request.headers.get("Authorization", ""))
+
+    def __call__(self, request: Request, send: Handler) -> Any:
+        """Send a request through the cache.
+
+        Args:
+            request: The request.
+            send: The next handler.
+
+        Returns:
+            The response, the stored one when GitHub reports it unchanged.
+
+        """
+        credential = self._credential(request)
+        self.spend(credential)
+        cached = None
+        key = self.key(request.headers.get("Accept", ""), request.url)
+        if request.method == "GET" and "If-None-Match" not in request.headers:
+            cached = self._lookup(key)
+            if cached is not None:
+                request.headers["If-None-Match"] = cached[0]
+        response = send(request)
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        self.record(credential, headers)
+        if cached is not None:
+            del request.headers["If-None-Match"]
+            if response.status == 304:
+                return Response(200, {**cached[1], **dict(response.getheaders())}, cached[2])
+        if request.method == "GET" and response.status == 200 and headers.get("etag"):
+            if str(headers.get("content-type", "")).startswith("application/json"):
+                self._store(key, headers["etag"], dict(response.getheaders()), response.read())
+        return response
+
+    def _lookup(self, key: str) -> Optional[tuple]:
+        row = self._connection().execute("SELECT etag, headers, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+
+    def _store(self, key: str, etag: str, headers: Dict[str, str], body: str) -> None:
+        db = self._connection()
+        db.execute(
+            "INSERT OR REPLACE INTO responses (key, etag, headers, body, stored) VALUES (?, ?, ?, ?, ?)",
+            (key, etag, json.dumps(headers), body, time.time()),
+        )
+        db.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY stored DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def spend(self, credential: str) -> None:
+        """Deduct a request from the shared budget of a credential.
+
+        Args:
+            credential: The hashed credential.
+
+        Raises:
+            RateLimitExceededException: If the budget is spent until its reset time.
+
+        """
+        db = self._connection()
+        now = time.time()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            row = db.execute("SELECT remaining, reset FROM budgets WHERE credential = ?", (credential,)).fetchone()
+            if row is not None and now < row[1]:
+                if row[0] <= self.reserve:
+                    reset = time.strftime("%H:%M:%S", time.localtime(row[1]))
+                    raise RateLimitExceededException(
+                        403,
+                        {"message": f"The shared rate-limit budget is spent until {reset}."},
+                        {"x-ratelimit-remaining": str(row[0]), "x-ratelimit-reset": str(int(row[1]))},
+                    )
+                db.execute("UPDATE budgets SET remaining = remaining - 1 WHERE credential = ?", (credential,))
+        finally:
+            db.execute("COMMIT")
+
+    def record(self, credential: str, headers: Dict[str, Any]) -> None:
+        """Update the shared budget of a credential from the rate-limit headers of a response.
+
+        Args:
+            credential: The hashed credential.
+            headers: The response headers with lower-cased keys.
+
+        """
+        if "x-ratelimit-remaining" not in headers or headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        self._connection().execute(
+            "INSERT OR REPLACE INTO budgets (credential, remaining, reset) VALUES (?, ?, ?)",
+            (
+                credential,
+                int(float(headers["x-ratelimit-remaining"])),
+                float(headers.get("x-ratelimit-reset", time.time() + 3600)),
+            ),
+        )
+
+    @staticmethod
+    def key(accept: str, url: str) -> str:
+        """Return the key a GET request is stored under.
+
+        PyGithub and httpx spell the same request differently, PyGithub with the default port in
+        the URL and without an ``Accept`` header, so both are normalized for them to share responses.
+
+        Args:
+            accept: The ``Accept`` header of the request.
+            url: The absolute URL of the request.
+
+        Returns:
+            The media type, unless it is GitHub's default, and the URL, separated by a space.
+
+        """
+        parts = urlsplit(url)
+        if parts.port is not None and parts.port == _DEFAULT_PORTS.get(parts.scheme):
+            parts = parts._replace(netloc=parts.netloc.rsplit(":", 1)[0])
+        media_type = "" if accept.strip().lower() in _DEFAULT_MEDIA_TYPES else accept
+        return f"{media_type} {parts.geturl()}"
+
+    def lookup(self, key: str) -> Optional[tuple]:
+        """Return the stored response of a GET request.
+
+        Args:
+            key: The key of the request, see ``key``.
+
+        Returns:
+            The ``(etag, headers, body)`` tuple, or None.
+
+        """
+        return self._lookup(key)
+
+    def store(self, key: str, etag: str, headers: Dict[str, str], body: str) -> None:
+        """Store the response of a GET request, to be revalidated with its ETag.
+
+        Args:
+            key: The key of the request, see ``key``.
+            etag: The ``ETag`` of the response.
+            headers: The response headers.
+            body: The decoded JSON body.
+
+        """
+        self._store(key, etag, headers, body)
+
+    @staticmethod
+    def installed() -> Optional["SharedCache"]:
+        """Return the cache installed as PyGithub middleware, for the asyncio clients to use it too.
+
+        Returns:
+            The cache, or None.
+
+        """
+        return next((middleware for middleware in transport.middlewares() if isinstance(middleware, SharedCache)), None)
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return the default database path, in the user's cache directory.
+
+        Returns:
+            The path.
+
+        """
+        cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(cache_home) / "dev-kit-gh-mcp-server" / "shared.sqlite"
+
+
+class SharedCacheTransport(httpx.AsyncBaseTransport):
+    """httpx transport sending its requests through a ``SharedCache``, like PyGithub's.
+
+    The budget of the credential of every request is spent and updated, and JSON responses to
+    GET requests are stored and revalidated, in the same database as the PyGithub requests of
+    all the workers. The database is used from worker threads, off the event loop.
+    """
+
+    def __init__(self, cache: SharedCache, transport: httpx.AsyncBaseTransport) -> None:
+        """Wrap a transport.
+
+        Args:
+            cache: The shared cache.
+            transport: The transport sending the requests.
+
+        """
+        self._cache = cache
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the cache.
+
+        Args:
+            request: The request.
+
+        Returns:
+            httpx.Response: The response, the stored one when GitHub reports it unchanged.
+
+        """
+        credential = _hashed(request.headers.get("Authorization", ""))
+        await asyncio.to_thread(self._cache.spend, credential)
+        cached = None
+        key = SharedCache.key(request.headers.get("Accept", ""), str(request.url))
+        if request.method == "GET" and "If-None-Match" not in request.headers:
+            cached = await asyncio.to_thread(self._cache.lookup, key)
+            if cached is not None:
+                request.headers["If-None-Match"] = cached[0]
+        response = await self._transport.handle_async_request(request)
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        await asyncio.to_thread(self._cache.record, credential, headers)
+        if cached is not None:
+            del request.headers["If-None-Match"]
+            if response.status_code == 304:
+                await response.aclose()
+                # the response may have been stored by PyGithub, with the encoding headers of its body
+                merged = {**_decoded_headers(cached[1]), **_decoded_headers(response.headers)}
+                return httpx.Response(200, headers=merged, content=cached[2].encode(), request=request)
+        storable = request.method == "GET" and response.status_code == 200 and headers.get("etag")
+        if not storable or not str(headers.get("content-type", "")).startswith("application/json"):
+            # other responses, e.g. archives, are streamed as they are
+            return response
+        # the body is decompressed, its encoding headers are dropped
+        decoded = httpx.Response(response.status_code, headers=response.headers, stream=response.stream)
+        content = await decoded.aread()
+        kept = _decoded_headers(response.headers)
+        await asyncio.to_thread(self._cache.store, key, headers["etag"], kept, content.decode(errors="replace"))
+        return httpx.Response(response.status_code, headers=kept, content=content, request=request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+def _decoded_headers(headers: Union[httpx.Headers, Dict[str, str]]) -> Dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in _ENCODING_HEADERS}
@@ -0,0 +1,160 @@
+"""Snapshots of listings, so that a call returns only what changed since the caller's previous one."""
+
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, ClassVar, Dict, Hashable, Iterable, List, Optional
+
+
+def fingerprint(item: Any) -> int:
+    """Return a compact fingerprint of the version of an item.
+
+    Args:
+        item: An issue, pull request or comment, with ``updated_at`` and, optionally, ``state``.
+
+    Returns:
+        A 64-bit integer that changes when the item is updated or changes state.
+
+    """
+    updated_at = getattr(item, "updated_at", None)
+    version = f"{updated_at.isoformat() if updated_at else ''} {getattr(item, 'state', '')}"
+    return int.from_bytes(hashlib.blake2b(version.encode(), digest_size=8).digest(), "big")
+
+
+@dataclass
+class Snapshot:
+    """The fingerprints of the items a caller has seen, by item id, and when they were listed."""
+
+    scope: Hashable
+    taken_at: datetime
+    fingerprints: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def since(self) -> datetime:
+        """Lower bound of the update times of the items changed since the snapshot."""
+        # the clocks of GitHub and of the server differ, unchanged items listed twice are skipped by fingerprint
+        return self.taken_at - Snapshots.clock_skew
+
+
+class Snapshots:
+    """Snapshots of the listings returned in delta mode, by token, kept in memory.
+
+    A snapshot holds an 8-byte fingerprint per item, a listing of a thousand issues takes a few
+    dozen kilobytes. The least recently used snapshots are dropped past ``max_entries``.
+    """
+
+    max_entries: ClassVar[int] = 1024
+    clock_skew: ClassVar[timedelta] = timedelta(minutes=5)
+
+    _snapshots: ClassVar["OrderedDict[str, Snapshot]"] = OrderedDict()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def put(cls, snapshot: Snapshot) -> str:
+        """Store a snapshot.
+
+        Args:
+            snapshot: The snapshot.
+
+        Returns:
+            The token the caller passes back to list what changed since.
+
+        """
+        token = secrets.token_urlsafe(12)
+        with cls._lock:
+            cls._snapshots[token] = snapshot
+            while len(cls._snapshots) > cls.max_entries:
+                cls._snapshots.popitem(last=False)
+        return token
+
+    @classmethod
+    def get(cls, token: str, scope: Hashable) -> Snapshot:
+        """Return the snapshot of a token.
+
+        Args:
+            token: The token returned with the snapshot.
+            scope: The operation and filters of the call, they must be those of the snapshot.
+
+        Returns:
+            Snapshot: The snapshot.
+
+        Raises:
+            ValueError: If the token is unknown, expired, or was returned by another call.
+
+        """
+        with cls._lock:
+            snapshot = cls._snapshots.get(token)
+            if snapshot is not None:
+                cls._snapshots.move_to_end(token)
+        if snapshot is None:
+            raise ValueError(f"Unknown or expired snapshot {token!r}, call without since_snapshot for a new one.")
+        if snapshot.scope != scope:
+            raise ValueError(f"Snapshot {token!r} was returned by a call with other filters.")
+        return snapshot
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all snapshots."""
+        with cls._lock:
+            cls._snapshots.clear()
+
+
+def baseline(items: List[Any], scope: Hashable, taken_at: datetime, key: Callable[[Any], int]) -> Dict[str, Any]:
+    """Return the full listing of a first call in delta mode, with the token of its snapshot.
+
+    Args:
+        items: The items returned.
+        scope: The operation and filters of the call.
+        taken_at: When the listing started.
+        key: Function returning the id of an item.
+
+    Returns:
+        ``{"snapshot": token, "items": items}``.
+
+    """
+    snapshot = Snapshot(scope, taken_at, {key(item): fingerprint(item) for item in items})
+    return {"snapshot": Snapshots.put(snapshot), "items": items}
+
+
+def changes(
+    items: Iterable[Any],
+    snapshot: Snapshot,
+    taken_at: datetime,
+    key: Callable[[Any], int],
+    matches: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Any]:
+    """Compare the items updated since a snapshot to it, and return what changed with a new snapshot.
+
+    Args:
+        items: The items updated since ``snapshot.since``, matching or not the filters of the call.
+        snapshot: The caller's snapshot.
+        taken_at: When the listing started.
+        key: Function returning the id of an item.
+        matches: Predicate telling whether an item still matches the filters of the call, e.g.
+            its state. Items that stopped matching are reported as closed.
+
+    Returns:
+        ``{"snapshot": token, "added": [...], "updated": [...], "closed": [ids]}``.
+
+    """
+    fingerprints = dict(snapshot.fingerprints)
+    added: List[Any] = []
+    updated: List[Any] = []
+    closed: List[int] = []
+    for item in items:
+        item_id, known = key(item), fingerprints.get(key(item))
+        if matches is not None and not matches(item):
+            if known is not None:
+                closed.append(item_id)
+                del fingerprints[item_id]
+            continue
+        version = fingerprint(item)
+        if known == version:
+            continue
+        (added if known is None else updated).append(item)
+        fingerprints[item_id] = version
+    token = Snapshots.put(Snapshot(snapshot.scope, taken_at, fingerprints))
+    return {"snapshot": token, "added": added, "updated": updated, "closed": closed}
@@ -0,0 +1,295 @@
+"""Last results of read operations, served while GitHub is failing."""
+
+import asyncio
+import functools
+import inspect
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, ClassVar, Coroutine, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from dev_kit_gh_mcp_server.core.circuit import is_outage
+
+F = TypeVar("F", bound=Callable[..., Coroutine[Any, Any, Any]])
+
+
+class StaleResults:
+    """The last result of each read operation call, by operation, repository and arguments.
+
+    Results prefetched ahead of the calls are stored fresh for a while, the first call then
+    returns them as they are. Writes patch the results they change, see ``patch``.
+    """
+
+    max_entries: ClassVar[int] = 512
+
+    # (time stored, result, time until which the result is served without calling the operation)
+    _results: ClassVar["OrderedDict[Hashable, Tuple[float, Any, float]]"] = OrderedDict()
+    # arguments of the calls, by name, for the writes to tell which results they change
+    _arguments: ClassVar[Dict[Hashable, Dict[str, Any]]] = {}
+    _fresh: ClassVar[int] = 0
+    # refreshes still running after a call returned its last result, shared by the calls awaiting them
+    _refreshes: ClassVar[Dict[Hashable, "asyncio.Future[Any]"]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Return the last result of a call.
+
+        Args:
+            key: The call key.
+
+        Returns:
+            The ``(time, result)`` tuple, or None.
+
+        """
+        with cls._lock:
+            entry = cls._results.get(key)
+        return entry[:2] if entry is not None else None
+
+    @classmethod
+    def put(
+        cls, key: Hashable, result: Any, fresh_for: float = 0.0, arguments: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Store the result of a call.
+
+        Args:
+            key: The call key.
+            result: The result.
+            fresh_for: Seconds during which the next call returns the result without calling the operation.
+            arguments: The arguments of the call, see ``call_arguments``, kept from the last result if None.
+
+        """
+        now = time.time()
+        with cls._lock:
+            cls._results[key] = (now, result, now + fresh_for)
+            cls._results.move_to_end(key)
+            if arguments is not None:
+                cls._arguments[key] = arguments
+            while len(cls._results) > cls.max_entries:
+                evicted, _ = cls._results.popitem(last=False)
+                cls._arguments.pop(evicted, None)
+            if fresh_for > 0:
+                cls._fresh += 1
+
+    @classmethod
+    def patch(cls, scope: Tuple[Any, ...], patch: Callable[[Dict[str, Any], Any], Any], fresh_for: float = 0.0) -> int:
+        """Patch the results of an operation on a repository with the result of a write.
+
+        The patched results are served fresh, once, if they were stored at most ``fresh_for``
+        seconds ago, so that a read following the write returns it without a request, even when
+        GitHub does not list it yet.
+
+        Args:
+            scope: Name of the operation class, API URL and repository URL, the start of the call keys.
+            patch: Function of the arguments and result of a call, returning the patched result, the
+                result itself when the write does not change it, or None to drop a result it cannot patch.
+            fresh_for: Seconds during which the next call returns a patched result without calling the operation.
+
+        Returns:
+            The number of results patched or dropped.
+
+        """
+        with cls._lock:
+            stored = [(key, entry) for key, entry in cls._results.items() if key[:3] == scope]  # type: ignore[index]
+            arguments = {key: cls._arguments.get(key) for key, _ in stored}
+        # patches read attributes of PyGithub objects, which may send requests, outside of the lock
+        patched = {key: None if arguments[key] is None else patch(arguments[key], entry[1]) for key, entry in stored}
+        now, changed = time.time(), 0
+        with cls._lock:
+            for key, entry in stored:
+                if patched[key] is entry[1] or cls._results.get(key) is not entry:
+                    continue
+                changed += 1
+                if patched[key] is None:
+                    del cls._results[key]
+                    cls._arguments.pop(key, None)
+                    if entry[2] > entry[0]:
+                        cls._fresh = max(0, cls._fresh - 1)
+                    continue
+                stored_at, _, fresh_until = entry
+                if now - stored_at <= fresh_for:
+                    if fresh_until <= stored_at:
+                        cls._fresh += 1
+                    fresh_until = max(fresh_until, now + fresh_for)
+                cls._results[key] = (stored_at, patched[key], fresh_until)
+        return changed
+
+    @classmethod
+    def take_fresh(cls, key: Hashable) -> Tuple[bool, Any]:
+        """Return a fresh result once, the calls after it are sent to GitHub again.
+
+        Args:
+            key: The call key.
+
+        Returns:
+            A ``(found, result)`` tuple.
+
+        """
+        with cls._lock:
+            entry = cls._results.get(key)
+            if entry is None or entry[2] <= entry[0]:
+                return False, None
+            cls._results[key] = (entry[0], entry[1], entry[0])
+            cls._fresh = max(0, cls._fresh - 1)
+            return entry[2] > time.time(), entry[1]
+
+    @classmethod
+    def has_fresh(cls) -> bool:
+        """Whether results may be fresh, so that calls look them up.
+
+        Returns:
+            True until every fresh result was taken.
+
+        """
+        return cls._fresh > 0
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all results."""
+        with cls._lock:
+            cls._results.clear()
+            cls._arguments.clear()
+            cls._refreshes.clear()
+            cls._fresh = 0
+
+
+_signatures: Dict[type, inspect.Signature] = {}
+
+
+def _signature(operation_class: type) -> inspect.Signature:
+    signature = _signatures.get(operation_class)
+    if signature is None:
+        signature = _signatures[operation_class] = inspect.signature(operation_class.__call__)
+    return signature
+
+
+def call_arguments(operation: Any, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Return the arguments of an operation call by name, with the defaults of those left out.
+
+    Args:
+        operation: The operation.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        The arguments, by parameter name.
+
+    """
+    bound = _signature(type(operation)).bind(operation, *args, **kwargs)
+    bound.apply_defaults()
+    return {name: value for name, value in bound.arguments.items() if name != "self"}
+
+
+def call_key(operation: Any, *args: Any, **kwargs: Any) -> Hashable:
+    """Return the key of an operation call, the same whether arguments are passed by position, by name or left out.
+
+    Args:
+        operation: The operation.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        The key, naming the operation, its API URL and repository, and the arguments.
+
+    """
+    arguments = repr(sorted(call_arguments(operation, *args, **kwargs).items()))
+    return (type(operation).__name__, operation.base_url, operation._gh_repo.url, arguments)
+
+
+def with_new_item(items: List[Any], item: Any, newest_first: bool, max_results: Optional[int] = None) -> List[Any]:
+    """Return a listing with an item just created, e.g. by a write patching the stored results.
+
+    Args:
+        items: The listing, by creation or update time.
+        item: The new item, created and updated after all the items listed.
+        newest_first: Whether the listing is newest first.
+        max_results: The length at which the listing was cut, if any.
+
+    Returns:
+        A new listing, with the item first if newest first, else last unless the listing was cut.
+
+    """
+    if newest_first:
+        return [item, *items][:max_results]
+    return [*items, item] if max_results is None or len(items) < max_results else items
+
+
+def serve_stale(call: F) -> F:
+    """Wrap the ``__call__`` of a read operation so its last result is served while GitHub is failing.
+
+    A result stored fresh, e.g. by the warm-up after startup, is returned by the first call.
+    Operations opt in to stale results with their ``serve_stale`` class attribute. A call that
+    fails with a server or connection error or an open circuit returns the last result of the
+    same call instead, as ``{"stale": True, "age_seconds": ..., "result": ...}``. Operations
+    setting ``serve_stale_after`` also serve it when a call has no result within that many
+    seconds, the slow call keeps running in the background and its result is served next. The
+    docstring of an operation serving stale results tells so, see ``document_stale``.
+
+    Args:
+        call: The ``__call__`` coroutine function.
+
+    Returns:
+        The wrapper, with the signature and docstring of ``call`` so tools are described the same.
+
+    """
+
+    @functools.wraps(call)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        patience = self.serve_stale_after
+        enabled = self.serve_stale or patience is not None
+        key = call_key(self, *args, **kwargs) if enabled or StaleResults.has_fresh() else None
+        if key is not None:
+            found, result = StaleResults.take_fresh(key)
+            if found:
+                return result
+        if not enabled:
+            return await call(self, *args, **kwargs)
+        last = StaleResults.get(key)
+        if last is None:
+            result = await call(self, *args, **kwargs)
+            StaleResults.put(key, result, arguments=call_arguments(self, *args, **kwargs))
+            return result
+        refresh = StaleResults._refreshes.get(key)
+        if refresh is None or refresh.get_loop() is not asyncio.get_running_loop():
+            refresh = StaleResults._refreshes[key] = asyncio.ensure_future(call(self, *args, **kwargs))
+            refresh.add_done_callback(functools.partial(_refreshed, key))
+        try:
+            return await asyncio.wait_for(asyncio.shield(refresh), patience)
+        except Exception as error:
+            if not is_outage(error):
+                raise
+        stored_at, result = last
+        return {"stale": True, "age_seconds": round(time.time() - stored_at, 1), "result": result}
+
+    return wrapper  # type: ignore[return-value]
+
+
+def document_stale(docstring: Optional[str], slow: bool = False) -> str:
+    """Tell in the docstring of a tool that its last result may be served, before its Returns section.
+
+    Args:
+        docstring: The docstring of the operation's ``__call__``.
+        slow: Whether the last result is also served when GitHub is slow.
+
+    Returns:
+        The docstring, with the stale result described.
+
+    """
+    docstring = docstring or ""
+    match = re.search(r"\n\n([ \t]*)Returns:", docstring)
+    indent = match.group(1) if match else ""
+    note = (
+        f"When GitHub is failing{' or slow' if slow else ''}, the last result of the same call is returned as\n"
+        f'{indent}`{{"stale": true, "age_seconds": ..., "result": ...}}` while a fresh one is fetched.'
+    )
+    if match is None:
+        return f"{docstring.rstrip()}\n\n{note}"
+    return f"{docstring[: match.start()]}\n\n{indent}{note}{docstring[match.start() :]}"
+
+
+def _refreshed(key: Hashable, refresh: "asyncio.Future[Any]") -> None:
+    if StaleResults._refreshes.get(key) is refresh:
+        del StaleResults._refreshes[key]
+    if not refresh.cancelled() and refresh.exception() is None:
+        StaleResults.put(key, refresh.result())
@@ -0,0 +1,256 @@
+"""Middlewares around the HTTP requests PyGithub sends."""
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass, Requester
+
+from dev_kit_gh_mcp_server.core import deadline
+
+
+@dataclass
+class Request:
+    """A request about to be sent, middlewares may change its headers."""
+
+    method: str
+    url: str
+    headers: Dict[str, str]
+    body: Any = None
+
+
+class Response:
+    """A buffered response, returned by middlewares that answer a request without sending it."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: str) -> None:
+        """Initialize the response.
+
+        Args:
+            status: The HTTP status.
+            headers: The response headers.
+            body: The decoded body.
+
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def getheaders(self) -> List[Tuple[str, str]]:
+        """Return the response headers as PyGithub expects them.
+
+        Returns:
+            The ``(name, value)`` pairs.
+
+        """
+        return list(self.headers.items())
+
+    def read(self) -> str:
+        """Return the body.
+
+        Returns:
+            The decoded body.
+
+        """
+        return self.body
+
+    def json(self) -> Any:
+        """Return the decoded JSON body.
+
+        Returns:
+            The data, or None for an empty body.
+
+        """
+        return json.loads(self.body) if self.body else None
+
+    def iter_content(self, chunk_size: Optional[int] = 1) -> Iterator[bytes]:
+        """Yield the body in chunks, like a streamed response.
+
+        Args:
+            chunk_size: Size of the chunks.
+
+        Yields:
+            The encoded body chunks.
+
+        """
+        content = self.body.encode()
+        size = chunk_size or len(content) or 1
+        for start in range(0, len(content), size):
+            yield content[start : start + size]
+
+    def raise_for_status(self) -> None:
+        """Raise for error statuses, like a streamed response.
+
+        Raises:
+            requests.HTTPError: If the status is an error status.
+
+        """
+        if self.status >= 400:
+            raise requests.HTTPError(f"{self.status} error", response=None)
+
+
+Handler = Callable[[Request], Any]
+# Called with the request and the next handler, returns the response of the next handler or its own response
+Middleware = Callable[[Request, Handler], Any]
+# Called with the method, URL, request headers, response status and lower-cased response headers
+ResponseHook = Callable[[str, str, Dict[str, str], int, Dict[str, Any]], None]
+
+_middlewares: List[Middleware] = []
+_response_hooks: Dict[ResponseHook, Middleware] = {}
+_lock = threading.Lock()
+_installed = False
+
+
+def add_middleware(middleware: Middleware) -> None:
+    """Run middleware around every request sent by PyGithub, adding a middleware twice has no effect.
+
+    Middlewares added first are the outermost.
+
+    Args:
+        middleware: The middleware.
+
+    """
+    install()
+    with _lock:
+        if middleware not in _middlewares:
+            _middlewares.append(middleware)
+
+
+def remove_middleware(middleware: Middleware) -> None:
+    """Stop running a middleware added with ``add_middleware``.
+
+    Args:
+        middleware: The middleware.
+
+    """
+    with _lock:
+        if middleware in _middlewares:
+            _middlewares.remove(middleware)
+
+
+def middlewares() -> List[Middleware]:
+    """Return the middlewares added with ``add_middleware``, outermost first.
+
+    Returns:
+        A copy of the list.
+
+    """
+    with _lock:
+        return list(_middlewares)
+
+
+def add_response_hook(hook: ResponseHook) -> None:
+    """Call hook after every response received by PyGithub, adding a hook twice has no effect.
+
+    Args:
+        hook: The callable, it must not raise.
+
+    """
+
+    def middleware(request: Request, send: Handler) -> Any:
+        response = send(request)
+        headers = {key.lower(): value for key, value in response.getheaders()}
+        hook(request.method, request.url, request.headers, response.status, headers)
+        return response
+
+    with _lock:
+        if hook in _response_hooks:
+            return
+        _response_hooks[hook] = middleware
+    add_middleware(middleware)
+
+
+def remove_response_hook(hook: ResponseHook) -> None:
+    """Stop calling a hook added with ``add_response_hook``.
+
+    Args:
+        hook: The callable.
+
+    """
+    with _lock:
+        middleware = _response_hooks.pop(hook, None)
+    if middleware is not None:
+        remove_middleware(middleware)
+
+
+def install() -> None:
+    """Make PyGithub send its requests through the connection classes of this module.
+
+    Requesters pick their connection class when they are created, so this is called before
+    creating the shared clients.
+    """
+    global _installed
+    with _lock:
+        if not _installed:
+            Requester.injectConnectionClasses(HTTPConnection, HTTPSConnection)
+            _installed = True
+
+
+class _HookedConnection:
+    """Run the middlewares and keep connections alive across requests.
+
+    PyGithub creates a connection, and a ``requests.Session``, for every request, so every request
+    opens a new TCP and TLS connection. Sessions are shared here by all connections of a requester.
+    """
+
+    _sessions: Dict[Tuple[Any, ...], requests.Session] = {}
+    _sessions_lock = threading.Lock()
+
+    protocol: str
+    host: str
+    port: int
+    verb: str
+    url: str
+    headers: Dict[str, str]
+    input: Any
+    timeout: Any
+    session: requests.Session
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # the retry policy belongs to the requester, it tells sessions of different requesters apart
+        key = (self.protocol, self.host, self.port, self.verify, id(self.retry), self.pool_size)  # type: ignore[attr-defined]
+        with self._sessions_lock:
+            shared = self._sessions.setdefault(key, self.session)
+        if shared is not self.session:
+            self.session.close()
+            self.session = shared
+
+    def getresponse(self) -> Any:
+        # a cancelled call sends no more requests, and the one it sends times out at its deadline
+        call = deadline.current()
+        if call is not None:
+            call.check()
+            remaining = call.remaining()
+            if remaining is not None:
+                self.timeout = min(self.timeout, remaining) if self.timeout else remaining
+        middlewares = list(_middlewares)
+        if not middlewares:
+            return super().getresponse()  # type: ignore[misc]
+
+        def send(request: Request) -> Any:
+            self.headers = request.headers
+            return super(_HookedConnection, self).getresponse()  # type: ignore[misc]
+
+        handler: Handler = send
+        for middleware in reversed(middlewares):
+            handler = _chain(middleware, handler)
+        url = f"{self.protocol}://{self.host}:{self.port}{self.url}"
+        return handler(Request(self.verb, url, self.headers, self.input))
+
+    def close(self) -> None:
+        # the session is shared, PyGithub closes the connection after every request
+        pass
+
+
+def _chain(middleware: Middleware, send: Handler) -> Handler:
+    return lambda request: middleware(request, send)
+
+
+class HTTPConnection(_HookedConnection, HTTPRequestsConnectionClass):
+    """PyGithub HTTP connection running the middlewares."""
+
+
+class HTTPSConnection(_HookedConnection, HTTPSRequestsConnectionClass):
+    """PyGithub HTTPS connection running the middlewares."""
@@ -0,0 +1,154 @@
+"""Prefetch of the repository data agents ask for first, run in the background after startup."""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from dev_kit_gh_mcp_server.core.async_base import AsyncGitHubOperation
+from dev_kit_gh_mcp_server.core.lazy import LazyOperation
+from dev_kit_gh_mcp_server.core.metadata import RepoMetadataIndex
+from dev_kit_gh_mcp_server.core.stale import StaleResults, call_arguments, call_key
+
+WARM_UP_TARGETS = ("prs", "issues", "labels", "tags")
+
+# the tool call prefetched for a target, with the arguments of a first call
+_CALLS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "prs": ("list_prs", {}),
+    "issues": ("list_issues", {}),
+    "tags": ("list_tags", {}),
+}
+
+
+def warm_up_targets(value: Optional[str] = None) -> List[str]:
+    """Parse the data to prefetch after startup.
+
+    Args:
+        value: Comma-separated targets among "prs", "issues", "labels" and "tags", or "none".
+            Defaults to the ``DEV_KIT_GH_WARMUP`` environment variable, or all targets.
+
+    Returns:
+        The targets, in order.
+
+    Raises:
+        ValueError: If a target is unknown.
+
+    """
+    value = os.getenv("DEV_KIT_GH_WARMUP", ",".join(WARM_UP_TARGETS)) if value is None else value
+    if value.strip().lower() in ("", "none", "off", "0", "false"):
+        return []
+    targets = [target.strip().lower() for target in value.split(",") if target.strip()]
+    unknown = sorted(set(targets) - set(WARM_UP_TARGETS))
+    if unknown:
+        raise ValueError(f"Unknown warm-up targets {unknown}, choose among {list(WARM_UP_TARGETS)}.")
+    return targets
+
+
+def _created(operation: Any) -> Any:
+    # prefetching is a first call, it instantiates the operations of lazy tools
+    return operation.operation if isinstance(operation, LazyOperation) else operation
+
+
+def _repository_operation(by_name: Dict[Any, Any]) -> Optional[Any]:
+    # an operation created already, e.g. for the prs or issues targets, shares its repository
+    created = [op for op in by_name.values() if not isinstance(op, LazyOperation) or op.created]
+    if created:
+        return created[0]
+    # otherwise the operation the prs or issues targets would create, not an arbitrary tool
+    return by_name.get("list_issues") or by_name.get("list_prs")
+
+
+async def warm_up(
+    operations: Iterable[Any],
+    targets: Iterable[str],
+    fresh_for: float = 120.0,
+    pause: float = 0.1,
+) -> List[str]:
+    """Prefetch the results of the first tool calls, one request at a time.
+
+    Open pull requests, recent issues and tags are fetched with the default arguments of their
+    tools and stored fresh in ``StaleResults``, the first call of a tool with those arguments
+    returns them without a request. Labels, milestones and assignees are loaded into the
+    repository's ``RepoMetadataIndex``, through an operation created already or the operation of
+    the issues or pull requests listing. Failures are ignored, the calls are then sent when asked for.
+
+    Args:
+        operations: The operations of the server.
+        targets: What to prefetch, see ``warm_up_targets``.
+        fresh_for: Seconds during which the prefetched results are served.
+        pause: Seconds between two prefetches, leaving the connections to the agent's calls.
+
+    Returns:
+        The targets that were prefetched.
+
+    """
+    by_name = {getattr(operation, "name", None): operation for operation in operations}
+    prefetched = []
+    for target in targets:
+        try:
+            if target == "labels":
+                operation = _repository_operation(by_name)
+                if operation is None:
+                    continue
+                operation = await asyncio.to_thread(_created, operation)
+                if getattr(operation, "_gh_repo", None) is None:
+                    continue
+                await asyncio.to_thread(RepoMetadataIndex.for_repo(operation._gh_repo).refresh)
+            else:
+                name, arguments = _CALLS[target]
+                operation = by_name.get(name)
+                if operation is None:
+                    continue
+                operation = await asyncio.to_thread(_created, operation)
+                result = await operation(**arguments)
+                # lazy listings are read now, not by the first call
+                if not isinstance(result, list):
+                    result = await asyncio.to_thread(list, result)
+                StaleResults.put(
+                    call_key(operation, **arguments),
+                    result,
+                    fresh_for=fresh_for,
+                    arguments=call_arguments(operation, **arguments),
+                )
+        except Exception:
+            # the warm-up is best effort, a failing prefetch must not stop the server
+            continue
+        prefetched.append(target)
+        await asyncio.sleep(pause)
+    return prefetched
+
+
+async def _warm_up_and_close(operations: List[Any], targets: List[str], fresh_for: float) -> None:
+    try:
+        await warm_up(operations, targets, fresh_for)
+    finally:
+        # the pooled clients are bound to the loop of the thread, which ends with it
+        await AsyncGitHubOperation.aclose_clients()
+
+
+def start_warm_up(operations: Iterable[Any], targets: Optional[Iterable[str]] = None) -> Optional[threading.Thread]:
+    """Run ``warm_up`` in a background thread, so the server is ready without waiting for it.
+
+    ``DEV_KIT_GH_WARMUP`` chooses the targets and ``DEV_KIT_GH_WARMUP_TTL`` how many seconds
+    the prefetched results are served (default 120).
+
+    Args:
+        operations: The operations of the server.
+        targets: What to prefetch, defaults to ``warm_up_targets()``.
+
+    Returns:
+        The started daemon thread, or None when there is nothing to prefetch.
+
+    """
+    targets = list(warm_up_targets() if targets is None else targets)
+    if not targets:
+        return None
+    fresh_for = float(os.getenv("DEV_KIT_GH_WARMUP_TTL") or 120.0)
+    operations = list(operations)
+    thread = threading.Thread(
+        target=lambda: asyncio.run(_warm_up_and_close(operations, targets, fresh_for)),
+        name="dev-kit-gh-warm-up",
+        daemon=True,
+    )
+    thread.start()
+    return thread
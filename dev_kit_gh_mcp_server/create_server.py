@@ -2,28 +2,52 @@
 
 import argparse
 import os
+import re
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 # from mcp.server.fastmcp import FastMCP  # type: ignore
 # from fastmcp import FastMCP
+from dev_kit_mcp_server.core import tomllib
 from dev_kit_mcp_server.tool_factory import RepoFastMCPServerError as FastMCP, ToolFactory
 
 from . import tools as tool_msodule
-from .tools import __all__ as tools_names
+from .core.lazy import LazyOperation
+from .core.warmup import start_warm_up
+from .tools import TOOL_NAMES
 
 
-def start_server(root_dir: str = None) -> FastMCP:
+def start_server(
+    root_dir: str = None,
+    tools: Union[str, Iterable[str], None] = None,
+    exclude_tools: Union[str, Iterable[str], None] = None,
+    lazy: Optional[bool] = None,
+) -> FastMCP:
     """Start the FastMCP server.
 
+    The data agents ask for first is prefetched in the background, see ``start_warm_up``.
+    Only the selected tools are registered, see ``select_tools``, unused tools cost neither
+    startup time nor schema tokens in the client.
+
     Args:
         root_dir: Root directory for file operations (default: current working directory)
+        tools: Names of the tools to serve, see ``select_tools``.
+        exclude_tools: Names of the tools not to serve.
+        lazy: Instantiate the operations, and run their GitHub setup, on their first call
+            (default: the ``lazy`` setting of the configuration, or True).
 
     Returns:
         A FastMCP instance configured with file operation tools
 
     """
     # Parse command line arguments
-    root_dir = root_dir or method_name()
+    if root_dir is None:
+        args = parse_args()
+        root_dir = args.root_dir
+        tools = args.tools if tools is None else tools
+        exclude_tools = args.exclude_tools if exclude_tools is None else exclude_tools
+    config = tool_configuration(root_dir)
+    lazy = config.get("lazy", True) if lazy is None else lazy
 
     # Create a FastMCP instance
     fastmcp: FastMCP = FastMCP(
@@ -33,22 +57,111 @@ def start_server(root_dir: str = None) -> FastMCP:
     )
 
     # Create a list of tools to register
-    ops = [getattr(tool_msodule, tool_name)(root_dir=root_dir) for tool_name in tools_names]
+    ops: List[Any] = [
+        LazyOperation(tool_class, root_dir=root_dir) if lazy else tool_class(root_dir=root_dir)
+        for tool_class in select_tools(root_dir, tools, exclude_tools, config=config)
+    ]
 
     # Check if GitHub tools should be registered
 
     # Register all tools
     tool_factory = ToolFactory(fastmcp)
-    tool_factory(ops)
+    for op in ops:
+        fastmcp.add_fast_tool(tool_factory.create_tool(op))
+
+    # Prefetch the data of the first calls in the background, the server is ready at once
+    start_warm_up(ops)
     return fastmcp
 
 
+def tool_configuration(root_dir: str) -> Dict[str, Any]:
+    """Read the tool configuration of a deployment.
+
+    The ``[tool.dkmcp.github]`` section of the ``pyproject.toml`` of the root directory holds
+    ``include`` and ``exclude`` lists of tool names, and ``lazy``, for example::
+
+        [tool.dkmcp.github]
+        include = ["list_prs", "search_issues", "read_file"]
+        lazy = true
+
+    Args:
+        root_dir: Root directory of the server.
+
+    Returns:
+        The section, empty when there is none.
+
+    """
+    path = Path(root_dir) / "pyproject.toml"
+    if not path.is_file():
+        return {}
+    with path.open("rb") as file:
+        return tomllib.load(file).get("tool", {}).get("dkmcp", {}).get("github", {})
+
+
+def _names(value: Union[str, Iterable[str], None]) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = re.split(r"[\s,]+", value)
+    return [name for name in value if name]
+
+
+def select_tools(
+    root_dir: str,
+    tools: Union[str, Iterable[str], None] = None,
+    exclude_tools: Union[str, Iterable[str], None] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> List[type]:
+    """Choose the tools a server registers.
+
+    Tools are named by their MCP name, e.g. "list_prs". The tools, and the excluded tools, are
+    taken from the arguments, else from the comma-separated ``DEV_KIT_GH_TOOLS`` and
+    ``DEV_KIT_GH_EXCLUDE_TOOLS`` environment variables, else from the ``include`` and ``exclude``
+    settings of ``tool_configuration``. All tools are served when none are selected. Only the
+    modules of the selected tools are imported.
+
+    Args:
+        root_dir: Root directory of the server.
+        tools: Names of the tools to serve, a list or a comma-separated string.
+        exclude_tools: Names of the tools not to serve.
+        config: The ``tool_configuration`` of the root directory, read when not given.
+
+    Returns:
+        The operation classes of the tools, in the order of ``tools.__all__``.
+
+    Raises:
+        ValueError: If a name is not the name of a tool.
+
+    """
+    config = tool_configuration(root_dir) if config is None else config
+    include = _names(tools) or _names(os.getenv("DEV_KIT_GH_TOOLS")) or _names(config.get("include"))
+    exclude = _names(exclude_tools) or _names(os.getenv("DEV_KIT_GH_EXCLUDE_TOOLS")) or _names(config.get("exclude"))
+    unknown = sorted(set(include or []).union(exclude or []) - set(TOOL_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown tools {unknown}, choose among {list(TOOL_NAMES)}.")
+    return [
+        getattr(tool_msodule, class_name)
+        for name, class_name in TOOL_NAMES.items()
+        if (not include or name in include) and name not in (exclude or [])
+    ]
+
+
 def method_name() -> str:
     """Parse command line arguments and validate the root directory.
 
     Returns:
         The validated root directory path as a string
 
+    """
+    return parse_args().root_dir
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments of the server.
+
+    Returns:
+        The arguments, with a validated root directory.
+
     Raises:
         ValueError: If the root directory does not exist or is not a directory
 
@@ -60,6 +173,41 @@ def method_name() -> str:
         default=os.getcwd(),
         help="Root directory for file operations (default: current working directory)",
     )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default="stdio",
+        help="Serve one client on stdio, or many clients over streamable HTTP or SSE (default: stdio)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Host to listen on over HTTP (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on over HTTP (default: 8000)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes serving HTTP clients (default: 1)",
+    )
+    parser.add_argument(
+        "--shared-cache",
+        type=str,
+        default=None,
+        help="SQLite file holding the response cache and rate-limit budget shared by the workers "
+        "(default: in the user cache directory when running several workers)",
+    )
+    parser.add_argument(
+        "--tools",
+        type=str,
+        default=None,
+        help="Comma-separated names of the tools to serve (default: DEV_KIT_GH_TOOLS, the include "
+        "setting of [tool.dkmcp.github] in pyproject.toml, or all tools)",
+    )
+    parser.add_argument(
+        "--exclude-tools",
+        type=str,
+        default=None,
+        help="Comma-separated names of the tools not to serve (default: DEV_KIT_GH_EXCLUDE_TOOLS, "
+        "or the exclude setting of [tool.dkmcp.github] in pyproject.toml)",
+    )
     args = parser.parse_args()
     # Validate root directory
     root_dir = args.root_dir
@@ -68,7 +216,7 @@ def method_name() -> str:
         raise ValueError(f"Root directory does not exist: {root_dir}")
     if not root_path.is_dir():
         raise ValueError(f"Root directory is not a directory: {root_dir}")
-    return root_dir
+    return args
 
 
 #
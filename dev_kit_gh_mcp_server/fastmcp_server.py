@@ -1,13 +1,17 @@
 """MCP Server implementation using FastMCP."""
 
 import asyncio
+import os
 import sys
+from pathlib import Path
+from typing import Any, Optional, Union
 
 # from mcp.server.fastmcp import FastMCP  # type: ignore
 # from fastmcp import FastMCP
 from dev_kit_mcp_server.tool_factory import RepoFastMCPServerError as FastMCP
 
-from .create_server import start_server
+from .core import SharedCache, transport
+from .create_server import parse_args, start_server
 
 # from importlib import import_module
 
@@ -33,10 +37,27 @@ def run_server(fastmcp: FastMCP = None) -> None:
 def arun_server(fastmcp: FastMCP = None) -> None:
     """Run the FastMCP server asynchronously.
 
+    Without a FastMCP instance, the command line chooses between serving one client on stdio
+    and serving many clients over HTTP.
+
     Args:
         fastmcp: Optional FastMCP instance to run. If None, a new instance will be created.
 
     """
+    if fastmcp is None:
+        args = parse_args()
+        if args.transport != "stdio":
+            serve_http(
+                args.root_dir,
+                args.host,
+                args.port,
+                args.workers,
+                args.transport,
+                args.shared_cache,
+                args.tools,
+                args.exclude_tools,
+            )
+            sys.exit(0)
     fastmcp = fastmcp or start_server()
     try:
         asyncio.run(fastmcp.run_async())
@@ -46,3 +67,75 @@ def arun_server(fastmcp: FastMCP = None) -> None:
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+
+
+def serve_http(
+    root_dir: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    transport_name: str = "http",
+    shared_cache: Optional[Union[str, Path]] = None,
+    tools: Optional[str] = None,
+    exclude_tools: Optional[str] = None,
+) -> None:
+    """Serve many MCP clients over streamable HTTP or SSE from one or more worker processes.
+
+    Workers serve streamable HTTP statelessly, so that any worker can answer any request of a
+    session. They share a response cache and the rate-limit budget through a SQLite file, so that
+    together they respect a single GitHub quota.
+
+    Args:
+        root_dir: Root directory, or repository name, served by the tools.
+        host: Host to listen on.
+        port: Port to listen on.
+        workers: Number of worker processes.
+        transport_name: "http" for streamable HTTP or "sse".
+        shared_cache: SQLite file shared by the workers, defaults to the user cache directory
+            when running several workers.
+        tools: Comma-separated names of the tools to serve, see ``select_tools``.
+        exclude_tools: Comma-separated names of the tools not to serve.
+
+    Raises:
+        ValueError: If several workers are asked to serve SSE, whose sessions live in one process.
+
+    """
+    import uvicorn
+
+    if transport_name == "sse" and workers > 1:
+        raise ValueError("SSE sessions live in a single process, use the http transport to run several workers.")
+    if shared_cache is None and workers > 1:
+        shared_cache = SharedCache.default_path()
+    # workers are new processes, they are configured through the environment
+    os.environ["DEV_KIT_GH_ROOT_DIR"] = root_dir
+    os.environ["DEV_KIT_GH_TRANSPORT"] = transport_name
+    if shared_cache is not None:
+        os.environ["DEV_KIT_GH_SHARED_CACHE"] = str(shared_cache)
+    if tools:
+        os.environ["DEV_KIT_GH_TOOLS"] = tools
+    if exclude_tools:
+        os.environ["DEV_KIT_GH_EXCLUDE_TOOLS"] = exclude_tools
+    uvicorn.run(
+        "dev_kit_gh_mcp_server.fastmcp_server:http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+    )
+
+
+def http_app() -> Any:
+    """Create the ASGI application of a worker process started by ``serve_http``.
+
+    Returns:
+        The Starlette application serving the tools.
+
+    """
+    shared_cache = os.getenv("DEV_KIT_GH_SHARED_CACHE")
+    if shared_cache:
+        transport.add_middleware(SharedCache(shared_cache))
+    fastmcp = start_server(os.environ["DEV_KIT_GH_ROOT_DIR"])
+    transport_name = os.getenv("DEV_KIT_GH_TRANSPORT", "http")
+    if transport_name == "sse":
+        return fastmcp.http_app(transport="sse")
+    return fastmcp.http_app(transport="http", stateless_http=True)
@@ -4,6 +4,7 @@ This module provides tools for github operations.
 including: PR creation, PR review, PR comment, PR close, PR delete,
 PRs: get PR details, get PR commits, get PR files,get PR reviews,
  get check PR status, get check PR logs.
+Actions: list workflow runs, list run artifacts, read artifact files.
 create PR, create PR review, create PR comment.
 Issues: list issues, get issue details, get issue comments,
 get issue events, get issue labels, get issue milestones,
@@ -13,22 +14,89 @@ create branch.
 
 """
 
-# Repository operations
-from .issue import CreateIssueOp, ReadIssueCommentsOp, WriteIssueCommentOp
-from .pr import CreatePROp, ListPRReviewsOp, ReadPRCommentsOp, WritePRCommentOp
-from .repo import (
-    ListCommitsOp,
-    # CreateBranchOperation,
-    ListIssuesOp,
-    ListPRsOp,
-    ListTagsOp,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .actions import ListRunArtifactsOp, ListWorkflowRunsOp, ReadArtifactOp
+    from .activity import WatchActivityOp
+    from .checks import CheckPRLogsOp, CheckPRStatusOp
+    from .contents import BlameFileOp, ListTreeOp, ReadFileOp
+    from .issue import CreateIssueOp, ReadIssueCommentsOp, WriteIssueCommentOp
+    from .org import ListOrgIssuesOp, ListOrgPRsOp
+    from .pr import CreatePROp, ListPRReviewsOp, ReadPRCommentsOp, WritePRCommentOp
+    from .repo import (
+        CompareRefsOp,
+        ListCommitsOp,
+        # CreateBranchOperation,
+        ListIssuesOp,
+        ListPRsOp,
+        ListTagsOp,
+    )
+    from .search import SearchIssuesOp
+
+# Tool modules import PyGithub, they are imported when one of their tools is first accessed.
+_TOOL_MODULES = {
+    "ListIssuesOp": ".repo",
+    "ListCommitsOp": ".repo",
+    "ListTagsOp": ".repo",
+    "ListPRsOp": ".repo",
+    "CompareRefsOp": ".repo",
+    "CreateIssueOp": ".issue",
+    "CreatePROp": ".pr",
+    "ReadIssueCommentsOp": ".issue",
+    "WriteIssueCommentOp": ".issue",
+    "ReadPRCommentsOp": ".pr",
+    "WritePRCommentOp": ".pr",
+    "ListPRReviewsOp": ".pr",
+    "CheckPRStatusOp": ".checks",
+    "CheckPRLogsOp": ".checks",
+    "ReadFileOp": ".contents",
+    "ListTreeOp": ".contents",
+    "BlameFileOp": ".contents",
+    "WatchActivityOp": ".activity",
+    "SearchIssuesOp": ".search",
+    "ListOrgPRsOp": ".org",
+    "ListOrgIssuesOp": ".org",
+    "ListWorkflowRunsOp": ".actions",
+    "ListRunArtifactsOp": ".actions",
+    "ReadArtifactOp": ".actions",
+}
+
+# MCP names of the tools, servers select tools by name without importing the other tool modules
+TOOL_NAMES = {
+    "list_issues": "ListIssuesOp",
+    "list_commits": "ListCommitsOp",
+    "list_tags": "ListTagsOp",
+    "list_prs": "ListPRsOp",
+    "compare_refs": "CompareRefsOp",
+    "create_issue": "CreateIssueOp",
+    "create_pr": "CreatePROp",
+    "read_issue_comments": "ReadIssueCommentsOp",
+    "write_issue_comment": "WriteIssueCommentOp",
+    "read_pr_comments": "ReadPRCommentsOp",
+    "write_pr_comment": "WritePRCommentOp",
+    "list_pr_reviews": "ListPRReviewsOp",
+    "check_pr_status": "CheckPRStatusOp",
+    "check_pr_logs": "CheckPRLogsOp",
+    "read_file": "ReadFileOp",
+    "list_tree": "ListTreeOp",
+    "blame_file": "BlameFileOp",
+    "watch_activity": "WatchActivityOp",
+    "search_issues": "SearchIssuesOp",
+    "list_org_prs": "ListOrgPRsOp",
+    "list_org_issues": "ListOrgIssuesOp",
+    "list_workflow_runs": "ListWorkflowRunsOp",
+    "list_run_artifacts": "ListRunArtifactsOp",
+    "read_artifact": "ReadArtifactOp",
+}
 
 __all__ = [
     "ListIssuesOp",
     "ListCommitsOp",
     "ListTagsOp",
     "ListPRsOp",
+    "CompareRefsOp",
     "CreateIssueOp",
     "CreatePROp",
     "ReadIssueCommentsOp",
@@ -36,4 +104,36 @@ __all__ = [
     "ReadPRCommentsOp",
     "WritePRCommentOp",
     "ListPRReviewsOp",
+    "CheckPRStatusOp",
+    "CheckPRLogsOp",
+    "ReadFileOp",
+    "ListTreeOp",
+    "BlameFileOp",
+    "WatchActivityOp",
+    "SearchIssuesOp",
+    "ListOrgPRsOp",
+    "ListOrgIssuesOp",
+    "ListWorkflowRunsOp",
+    "ListRunArtifactsOp",
+    "ReadArtifactOp",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of a tool on first access.
+
+    Args:
+        name: The tool class name.
+
+    Returns:
+        The tool class.
+
+    Raises:
+        AttributeError: If there is no such tool.
+
+    """
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(import_module(_TOOL_MODULES[name], __name__), name)
+    globals()[name] = tool
+    return tool
@@ -0,0 +1,262 @@
+"""GitHub Actions workflow runs and artifacts tool module."""
+
+import asyncio
+import base64
+import hashlib
+import mmap
+import os
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterator, List, Optional
+from urllib.parse import quote
+
+from github.Artifact import Artifact
+from github.WorkflowRun import WorkflowRun
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+from dev_kit_gh_mcp_server.core.artifact_cache import ArtifactCache
+
+# Values of the status filter of the workflow runs API, statuses and conclusions alike
+RUN_STATUSES = frozenset({
+    "completed",
+    "action_required",
+    "cancelled",
+    "failure",
+    "neutral",
+    "skipped",
+    "stale",
+    "success",
+    "timed_out",
+    "in_progress",
+    "queued",
+    "requested",
+    "waiting",
+    "pending",
+})
+
+
+def summarize_run(run: WorkflowRun) -> Dict[str, Any]:
+    """Reduce a workflow run to the fields needed to pick the runs to look into.
+
+    Args:
+        run: The workflow run.
+
+    Returns:
+        The ``id``, workflow ``name``, ``run_number``, ``run_attempt``, ``event``, ``status``,
+        ``conclusion``, ``head_branch``, ``head_sha``, ``created_at`` and ``html_url``.
+
+    """
+    return {
+        "id": run.id,
+        "name": run.name,
+        "run_number": run.run_number,
+        "run_attempt": run.run_attempt,
+        "event": run.event,
+        "status": run.status,
+        "conclusion": run.conclusion,
+        "head_branch": run.head_branch,
+        "head_sha": run.head_sha,
+        "created_at": run.raw_data.get("created_at"),
+        "html_url": run.html_url,
+    }
+
+
+def summarize_artifact(artifact: Artifact) -> Dict[str, Any]:
+    """Reduce an artifact to its identity, size and expiry.
+
+    Args:
+        artifact: The artifact.
+
+    Returns:
+        The ``id``, ``name``, ``size_in_bytes``, whether it ``expired``, ``created_at`` and ``expires_at``.
+
+    """
+    return {
+        "id": artifact.id,
+        "name": artifact.name,
+        "size_in_bytes": artifact.size_in_bytes,
+        "expired": artifact.expired,
+        "created_at": artifact.raw_data.get("created_at"),
+        "expires_at": artifact.raw_data.get("expires_at"),
+    }
+
+
+@dataclass
+class ListWorkflowRunsOp(AsyncGitHubOperation):
+    """Operation to list the GitHub Actions workflow runs of a repository."""
+
+    name = "list_workflow_runs"
+
+    async def __call__(
+        self,
+        branch: Optional[str] = None,
+        event: Optional[str] = None,
+        status: Optional[str] = None,
+        workflow: Optional[str] = None,
+        head_sha: Optional[str] = None,
+        max_results: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """List the workflow runs of the repository, newest first.
+
+        `branch`, `event` (e.g. "push" or "pull_request"), `status` (a status or conclusion, e.g.
+        "failure" or "in_progress") and `head_sha` are filtered by the API, `workflow` restricts the
+        runs to one workflow, by file name (e.g. "ci.yml") or id. Pages are requested only until
+        `max_results` runs were found.
+
+        Returns:
+            List[Dict[str, Any]]: The runs, with their id, workflow name, run number and attempt,
+            event, status, conclusion, head branch and SHA, creation time and URL.
+
+        Raises:
+            ValueError: If status is not a status or conclusion of workflow runs.
+
+        """
+        if status is not None and status not in RUN_STATUSES:
+            raise ValueError(f"Invalid status {status!r}, expected one of {', '.join(sorted(RUN_STATUSES))}.")
+        path = f"actions/workflows/{quote(workflow, safe='')}/runs" if workflow else "actions/runs"
+        params = {"branch": branch, "event": event, "status": status, "head_sha": head_sha}
+        runs = await self.paginate(
+            WorkflowRun,
+            self.repo_url(path),
+            {"per_page": min(max_results, 100), **{key: value for key, value in params.items() if value is not None}},
+            max_results=max_results,
+            list_item="workflow_runs",
+        )
+        return [summarize_run(run) for run in runs]
+
+
+@dataclass
+class ListRunArtifactsOp(AsyncGitHubOperation):
+    """Operation to list the artifacts of a GitHub Actions workflow run."""
+
+    name = "list_run_artifacts"
+
+    async def __call__(self, run_id: int, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List the artifacts uploaded by a workflow run, optionally only those named `name`.
+
+        Returns:
+            List[Dict[str, Any]]: The artifacts, with their id, name, size, whether they expired,
+            and their creation and expiry times. Read one with `read_artifact`.
+
+        """
+        params = {"name": name} if name is not None else None
+        artifacts = await self.paginate(
+            Artifact, self.repo_url(f"actions/runs/{run_id}/artifacts"), params, list_item="artifacts"
+        )
+        return [summarize_artifact(artifact) for artifact in artifacts]
+
+
+@dataclass
+class ReadArtifactOp(AsyncGitHubOperation):
+    """Operation to list and read the files of a GitHub Actions artifact."""
+
+    name = "read_artifact"
+
+    # Archives are streamed to the artifact cache, larger archives are refused
+    max_archive_bytes: ClassVar[int] = 1024 * 1024 * 1024
+    max_members: ClassVar[int] = 1000
+
+    async def __call__(
+        self,
+        artifact_id: int,
+        member: Optional[str] = None,
+        offset: int = 0,
+        max_bytes: int = 100_000,
+    ) -> Dict[str, Any]:
+        """List the files of an artifact, or read the file `member` of it.
+
+        The archive is downloaded once, streamed to a local cache directory, and read from there
+        through a memory map: listing the files reads the central directory of the zip only, and a
+        file is decompressed as a stream up to `offset` + `max_bytes` bytes, so memory use does not
+        grow with the size of the archive. Access to the artifact is checked with GitHub on every call.
+
+        Returns:
+            Dict[str, Any]: The `artifact_id`, `name` and `size_in_bytes` of the artifact, and
+            either its `members` (`name`, `size` and `compressed_size`, at most 1000) and whether
+            they were `truncated`, or the `member` read with its `size`, `offset`, `encoding`
+            ("utf-8", or "base64" for binary files), `content` and whether it was `truncated`.
+
+        Raises:
+            ValueError: If the offset is negative, the artifact expired, is too large or empty, or has no such member.
+
+        """
+        if offset < 0:
+            raise ValueError("The offset must not be negative.")
+        _, data = await self.request_json("GET", self.repo_url(f"actions/artifacts/{artifact_id}"))
+        artifact = summarize_artifact(self.as_object(Artifact, data))
+        if artifact["expired"]:
+            raise ValueError(f"Artifact {artifact_id} expired on {artifact['expires_at']}.")
+        if (artifact["size_in_bytes"] or 0) > self.max_archive_bytes:
+            raise ValueError(f"Artifact {artifact_id} is larger than {self.max_archive_bytes} bytes.")
+        # artifact ids are unique per GitHub instance, the repository is part of the key all the same
+        repository = hashlib.sha256(f"{self.base_url} {self.repo_url()}".encode()).hexdigest()[:16]
+        key = f"{repository}-{artifact_id}"
+        url = self.repo_url(f"actions/artifacts/{artifact_id}/zip")
+        cache = ArtifactCache.from_env()
+        path = await cache.fetch(key, lambda file: self.download(url, file, self.max_archive_bytes))
+        result = {"artifact_id": artifact_id, "name": artifact["name"], "size_in_bytes": artifact["size_in_bytes"]}
+        try:
+            return {**result, **await self._read_archive(path, member, offset, max_bytes)}
+        except FileNotFoundError:
+            # another process evicted the archive before it was opened, it is downloaded again
+            path = await cache.fetch(key, lambda file: self.download(url, file, self.max_archive_bytes))
+            return {**result, **await self._read_archive(path, member, offset, max_bytes)}
+
+    async def _read_archive(self, path: Path, member: Optional[str], offset: int, max_bytes: int) -> Dict[str, Any]:
+        # reading the archive is blocking and CPU bound, it runs off the event loop
+        if member is None:
+            return await asyncio.to_thread(self._members, path)
+        return await asyncio.to_thread(self._read_member, path, member, offset, max_bytes)
+
+    def _members(self, path: Path) -> Dict[str, Any]:
+        with _mapped_zip(path) as archive:
+            infos = [info for info in archive.infolist() if not info.is_dir()]
+        return {
+            "members": [
+                {"name": info.filename, "size": info.file_size, "compressed_size": info.compress_size}
+                for info in infos[: self.max_members]
+            ],
+            "truncated": len(infos) > self.max_members,
+        }
+
+    @staticmethod
+    def _read_member(path: Path, member: str, offset: int, max_bytes: int) -> Dict[str, Any]:
+        with _mapped_zip(path) as archive:
+            try:
+                info = archive.getinfo(member)
+            except KeyError:
+                raise ValueError(f"No file {member} in the artifact.") from None
+            with archive.open(info) as raw:
+                # seeking decompresses the skipped bytes without keeping them
+                raw.seek(offset)
+                content = raw.read(max_bytes)
+        # git considers content with a NUL byte in its first 8000 bytes binary
+        binary = b"\0" in content[:8000]
+        return {
+            "member": member,
+            "size": info.file_size,
+            "offset": offset,
+            "encoding": "base64" if binary else "utf-8",
+            "content": base64.b64encode(content).decode() if binary else content.decode("utf-8", errors="replace"),
+            "truncated": offset + len(content) < info.file_size,
+        }
+
+
+class _MappedFile(mmap.mmap):
+    # zipfile seeks within a member only in seekable files, mmap tells it is from Python 3.13 on
+    def seekable(self) -> bool:
+        return True
+
+
+@contextmanager
+def _mapped_zip(path: Path) -> Iterator[zipfile.ZipFile]:
+    # the pages of the archive are read on access and shared with the page cache, not copied into memory
+    with open(path, "rb") as file:
+        # an empty file cannot be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError("The artifact archive is empty.")
+        with _MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with zipfile.ZipFile(mapped) as archive:  # type: ignore[call-overload]
+                yield archive
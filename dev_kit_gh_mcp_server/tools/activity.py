@@ -0,0 +1,128 @@
+"""GitHub repository activity tool module."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+
+
+def summarize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a repository event to the fields an agent acts on.
+
+    Args:
+        event: The event, as returned by the events API.
+
+    Returns:
+        The event id, type, actor login and time, with the action, number and title of the pull
+        request or issue, the start of a comment, or the ref and size of a push.
+
+    """
+    payload = event.get("payload") or {}
+    summary = {
+        "id": event["id"],
+        "type": event["type"],
+        "actor": (event.get("actor") or {}).get("login"),
+        "created_at": event.get("created_at"),
+    }
+    if payload.get("action"):
+        summary["action"] = payload["action"]
+    subject = payload.get("pull_request") or payload.get("issue")
+    if subject:
+        summary["number"], summary["title"] = subject.get("number"), subject.get("title")
+    if payload.get("comment"):
+        summary["comment"] = (payload["comment"].get("body") or "")[:200]
+    if event["type"] == "PushEvent":
+        summary["ref"], summary["commits"] = payload.get("ref"), payload.get("size")
+    return summary
+
+
+@dataclass
+class WatchActivityOp(AsyncGitHubOperation):
+    """Operation to wait for new activity in a GitHub repository."""
+
+    name = "watch_activity"
+
+    # The events API is polled no more often than its X-Poll-Interval asks, 60 seconds unless told otherwise
+    default_poll_interval: ClassVar[float] = 60.0
+    max_timeout: ClassVar[float] = 600.0
+    # a call waits up to max_timeout, it is not held to the deadline of other operations
+    call_timeout: ClassVar[Optional[float]] = 660.0
+    per_page: ClassVar[int] = 100
+
+    # ETag, events and poll interval of the last response, and the earliest time of the next request
+    _last: Dict[str, Any] = field(init=False, default_factory=dict, repr=False)
+
+    async def __call__(
+        self,
+        since_id: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        timeout: float = 60.0,
+        max_results: int = 30,
+    ) -> Dict[str, Any]:
+        """Wait until events newer than `since_id` happen in the repository, or `timeout` seconds pass.
+
+        Pass the `marker` of the previous call as `since_id` to receive only what happened since.
+        Without `since_id`, the latest events are returned at once. `types` keeps only some event
+        types, e.g. ["PullRequestEvent", "IssueCommentEvent", "PushEvent"]. The events API is polled
+        with conditional requests, unchanged polls do not count against the rate limit, and never
+        more often than GitHub's `X-Poll-Interval` allows, so a single call replaces repeated listings.
+
+        Returns:
+            Dict[str, Any]: The `events`, oldest first, the `marker` to pass as `since_id` next, whether
+            the call `timed_out`, whether more than `max_results` events matched (`truncated`, the
+            next call after `since_id` returns the rest, without it only the latest are returned),
+            and whether events may have been `missed` because more than one page of events happened
+            since `since_id`.
+
+        """
+        # without a marker the latest events are returned at once, from the last response if it is fresh
+        deadline = time.monotonic() + (min(max(timeout, 0.0), self.max_timeout) if since_id else 0.0)
+        last_seen = int(since_id) if since_id else None
+        events = self._last.get("events") if since_id else None
+        while True:
+            if events is not None:
+                newer = [event for event in events if last_seen is None or int(event["id"]) > last_seen]
+                matching = [event for event in newer if not types or event["type"] in types]
+                if matching or last_seen is None or time.monotonic() >= deadline:
+                    marker = newer[0]["id"] if newer else since_id
+                    if last_seen is None:
+                        selected = matching[:max_results]
+                    else:
+                        # the oldest events are returned first, the marker resumes after the last one returned
+                        selected = matching[max(len(matching) - max_results, 0) :]
+                        if len(selected) < len(matching):
+                            marker = selected[0]["id"] if selected else since_id
+                    return {
+                        "events": [summarize_event(event) for event in reversed(selected)],
+                        "marker": marker,
+                        "timed_out": not matching and last_seen is not None,
+                        "truncated": len(selected) < len(matching),
+                        "missed": last_seen is not None and len(newer) == len(events) == self.per_page,
+                    }
+                # events of other types were seen, they are not reported by the next calls either
+                if newer:
+                    since_id, last_seen = newer[0]["id"], int(newer[0]["id"])
+            events = await self._poll(deadline)
+
+    async def _poll(self, deadline: float) -> List[Dict[str, Any]]:
+        # the last events are reused until the poll interval has passed, then revalidated
+        wait = self._last.get("next_poll", 0.0) - time.monotonic()
+        if wait > 0 and "events" in self._last:
+            if time.monotonic() + wait > deadline:
+                await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+                return self._last["events"]
+            await asyncio.sleep(wait)
+        etag = self._last.get("etag")
+        headers, data = await self.request_json(
+            "GET",
+            self.repo_url("events"),
+            params={"per_page": self.per_page},
+            headers={"If-None-Match": etag} if etag else None,
+        )
+        interval = float(headers.get("x-poll-interval") or self.default_poll_interval)
+        self._last["next_poll"] = time.monotonic() + interval
+        if data is not None:
+            self._last.update(etag=headers.get("etag"), events=data)
+        return self._last.get("events", [])
@@ -0,0 +1,222 @@
+"""GitHub check runs and CI logs tool module."""
+
+import asyncio
+import io
+import re
+import tempfile
+import zipfile
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import IO, Any, ClassVar, Dict, Iterable, List
+
+from github.CheckRun import CheckRun
+from github.WorkflowJob import WorkflowJob
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+
+# Conclusions of a check run, a job or a step that failed the pull request
+FAILING_CONCLUSIONS = frozenset({"failure", "timed_out", "cancelled", "action_required", "startup_failure"})
+_STEP_LOG = re.compile(r"^(\d+)_")
+
+
+def tail(lines: Iterable[str], count: int) -> List[str]:
+    """Return the last lines of a stream while holding at most count lines in memory.
+
+    Args:
+        lines: The lines, e.g. a file object.
+        count: Number of lines to keep.
+
+    Returns:
+        The last count lines, without line terminators.
+
+    """
+    return [line.rstrip("\r\n") for line in deque(lines, maxlen=count)]
+
+
+def _normalized(name: str) -> str:
+    # the logs archive drops characters such as "/" and ":" from job and step names
+    return re.sub(r"[^0-9a-z]", "", name.lower())
+
+
+@dataclass
+class _ChecksOp(AsyncGitHubOperation):
+    """Shared lookups of the check runs of a pull request."""
+
+    async def head_sha(self, pr_number: int) -> str:
+        """Return the SHA of the head commit of a pull request.
+
+        Args:
+            pr_number: The pull request number.
+
+        Returns:
+            The head commit SHA.
+
+        """
+        _, pull = await self.request_json("GET", self.repo_url(f"pulls/{pr_number}"))
+        return pull["head"]["sha"]
+
+    async def check_runs(self, sha: str) -> List[CheckRun]:
+        """Return the latest check runs of a commit.
+
+        Args:
+            sha: The commit SHA.
+
+        Returns:
+            The check runs, a re-run replaces the previous run of the same check.
+
+        """
+        return await self.paginate(
+            CheckRun,
+            self.repo_url(f"commits/{sha}/check-runs"),
+            {"filter": "latest"},
+            list_item="check_runs",
+        )
+
+
+@dataclass
+class CheckPRStatusOp(_ChecksOp):
+    """Operation to summarize the check runs of a GitHub pull request."""
+
+    name = "check_pr_status"
+
+    async def __call__(self, pr_number: int) -> dict:
+        """Return a compact summary of the check runs of the head commit of a pull request.
+
+        `state` is "failure" if any check failed, "pending" while checks are queued or running,
+        and "success" otherwise. Each check run is reduced to its id, name, status, conclusion and URL.
+
+        Returns:
+            dict: The head SHA, overall state, counts per conclusion and the check runs.
+
+        """
+        sha = await self.head_sha(pr_number)
+        runs = await self.check_runs(sha)
+        counts = Counter(run.conclusion or run.status for run in runs)
+        if any(run.conclusion in FAILING_CONCLUSIONS for run in runs):
+            state = "failure"
+        elif any(run.status != "completed" for run in runs):
+            state = "pending"
+        else:
+            state = "success"
+        return {
+            "sha": sha,
+            "state": state,
+            "counts": dict(counts),
+            "check_runs": [
+                {
+                    "id": run.id,
+                    "name": run.name,
+                    "status": run.status,
+                    "conclusion": run.conclusion,
+                    "details_url": run.details_url,
+                }
+                for run in runs
+            ],
+        }
+
+
+@dataclass
+class CheckPRLogsOp(_ChecksOp):
+    """Operation to read the logs of the failing CI steps of a GitHub pull request."""
+
+    name = "check_pr_logs"
+
+    # Logs archives are spooled to disk, larger archives are refused
+    max_archive_bytes: ClassVar[int] = 1024 * 1024 * 1024
+
+    async def __call__(self, pr_number: int, tail_lines: int = 100) -> list:
+        """Return the last lines of the log of every failing GitHub Actions step of a pull request.
+
+        The logs archive of each workflow run is streamed to a temporary file and only the
+        failing steps are decompressed, line by line, so memory use is bounded by `tail_lines`
+        whatever the size of the logs. Checks of other apps have no logs and are skipped.
+
+        Returns:
+            list: One entry per failing step with the job, step name and number, and the log lines.
+
+        """
+        sha = await self.head_sha(pr_number)
+        failing = [
+            run
+            for run in await self.check_runs(sha)
+            if run.conclusion in FAILING_CONCLUSIONS and run.app is not None and run.app.slug == "github-actions"
+        ]
+        # the check run of a GitHub Actions job has the id of the job
+        jobs = await asyncio.gather(*(self.job(run.id) for run in failing))
+        jobs_by_run: Dict[int, List[WorkflowJob]] = {}
+        for job in jobs:
+            jobs_by_run.setdefault(job.run_id, []).append(job)
+        logs = await asyncio.gather(
+            *(self.failing_step_logs(run_id, run_jobs, tail_lines) for run_id, run_jobs in jobs_by_run.items())
+        )
+        return [entry for run_logs in logs for entry in run_logs]
+
+    async def job(self, job_id: int) -> WorkflowJob:
+        """Return a workflow job with its steps.
+
+        Args:
+            job_id: The job id.
+
+        Returns:
+            The workflow job.
+
+        """
+        headers, data = await self.request_json("GET", self.repo_url(f"actions/jobs/{job_id}"))
+        return self.as_object(WorkflowJob, data, headers)
+
+    async def failing_step_logs(self, run_id: int, jobs: List[WorkflowJob], tail_lines: int) -> List[Dict[str, Any]]:
+        """Download the logs archive of a workflow run and tail the logs of the failing steps of jobs.
+
+        Args:
+            run_id: The workflow run id.
+            jobs: The failing jobs of the run.
+            tail_lines: Number of lines to return per step.
+
+        Returns:
+            One entry per failing step, or per job when no step log is found for it.
+
+        """
+        with tempfile.TemporaryFile() as archive:
+            await self.download(self.repo_url(f"actions/runs/{run_id}/logs"), archive, self.max_archive_bytes)
+            # decompressing is CPU bound, it runs off the event loop
+            return await asyncio.to_thread(self._read_archive, archive, jobs, tail_lines)
+
+    def _read_archive(self, archive: IO[bytes], jobs: List[WorkflowJob], tail_lines: int) -> List[Dict[str, Any]]:
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as logs:
+            return [entry for job in jobs for entry in self._job_logs(logs, job, tail_lines)]
+
+    def _job_logs(self, logs: zipfile.ZipFile, job: WorkflowJob, tail_lines: int) -> List[Dict[str, Any]]:
+        job_dir = _normalized(job.name)
+        step_files: Dict[int, str] = {}
+        job_file = None
+        for name in logs.namelist():
+            directory, _, base = name.rpartition("/")
+            match = _STEP_LOG.match(base)
+            if directory and _normalized(directory) == job_dir and match:
+                step_files[int(match.group(1))] = name
+            elif not directory and match and _normalized(base[match.end() : -len(".txt")]) == job_dir:
+                job_file = name
+        entries = [
+            {
+                "job": job.name,
+                "step": step.name,
+                "number": step.number,
+                "lines": self._tail_entry(logs, step_files[step.number], tail_lines),
+            }
+            for step in job.steps
+            if step.conclusion in FAILING_CONCLUSIONS and step.number in step_files
+        ]
+        if not entries and job_file is not None:
+            entries.append({
+                "job": job.name,
+                "step": None,
+                "number": None,
+                "lines": self._tail_entry(logs, job_file, tail_lines),
+            })
+        return entries
+
+    @staticmethod
+    def _tail_entry(logs: zipfile.ZipFile, name: str, tail_lines: int) -> List[str]:
+        with logs.open(name) as raw:
+            return tail(io.TextIOWrapper(raw, encoding="utf-8", errors="replace"), tail_lines)
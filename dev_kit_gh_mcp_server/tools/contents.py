@@ -0,0 +1,420 @@
+"""GitHub file contents tool module."""
+
+import base64
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from github.GithubException import UnknownObjectException
+from github.GithubObject import NotSet
+
+from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.core.blob_cache import BlobCache
+from dev_kit_gh_mcp_server.core.conditional import ConditionalGet
+
+
+def file_result(path: str, ref: Optional[str], sha: str, content: bytes, max_bytes: int) -> Dict[str, Any]:
+    """Describe the content of a file, text as is and binary content base64 encoded.
+
+    Args:
+        path: Path of the file.
+        ref: The ref the file was read at.
+        sha: The blob SHA.
+        content: The content.
+        max_bytes: Number of bytes of content returned.
+
+    Returns:
+        The ``path``, ``ref``, ``sha``, ``size``, ``encoding`` ("utf-8" or "base64"),
+        ``content`` and whether it was ``truncated``.
+
+    """
+    # git considers content with a NUL byte in its first 8000 bytes binary
+    binary = b"\0" in content[:8000]
+    head = content[:max_bytes]
+    return {
+        "path": path,
+        "ref": ref,
+        "sha": sha,
+        "size": len(content),
+        "encoding": "base64" if binary else "utf-8",
+        "content": base64.b64encode(head).decode() if binary else head.decode("utf-8", errors="replace"),
+        "truncated": len(content) > max_bytes,
+    }
+
+
+def glob_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob matching repository paths.
+
+    ``*`` and ``?`` do not match ``/``, ``**`` matches any number of directories, and ``[...]``
+    matches a character class.
+
+    Args:
+        pattern: The glob, e.g. ``src/**/*.py``.
+
+    Returns:
+        The compiled regular expression, matching whole paths.
+
+    """
+    parts = []
+    for token in re.findall(r"\*\*/|\*\*|\*|\?|\[[^\]]*\]|[^*?\[]+|\[", pattern):
+        if token == "**/":
+            parts.append("(?:.*/)?")
+        elif token == "**":
+            parts.append(".*")
+        elif token == "*":
+            parts.append("[^/]*")
+        elif token == "?":
+            parts.append("[^/]")
+        elif token.startswith("[") and len(token) > 1:
+            parts.append(token.replace("[!", "[^", 1))
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _may_contain_matches(directory: str, pattern: Optional[str]) -> bool:
+    # the directories before the first wildcard are literal, other directories cannot match
+    if pattern is None:
+        return True
+    literal = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+    literal = literal[: literal.rfind("/") + 1]
+    directory = f"{directory}/"
+    return directory.startswith(literal) or literal.startswith(directory)
+
+
+@dataclass
+class ReadFileOp(GitHubOperation):
+    """Operation to read a file of a GitHub repository at a branch, tag or commit."""
+
+    name = "read_file"
+
+    async def __call__(self, path: str, ref: Optional[str] = None, max_bytes: int = 100_000) -> Dict[str, Any]:
+        """Read a file of the repository at `ref`, a branch, tag or commit SHA (default branch if omitted).
+
+        When root_dir is a clone that has fetched `ref`, the file is read locally. Otherwise only
+        the blob SHA of the file is looked up, with a GraphQL query, and the content comes from a
+        local store of blobs read before, so the same content is downloaded once whatever the
+        branch or commit. At most `max_bytes` bytes are returned.
+
+        Returns:
+            Dict[str, Any]: The `path`, `ref`, blob `sha`, `size`, `encoding` ("utf-8", or "base64"
+            for binary files), `content` and whether it was `truncated`.
+
+        Raises:
+            ValueError: If there is no file at path.
+
+        """
+        path = path.strip("/")
+        local = self.local_checkout
+        commit = local.resolve(ref) if local is not None else None
+        if local is not None and commit is not None:
+            found = local.blob(commit, path)
+            if found is None:
+                raise ValueError(f"No file {path} at {ref or 'the default branch'}.")
+            return file_result(path, ref, *found, max_bytes=max_bytes)
+        owner, name = self._gh_repo.full_name.split("/")
+        # HEAD is the default branch
+        variables = {"owner": owner, "name": name, "expression": f"{ref or 'HEAD'}:{path}"}
+        _, data = self._gh_repo._requester.graphql_query(_BLOB_QUERY, variables)
+        found = (data["data"]["repository"] or {}).get("object")
+        if found is None or found.get("__typename") != "Blob":
+            raise ValueError(f"No file {path} at {ref or 'the default branch'}.")
+        sha = found["oid"]
+        blobs = BlobCache.from_env()
+        content = blobs.get(sha)
+        if content is None:
+            content = base64.b64decode(self._gh_repo.get_git_blob(sha).content)
+            blobs.put(sha, content)
+        return file_result(path, ref, sha, content, max_bytes)
+
+
+_BLOB_QUERY = """
+query ($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      __typename
+      oid
+    }
+  }
+}
+"""
+
+
+@dataclass
+class ListTreeOp(GitHubOperation):
+    """Operation to list the files of a GitHub repository at a branch, tag or commit."""
+
+    name = "list_tree"
+
+    # listings by tree SHA, a tree SHA names its content so they never go stale
+    max_cached_trees: ClassVar[int] = 256
+    _trees: ClassVar["OrderedDict[Tuple[str, bool], Optional[List[Dict[str, Any]]]]"] = OrderedDict()
+    _trees_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    _listings: ConditionalGet = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        """Set up the repository and the revalidated ref lookups."""
+        super().__post_init__()
+        self._listings = ConditionalGet(self._gh_repo._requester)
+
+    async def __call__(
+        self,
+        ref: Optional[str] = None,
+        path: str = "",
+        pattern: Optional[str] = None,
+        max_results: int = 1000,
+    ) -> Dict[str, Any]:
+        """List the files and directories under `path` at `ref`, a branch, tag or SHA (default branch if omitted).
+
+        `pattern` is a glob matched against whole repository paths, e.g. "src/**/*.py" or "**/README.md",
+        directories that cannot hold a match are not listed. When root_dir is a clone that has fetched
+        `ref`, the tree is read locally. Otherwise the recursive listing of a tree is requested once per
+        tree SHA, and trees too large for one response are listed one directory at a time.
+
+        Returns:
+            Dict[str, Any]: The `ref`, the `sha` of the listed tree, its `entries` (`path`, `type`
+            "blob", "tree" or "commit" for submodules, and `size` of blobs) and whether more than
+            `max_results` entries matched (`truncated`).
+
+        Raises:
+            ValueError: If there is no directory at path.
+
+        """
+        path = path.strip("/")
+        regex = glob_regex(pattern) if pattern else None
+        local = self.local_checkout
+        commit = local.resolve(ref) if local is not None else None
+        entries: Iterator[Dict[str, Any]]
+        if local is not None and commit is not None:
+            listing = local.tree(commit, path, descend=lambda directory: _may_contain_matches(directory, pattern))
+            if listing is None:
+                raise ValueError(f"No directory {path} at {ref or 'the default branch'}.")
+            sha, entries = listing
+        else:
+            sha = self._tree_sha(ref, path)
+            entries = self._walk(sha, f"{path}/" if path else "", pattern)
+        matches = (entry for entry in entries if regex is None or regex.match(entry["path"]))
+        listed = list(islice(matches, max_results + 1))
+        for entry in listed:
+            if entry["type"] != "blob":
+                entry.pop("size", None)
+        return {"ref": ref, "sha": sha, "entries": listed[:max_results], "truncated": len(listed) > max_results}
+
+    def _tree_sha(self, ref: Optional[str], path: str) -> str:
+        # the top-level listing of a ref is revalidated, the trees below are immutable
+        _, _, data = self._listings(f"{self._gh_repo.url}/git/trees/{quote(ref or self._gh_repo.default_branch)}")
+        sha = data["sha"]
+        self._store((sha, False), data["tree"])
+        for name in path.split("/") if path else []:
+            entry = next((entry for entry in self._tree(sha) or [] if entry["path"] == name), None)
+            if entry is None or entry["type"] != "tree":
+                raise ValueError(f"No directory {path} at {ref or 'the default branch'}.")
+            sha = entry["sha"]
+        return sha
+
+    def _walk(self, sha: str, prefix: str, pattern: Optional[str]) -> Iterator[Dict[str, Any]]:
+        entries = self._tree(sha, recursive=True)
+        if entries is not None:
+            for entry in entries:
+                yield {"path": f"{prefix}{entry['path']}", "type": entry["type"], "size": entry.get("size")}
+            return
+        # the recursive listing was truncated, directories are listed one at a time
+        for entry in self._tree(sha) or []:
+            path = f"{prefix}{entry['path']}"
+            yield {"path": path, "type": entry["type"], "size": entry.get("size")}
+            if entry["type"] == "tree" and _may_contain_matches(path, pattern):
+                yield from self._walk(entry["sha"], f"{path}/", pattern)
+
+    def _tree(self, sha: str, recursive: bool = False) -> Optional[List[Dict[str, Any]]]:
+        # the entries of a tree, or None for a recursive listing GitHub truncated
+        key = (sha, recursive)
+        with self._trees_lock:
+            if key in self._trees:
+                self._trees.move_to_end(key)
+                return self._trees[key]
+            # the top level of a tree is part of its recursive listing
+            entries = self._trees.get((sha, True))
+            if not recursive and entries is not None:
+                return [entry for entry in entries if "/" not in entry["path"]]
+        tree = self._gh_repo.get_git_tree(sha, recursive=recursive or NotSet)
+        entries = None if tree.truncated else [element.raw_data for element in tree.tree]
+        self._store(key, entries)
+        return entries
+
+    @classmethod
+    def _store(cls, key: Tuple[str, bool], entries: Optional[List[Dict[str, Any]]]) -> None:
+        with cls._trees_lock:
+            cls._trees[key] = entries
+            cls._trees.move_to_end(key)
+            while len(cls._trees) > cls.max_cached_trees:
+                cls._trees.popitem(last=False)
+
+    @classmethod
+    def clear_trees(cls) -> None:
+        """Drop all cached tree listings."""
+        with cls._trees_lock:
+            cls._trees.clear()
+
+
+# the commit a ref points to, and when asked, the blame of a file at that commit
+_BLAME_QUERY = """
+query ($owner: String!, $name: String!, $expression: String!, $path: String!, $withBlame: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      oid
+      ... on Commit {
+        blame(path: $path) @include(if: $withBlame) {
+          ranges {
+            startingLine
+            endingLine
+            commit { oid messageHeadline authoredDate author { name email user { login } } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_FULL_SHA = re.compile(r"[0-9a-f]{40}\Z")
+
+# the line ranges of a blame, and the commits they were last changed by, by SHA
+_Blame = Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class BlameFileOp(GitHubOperation):
+    """Operation to tell the commit that last changed each line of a file of a GitHub repository."""
+
+    name = "blame_file"
+
+    # blames by (commit SHA, path), a commit SHA names the file and its history so they never go stale
+    max_cached_blames: ClassVar[int] = 128
+    _blames: ClassVar["OrderedDict[Tuple[str, str], _Blame]"] = OrderedDict()
+    _blames_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    async def __call__(
+        self,
+        path: str,
+        ref: Optional[str] = None,
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Blame a file at `ref`, a branch, tag or commit SHA (default branch if omitted).
+
+        Only the lines from `start_line` to `end_line` (inclusive, numbered from 1) are returned
+        when given. When root_dir is a clone that has fetched `ref`, git blames the file locally,
+        otherwise the GraphQL blame API does. Blames are kept by commit SHA and path, a blame read
+        before only costs the lookup of the commit `ref` points to, none for a full commit SHA.
+
+        Returns:
+            Dict[str, Any]: The `path`, `ref`, commit `sha`, the `ranges` of lines (`start_line`,
+            `end_line` and the `sha` of the commit that last changed them) and the `commits` of the
+            ranges by SHA, with their `message` headline, `author`, `email`, GitHub `login` (None
+            for local blames) and `date`.
+
+        Raises:
+            ValueError: If the line range is invalid, or there is no such ref or file.
+
+        """
+        path = path.strip("/")
+        if (start_line is not None and start_line < 1) or (end_line is not None and end_line < (start_line or 1)):
+            raise ValueError(f"Invalid line range {start_line}-{end_line}, lines are numbered from 1.")
+        local = self.local_checkout
+        commit = local.resolve(ref) if local is not None else None
+        if local is not None and commit is not None:
+            sha = commit.hexsha
+            blame = self._cached(sha, path)
+            if blame is None:
+                blame = local.blame(commit, path)
+                if blame is None:
+                    raise ValueError(f"No file {path} at {ref or 'the default branch'}.")
+                self._store((sha, path), blame)
+        else:
+            sha, blame = self._remote_blame(ref, path)
+        ranges, commits = blame
+        first, last = start_line or 1, end_line or sys.maxsize
+        selected = [
+            {**found, "start_line": max(found["start_line"], first), "end_line": min(found["end_line"], last)}
+            for found in ranges
+            if found["end_line"] >= first and found["start_line"] <= last
+        ]
+        return {
+            "path": path,
+            "ref": ref,
+            "sha": sha,
+            "ranges": selected,
+            "commits": {found["sha"]: commits[found["sha"]] for found in selected},
+        }
+
+    def _remote_blame(self, ref: Optional[str], path: str) -> Tuple[str, _Blame]:
+        owner, name = self._gh_repo.full_name.split("/")
+        expression = ref or self._gh_repo.default_branch
+        sha = expression.lower() if _FULL_SHA.match(expression.lower()) else None
+        if sha is None:
+            # branches and tags move, the commit they point to is looked up on every call, annotated
+            # tags are peeled to their commit
+            sha = self._query(owner, name, f"{expression}^{{commit}}", path, with_blame=False)["oid"]
+        blame = self._cached(sha, path)
+        if blame is not None:
+            return sha, blame
+        try:
+            found = self._query(owner, name, sha, path, with_blame=True)["blame"]
+        except UnknownObjectException:
+            raise ValueError(f"No file {path} at {ref or 'the default branch'}.") from None
+        ranges: List[Dict[str, Any]] = []
+        commits: Dict[str, Dict[str, Any]] = {}
+        for element in found["ranges"]:
+            commit = element["commit"]
+            ranges.append({
+                "start_line": element["startingLine"],
+                "end_line": element["endingLine"],
+                "sha": commit["oid"],
+            })
+            author = commit.get("author") or {}
+            commits[commit["oid"]] = {
+                "message": commit["messageHeadline"],
+                "author": author.get("name"),
+                "email": author.get("email"),
+                "login": (author.get("user") or {}).get("login"),
+                "date": commit["authoredDate"],
+            }
+        blame = (ranges, commits)
+        self._store((sha, path), blame)
+        return sha, blame
+
+    def _query(self, owner: str, name: str, expression: str, path: str, with_blame: bool) -> Dict[str, Any]:
+        variables = {"owner": owner, "name": name, "expression": expression, "path": path, "withBlame": with_blame}
+        _, data = self._gh_repo._requester.graphql_query(_BLAME_QUERY, variables)
+        found = (data["data"]["repository"] or {}).get("object")
+        if found is None or (with_blame and "blame" not in found):
+            raise ValueError(f"No commit {expression} in {owner}/{name}.")
+        return found
+
+    @classmethod
+    def _cached(cls, sha: str, path: str) -> Optional[_Blame]:
+        with cls._blames_lock:
+            blame = cls._blames.get((sha, path))
+            if blame is not None:
+                cls._blames.move_to_end((sha, path))
+        return blame
+
+    @classmethod
+    def _store(cls, key: Tuple[str, str], blame: _Blame) -> None:
+        with cls._blames_lock:
+            cls._blames[key] = blame
+            cls._blames.move_to_end(key)
+            while len(cls._blames) > cls.max_cached_blames:
+                cls._blames.popitem(last=False)
+
+    @classmethod
+    def clear_blames(cls) -> None:
+        """Drop all cached blames."""
+        with cls._blames_lock:
+            cls._blames.clear()
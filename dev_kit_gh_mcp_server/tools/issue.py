@@ -1,17 +1,24 @@
 """GitHub issue tool module."""
 
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
 
 from github.Issue import Issue
+from github.IssueComment import IssueComment
 
 from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.core.snapshots import Snapshots, baseline, changes
+from dev_kit_gh_mcp_server.core.stale import with_new_item
+from dev_kit_gh_mcp_server.tools.repo import ListIssuesOp
 
 
 @dataclass
 class CreateIssueOp(GitHubOperation):
     """Operation to create an issue in a GitHub repository."""
 
+    name = "create_issue"
+
     async def __call__(
         self,
         title: str,
@@ -21,6 +28,10 @@ class CreateIssueOp(GitHubOperation):
     ) -> Issue:
         """Create a new issue in the repository.
 
+        Labels and assignees are validated against the repository before the issue is created.
+        Issue listings read before are updated with the new issue, and served without a request
+        for a minute.
+
         Returns:
             Issue: The created issue object.
 
@@ -28,9 +39,10 @@ class CreateIssueOp(GitHubOperation):
         issue = self._gh_repo.create_issue(
             title=title,
             body=body,
-            assignees=assignees,
-            labels=labels,
+            assignees=self.metadata.resolve_assignees(assignees) if assignees else assignees,
+            labels=self.metadata.resolve_labels(labels) if labels else labels,
         )
+        self.write_through(ListIssuesOp, ListIssuesOp.with_new_issue(issue))
         return issue
 
 
@@ -38,27 +50,87 @@ class CreateIssueOp(GitHubOperation):
 class ReadIssueCommentsOp(GitHubOperation):
     """Operation to read comments from a GitHub issue."""
 
-    async def __call__(self, issue_number: int) -> list:
-        """Read all comments for a given issue number.
+    name = "read_issue_comments"
+    serve_stale: ClassVar[bool] = True
+
+    async def __call__(
+        self,
+        issue_number: int,
+        since: Optional[datetime] = None,
+        author: Optional[str] = None,
+        max_results: Optional[int] = None,
+        order: str = "asc",
+        delta: bool = False,
+        since_snapshot: Optional[str] = None,
+    ) -> Union[list, Dict[str, Any]]:
+        """Read comments for a given issue number.
+
+        `since` (last update time) is filtered by the API, `author` (login) is filtered while paging,
+        and paging stops once `max_results` comments were found. `order` is "asc" or "desc" (newest first).
+        `delta` returns `{"snapshot": token, "items": [...]}`, passing the token back as
+        `since_snapshot`, with the same filters, returns only the comments added or edited since, as
+        `{"snapshot": new token, "added": [...], "updated": [...], "closed": []}`. Only the comments
+        updated since are requested, deleted comments are not reported.
 
         Returns:
-            list: A list of issue comments.
+            Union[list, Dict[str, Any]]: A list of issue comments, or the snapshot and changes in delta mode.
 
         """
-        issue = self._gh_repo.get_issue(number=issue_number)
-        return list(issue.get_comments())
+        scope = self.snapshot_scope(issue_number=issue_number, since=since, author=author)
+        started = datetime.now(timezone.utc)
+        snapshot = Snapshots.get(since_snapshot, scope) if since_snapshot is not None else None
+        if snapshot is not None:
+            since = max(self.as_utc(since) or snapshot.since, snapshot.since)
+        issue = self.lazy_child(Issue, f"issues/{issue_number}", number=issue_number)
+        comments = issue.get_comments(**self.uncrooked_params(since=self.as_utc(since)))
+        if snapshot is not None:
+            updated = self.take(comments, where=self.authored_by(author))
+            return changes(updated, snapshot, started, key=lambda comment: comment.id)
+        listed = self.take(self.ordered(comments, order), max_results, where=self.authored_by(author))
+        return baseline(listed, scope, started, key=lambda comment: comment.id) if delta else listed
+
+    @staticmethod
+    def with_new_comment(issue_number: int, comment: IssueComment) -> Callable[[Dict[str, Any], Any], Any]:
+        """Patch the stored comments of an issue or pull request with a comment just written, see ``write_through``.
+
+        Args:
+            issue_number: The number of the issue or pull request.
+            comment: The comment returned by GitHub.
+
+        Returns:
+            A function of the arguments and result of a call, returning the comments with the new
+            one if the call reads them.
+
+        """
+        author = comment.user.login.lower() if comment.user else None
+
+        def patch(arguments: Dict[str, Any], listed: Any) -> Any:
+            if arguments["issue_number"] != issue_number or not isinstance(listed, list):
+                return listed
+            if (arguments["author"] or "").lower() not in ("", author):
+                return listed
+            return with_new_item(listed, comment, arguments["order"] == "desc", arguments["max_results"])
+
+        return patch
 
 
 @dataclass
 class WriteIssueCommentOp(GitHubOperation):
     """Operation to write a comment to a GitHub issue."""
 
+    name = "write_issue_comment"
+
     async def __call__(self, issue_number: int, body: str) -> object:
         """Write a comment to the specified issue.
 
+        The comments of the issue read before are updated with the new comment, and served without
+        a request for a minute.
+
         Returns:
             object: The created comment object.
 
         """
         issue = self._gh_repo.get_issue(number=issue_number)
-        return issue.create_comment(body)
+        comment = issue.create_comment(body)
+        self.write_through(ReadIssueCommentsOp, ReadIssueCommentsOp.with_new_comment(issue_number, comment))
+        return comment
@@ -0,0 +1,376 @@
+"""GitHub organization-wide tool module."""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from github.GithubException import GithubException, UnknownObjectException
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+from dev_kit_gh_mcp_server.core.circuit import is_outage
+from dev_kit_gh_mcp_server.core.conditional import next_link
+from dev_kit_gh_mcp_server.tools.search import summarize_issue
+
+# Fetches the items of a repository matching the query, most recent first, within the budget of the fan-out
+RepoQuery = Callable[[str, "_FanOutBudget"], Awaitable[List[Dict[str, Any]]]]
+
+
+def summarize_pull(pull: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a pull request to the fields an agent acts on.
+
+    Args:
+        pull: The pull request, as returned by the pulls API.
+
+    Returns:
+        The number, title, state, draft flag, author, requested reviewers, labels, head and base
+        branches, creation and update times and URL.
+
+    """
+    return {
+        "number": pull["number"],
+        "title": pull.get("title"),
+        "state": pull.get("state"),
+        "draft": pull.get("draft", False),
+        "author": (pull.get("user") or {}).get("login"),
+        "requested_reviewers": [user["login"] for user in pull.get("requested_reviewers") or []],
+        "labels": [label["name"] for label in pull.get("labels") or []],
+        "head": (pull.get("head") or {}).get("ref"),
+        "base": (pull.get("base") or {}).get("ref"),
+        "created_at": pull.get("created_at"),
+        "updated_at": pull.get("updated_at"),
+        "html_url": pull.get("html_url"),
+    }
+
+
+class _FanOutBudget:
+    # requests a fan-out may still send, shared by its concurrent repository queries
+
+    def __init__(self, max_requests: int, reserve: int) -> None:
+        self.max_requests = max_requests
+        self.reserve = reserve
+        self.sent = 0
+        self.remaining: Optional[int] = None
+        # whether a repository query stopped paging while it had more items
+        self.more = False
+
+    def available(self) -> bool:
+        return self.sent < self.max_requests and (self.remaining is None or self.remaining > self.reserve)
+
+    def spend(self) -> bool:
+        if not self.available():
+            return False
+        self.sent += 1
+        return True
+
+    def record(self, headers: Dict[str, Any]) -> None:
+        if "x-ratelimit-remaining" in headers and headers.get("x-ratelimit-resource", "core") == "core":
+            self.remaining = int(headers["x-ratelimit-remaining"])
+
+
+@dataclass
+class _OrgOp(AsyncGitHubOperation):
+    """Shared enumeration of the repositories of an organization and concurrent fan-out over them."""
+
+    # Repository queries in flight at once, and requests a call may send
+    concurrency: ClassVar[int] = 8
+    max_requests: ClassVar[int] = 300
+    # Requests of the rate limit left for other clients, a fan-out stops before spending them
+    rate_limit_reserve: ClassVar[int] = 200
+    # Seconds the repositories of an organization are reused
+    repositories_ttl: ClassVar[float] = 600.0
+    max_pages_per_repo: ClassVar[int] = 3
+
+    # (time listed, full names of the active repositories, most recently pushed first) by credentials and owner
+    _org_repositories: ClassVar[Dict[Tuple[str, str, str], Tuple[float, List[str]]]] = {}
+    _org_repositories_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def default_org(self) -> str:
+        """Return the owner of the operation's repository.
+
+        Returns:
+            The organization or user login.
+
+        """
+        return self._gh_repo.url.split("/repos/", 1)[1].split("/")[0]
+
+    async def repositories(self, org: str) -> List[str]:
+        """Return the repositories of an organization, or of a user, listed once and cached.
+
+        Archived repositories are left out.
+
+        Args:
+            org: The organization or user login.
+
+        Returns:
+            The full names of the repositories, most recently pushed first.
+
+        """
+        key = (*self.credential_key(), org.lower())
+        with self._org_repositories_lock:
+            cached = self._org_repositories.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.repositories_ttl:
+            return cached[1]
+        try:
+            listed = await self._list_repositories(f"/orgs/{org}/repos", {"type": "all"})
+        except UnknownObjectException:
+            listed = await self._list_repositories(f"/users/{org}/repos", {"type": "owner"})
+        listed.sort(key=lambda repo: repo.get("pushed_at") or "", reverse=True)
+        names = [repo["full_name"] for repo in listed if not repo.get("archived")]
+        with self._org_repositories_lock:
+            self._org_repositories[key] = (time.monotonic(), names)
+        return names
+
+    async def _list_repositories(self, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        repos: List[Dict[str, Any]] = []
+        next_url: Optional[str] = url
+        page_params: Optional[Dict[str, Any]] = {**params, "per_page": 100}
+        while next_url is not None:
+            headers, data = await self.request_json("GET", next_url, params=page_params)
+            repos.extend(data)
+            next_url, page_params = next_link(headers), None
+        return repos
+
+    @classmethod
+    def clear_org_repositories(cls) -> None:
+        """Forget the listed repositories of all organizations."""
+        with cls._org_repositories_lock:
+            cls._org_repositories.clear()
+
+    async def fetch_pages(
+        self,
+        budget: _FanOutBudget,
+        url: str,
+        params: Dict[str, Any],
+        wanted: int,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the pages of a repository listing until enough items match, within the budget.
+
+        Args:
+            budget: The budget of the fan-out.
+            url: The listing URL.
+            params: Query parameters of the first page.
+            wanted: Number of matching items after which paging stops.
+            where: Optional predicate the items must match.
+
+        Returns:
+            The matching items, ``budget.more`` is set when paging stopped before the last page.
+
+        """
+        items: List[Dict[str, Any]] = []
+        next_url: Optional[str] = url
+        page_params: Optional[Dict[str, Any]] = params
+        for _ in range(self.max_pages_per_repo):
+            if next_url is None or len(items) >= wanted or not budget.spend():
+                break
+            headers, data = await self.request_json("GET", next_url, params=page_params)
+            budget.record(headers)
+            items.extend(filter(where, data))
+            next_url, page_params = next_link(headers), None
+        if next_url is not None or len(items) > wanted:
+            budget.more = True
+        return items[:wanted]
+
+    async def fan_out(
+        self,
+        org: Optional[str],
+        repos: Optional[List[str]],
+        max_repos: int,
+        max_results: int,
+        sort_key: str,
+        query: RepoQuery,
+    ) -> Dict[str, Any]:
+        """Run a query on many repositories concurrently, merging the results as they arrive.
+
+        Only the ``max_results`` most recent items are held while the queries run.
+
+        Args:
+            org: The organization or user login, defaults to the owner of the operation's repository.
+            repos: Optional repository names, short or full, restricting the fan-out.
+            max_repos: Maximum number of repositories queried, the most recently pushed first.
+            max_results: Number of items returned.
+            sort_key: Field of the items the results are sorted by, newest first.
+            query: Coroutine function fetching the items of a repository, given its full name and
+                the request budget of the fan-out.
+
+        Returns:
+            The `org`, the most recent `items` across repositories, each with its `repository`,
+            whether more items matched or were left unfetched (`truncated`), the number of `repositories` queried, the
+            repositories `skipped` because the request budget ran out, and the repositories whose
+            query `failed`, with the error.
+
+        """
+        org = org or self.default_org()
+        names = await self.repositories(org)
+        if repos:
+            wanted = {(name if "/" in name else f"{org}/{name}").lower() for name in repos}
+            names = [name for name in names if name.lower() in wanted]
+        names = names[: max(0, max_repos)]
+        budget = _FanOutBudget(self.max_requests, self.rate_limit_reserve)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        failed: Dict[str, str] = {}
+        skipped: List[str] = []
+
+        async def run(name: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                if not budget.available():
+                    skipped.append(name)
+                    return []
+                try:
+                    items = await query(name, budget)
+                except GithubException as error:
+                    failed[name] = str(error.data.get("message") if isinstance(error.data, dict) else error)
+                    return []
+                except Exception as error:
+                    # timeouts, connection errors and open circuits fail this repository only
+                    if not is_outage(error):
+                        raise
+                    failed[name] = str(error) or type(error).__name__
+                    return []
+                return [{**item, "repository": name} for item in items]
+
+        # a bounded min-heap of the most recent items, ties broken by arrival order
+        top: List[Tuple[str, int, Dict[str, Any]]] = []
+        counter = itertools.count()
+        matched = 0
+        # tasks start in order, the most recently pushed repositories are queried before the budget runs out
+        tasks = [asyncio.ensure_future(run(name)) for name in names]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for item in await finished:
+                    matched += 1
+                    entry = (item.get(sort_key) or "", -next(counter), item)
+                    if len(top) < max_results:
+                        heapq.heappush(top, entry)
+                    elif max_results > 0:
+                        heapq.heappushpop(top, entry)
+        finally:
+            # an unexpected error, or the cancellation of the call, stops the other queries
+            for task in tasks:
+                task.cancel()
+        return {
+            "org": org,
+            "items": [item for *_, item in sorted(top, reverse=True)],
+            "truncated": matched > len(top) or budget.more,
+            "repositories": len(names),
+            "skipped": sorted(skipped),
+            "failed": failed,
+        }
+
+
+@dataclass
+class ListOrgPRsOp(_OrgOp):
+    """Operation to list the pull requests of all repositories of a GitHub organization."""
+
+    name = "list_org_prs"
+
+    async def __call__(
+        self,
+        org: Optional[str] = None,
+        state: str = "open",
+        review_requested: Optional[str] = None,
+        author: Optional[str] = None,
+        base: Optional[str] = None,
+        repos: Optional[List[str]] = None,
+        max_repos: int = 100,
+        max_results: int = 30,
+    ) -> Dict[str, Any]:
+        """List the most recently updated pull requests across the repositories of an organization.
+
+        `org` defaults to the owner of the repository. The repositories are listed once and cached,
+        archived ones are skipped, `repos` restricts the query to some of them and `max_repos` queries
+        the most recently pushed ones. `state` is "open", "closed" or "all". `review_requested` keeps
+        pull requests awaiting the review of a login, `author` those opened by a login, `base` those
+        targeting a branch. Repositories are queried concurrently, under a shared request budget
+        that leaves part of the rate limit to other clients.
+
+        Returns:
+            Dict[str, Any]: The `org`, the `items` (number, title, state, author, requested reviewers,
+            labels, branches, times, URL and `repository`), newest update first, whether more matched
+            (`truncated`), the number of `repositories` queried, those `skipped` once the budget ran
+            out and those whose query `failed`.
+
+        Raises:
+            ValueError: If the state is not "open", "closed" or "all".
+
+        """
+        if state not in ("open", "closed", "all"):
+            raise ValueError(f"state must be 'open', 'closed' or 'all', got: {state}")
+        reviewer = review_requested.lower() if review_requested else None
+        login = author.lower() if author else None
+
+        def where(pull: Dict[str, Any]) -> bool:
+            if login is not None and ((pull.get("user") or {}).get("login") or "").lower() != login:
+                return False
+            requested = {user["login"].lower() for user in pull.get("requested_reviewers") or []}
+            return reviewer is None or reviewer in requested
+
+        async def query(repo: str, budget: _FanOutBudget) -> List[Dict[str, Any]]:
+            params = self.uncrooked_params(
+                state=state, base=base, sort="updated", direction="desc", per_page=min(100, max(1, max_results))
+            )
+            pulls = await self.fetch_pages(budget, f"/repos/{repo}/pulls", params, max_results, where)
+            return [summarize_pull(pull) for pull in pulls]
+
+        return await self.fan_out(org, repos, max_repos, max_results, "updated_at", query)
+
+
+@dataclass
+class ListOrgIssuesOp(_OrgOp):
+    """Operation to list the issues of all repositories of a GitHub organization."""
+
+    name = "list_org_issues"
+
+    async def __call__(
+        self,
+        org: Optional[str] = None,
+        state: str = "open",
+        labels: Optional[List[str]] = None,
+        assignee: Optional[str] = None,
+        creator: Optional[str] = None,
+        repos: Optional[List[str]] = None,
+        max_repos: int = 100,
+        max_results: int = 30,
+    ) -> Dict[str, Any]:
+        """List the most recently updated issues across the repositories of an organization.
+
+        `org` defaults to the owner of the repository. The repositories are listed once and cached,
+        archived ones are skipped, `repos` restricts the query to some of them and `max_repos` queries
+        the most recently pushed ones. `state` is "open", "closed" or "all", `labels` must all be set,
+        `assignee` ("none" or "*" too) and `creator` are logins, all filtered by GitHub. Pull requests
+        are left out. Repositories are queried concurrently, under a shared request budget that
+        leaves part of the rate limit to other clients.
+
+        Returns:
+            Dict[str, Any]: The `org`, the `items` (number, title, state, author, labels, assignees,
+            comments, times, URL and `repository`), newest update first, whether more matched
+            (`truncated`), the number of `repositories` queried, those `skipped` once the budget ran
+            out and those whose query `failed`.
+
+        Raises:
+            ValueError: If the state is not "open", "closed" or "all".
+
+        """
+        if state not in ("open", "closed", "all"):
+            raise ValueError(f"state must be 'open', 'closed' or 'all', got: {state}")
+
+        async def query(repo: str, budget: _FanOutBudget) -> List[Dict[str, Any]]:
+            params = self.uncrooked_params(
+                state=state,
+                labels=",".join(labels) if labels else None,
+                assignee=assignee,
+                creator=creator,
+                sort="updated",
+                direction="desc",
+                per_page=min(100, max(1, max_results)),
+            )
+            issues = await self.fetch_pages(
+                budget, f"/repos/{repo}/issues", params, max_results, lambda issue: "pull_request" not in issue
+            )
+            return [summarize_issue(issue) for issue in issues]
+
+        return await self.fan_out(org, repos, max_repos, max_results, "updated_at", query)
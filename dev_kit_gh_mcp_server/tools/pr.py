@@ -1,15 +1,22 @@
 """GitHub PR tool module."""
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import ClassVar, Optional
+
+from github.PullRequest import PullRequest
 
 from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.tools.issue import ReadIssueCommentsOp
+from dev_kit_gh_mcp_server.tools.repo import ListIssuesOp, ListPRsOp
 
 
 @dataclass
 class CreatePROp(GitHubOperation):
     """Operation to create a pull request in a GitHub repository."""
 
+    name = "create_pr"
+
     async def __call__(
         self,
         title: str,
@@ -20,6 +27,9 @@ class CreatePROp(GitHubOperation):
     ) -> object:
         """Create a new pull request in the repository.
 
+        Pull request listings read before are updated with the new pull request, and served without
+        a request for a minute.
+
         Returns:
             The created pull request object.
 
@@ -31,6 +41,9 @@ class CreatePROp(GitHubOperation):
             base=base,
             draft=draft,
         )
+        self.write_through(ListPRsOp, ListPRsOp.with_new_pull(pr))
+        # the issue listings include pull requests, they are read again
+        self.write_through(ListIssuesOp, lambda arguments, listed: listed if arguments["state"] == "closed" else None)
         return pr
 
 
@@ -38,42 +51,89 @@ class CreatePROp(GitHubOperation):
 class ReadPRCommentsOp(GitHubOperation):
     """Operation to read comments from a GitHub pull request."""
 
-    async def __call__(self, pr_number: int) -> list:
-        """Read all comments for a given pull request number.
+    name = "read_pr_comments"
+    serve_stale: ClassVar[bool] = True
+
+    async def __call__(
+        self,
+        pr_number: int,
+        since: Optional[datetime] = None,
+        author: Optional[str] = None,
+        max_results: Optional[int] = None,
+        order: str = "asc",
+    ) -> list:
+        """Read review comments for a given pull request number.
+
+        `since` (last update time) and `order` ("asc" or "desc", newest first) are applied by the API,
+        `author` (login) is filtered while paging, and paging stops once `max_results` comments were found.
 
         Returns:
             list: A list of pull request comments.
 
         """
-        pr = self._gh_repo.get_pull(number=pr_number)
-        return list(pr.get_comments())
+        pr = self.lazy_child(PullRequest, f"pulls/{pr_number}", number=pr_number)
+        comments = pr.get_review_comments(
+            **self.uncrooked_params(sort="created", direction=self.check_order(order), since=self.as_utc(since)),
+        )
+        return self.take(comments, max_results, where=self.authored_by(author))
 
 
 @dataclass
 class WritePRCommentOp(GitHubOperation):
     """Operation to write a comment to a GitHub pull request."""
 
+    name = "write_pr_comment"
+
     async def __call__(self, pr_number: int, body: str) -> object:
         """Write a comment to the specified pull request.
 
+        The comment is a conversation comment, like those of issues: the conversation of the pull
+        request read before with `read_issue_comments` is updated with it, and served without a
+        request for a minute.
+
         Returns:
             object: The created comment object.
 
         """
         pr = self._gh_repo.get_pull(number=pr_number)
-        return pr.create_issue_comment(body)
+        comment = pr.create_issue_comment(body)
+        self.write_through(ReadIssueCommentsOp, ReadIssueCommentsOp.with_new_comment(pr_number, comment))
+        return comment
 
 
 @dataclass
 class ListPRReviewsOp(GitHubOperation):
     """Operation to list all reviews for a GitHub pull request."""
 
-    async def __call__(self, pr_number: int) -> list:
-        """Return all reviews for the specified pull request.
+    name = "list_pr_reviews"
+
+    async def __call__(
+        self,
+        pr_number: int,
+        since: Optional[datetime] = None,
+        author: Optional[str] = None,
+        max_results: Optional[int] = None,
+        order: str = "asc",
+    ) -> list:
+        """Return reviews for the specified pull request.
+
+        The API has no filters for reviews, so with `since` (submission time) the reviews are paged
+        newest first and paging stops at the first older review. `author` (login) is filtered while
+        paging, and paging stops once `max_results` reviews were found. `order` is "asc" or "desc".
 
         Returns:
             list: A list of pull request reviews.
 
         """
-        pr = self._gh_repo.get_pull(number=pr_number)
-        return list(pr.get_reviews())
+        pr = self.lazy_child(PullRequest, f"pulls/{pr_number}", number=pr_number)
+        since = self.as_utc(since)
+        if since is None:
+            return self.take(self.ordered(pr.get_reviews(), order), max_results, where=self.authored_by(author))
+        self.check_order(order)
+        reviews = self.take(
+            self.ordered(pr.get_reviews(), "desc"),
+            max_results if order == "desc" else None,
+            where=self.authored_by(author),
+            until=lambda review: review.submitted_at is not None and review.submitted_at < since,
+        )
+        return reviews if order == "desc" else reviews[::-1][:max_results]
@@ -1,20 +1,30 @@
 """GitHub repo tool module."""
 
+import asyncio
+import json
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from urllib.parse import quote
 
+from github.Commit import Commit
 from github.Issue import Issue
 from github.PaginatedList import PaginatedList
 from github.PullRequest import PullRequest
+from github.Tag import Tag
 
-from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation, GitHubOperation
+from dev_kit_gh_mcp_server.core.snapshots import Snapshots, baseline, changes
+from dev_kit_gh_mcp_server.core.stale import with_new_item
 
 
 @dataclass
 class ListIssuesOp(GitHubOperation):
     """Operation to list issues in a GitHub repository."""
 
+    name = "list_issues"
+    serve_stale: ClassVar[bool] = True
+
     async def __call__(
         self,
         max_results: int = 10,
@@ -27,33 +37,105 @@ class ListIssuesOp(GitHubOperation):
         creator: Optional[str] = None,
         mentioned: Optional[str] = None,
         milestone: Optional[str] = None,
-    ) -> List[Issue]:
+        delta: bool = False,
+        since_snapshot: Optional[str] = None,
+    ) -> Union[List[Issue], Dict[str, Any]]:
         """List issues in a GitHub repository with filtering options.
 
+        `labels`, `assignee` and `milestone` (title or number, "none" or "*") are resolved against
+        the repository's labels, milestones and assignable users, unknown names are reported.
+        `delta` returns `{"snapshot": token, "items": [...]}`, passing the token back as
+        `since_snapshot`, with the same filters, returns only what changed since, as
+        `{"snapshot": new token, "added": [...], "updated": [...], "closed": [numbers]}`, where
+        closed issues no longer match `state`. Only the issues updated since are requested.
+
         Returns:
-            List[Issue]: List of issues matching the filter options.
+            Union[List[Issue], Dict[str, Any]]: List of issues matching the filter options, or
+            the snapshot and changes in delta mode.
 
         """
+        scope = self.snapshot_scope(
+            state=state,
+            labels=labels,
+            since=since,
+            assignee=assignee,
+            creator=creator,
+            mentioned=mentioned,
+            milestone=milestone,
+        )
+        started = datetime.now(timezone.utc)
+        snapshot = Snapshots.get(since_snapshot, scope) if since_snapshot is not None else None
+        if assignee not in (None, "none", "*"):
+            assignee = self.metadata.resolve_assignees([assignee])[0]
+        filters = self.uncrooked_params(
+            labels=self.metadata.resolve_labels(labels) if labels else None,
+            assignee=assignee,
+            creator=creator,
+            mentioned=mentioned,
+            milestone=self.metadata.resolve_milestone(milestone) if milestone else None,
+        )
+        if snapshot is not None:
+            # issues closed since the snapshot are listed too, to be reported as closed
+            since = max(self.as_utc(since) or snapshot.since, snapshot.since)
+            updated = self._gh_repo.get_issues(state="all", sort="updated", direction="desc", since=since, **filters)
+            return changes(
+                updated,
+                snapshot,
+                started,
+                key=lambda issue: issue.number,
+                matches=lambda issue: state == "all" or issue.state == state,
+            )
         issues = self._gh_repo.get_issues(
-            **self.uncrooked_params(
-                state=state,
-                labels=labels,
-                sort=sort,
-                direction=direction,
-                since=since,
-                assignee=assignee,
-                creator=creator,
-                mentioned=mentioned,
-                milestone=milestone,
-            ),
+            **self.uncrooked_params(state=state, sort=sort, direction=direction, since=since),
+            **filters,
         )
-        return list(issues)[:max_results]
+        listed = list(issues)[:max_results]
+        return baseline(listed, scope, started, key=lambda issue: issue.number) if delta else listed
+
+    @staticmethod
+    def with_new_issue(issue: Issue) -> Callable[[Dict[str, Any], Any], Any]:
+        """Patch the stored listings with an issue just created, see ``write_through``.
+
+        Args:
+            issue: The issue returned by GitHub.
+
+        Returns:
+            A function of the arguments and result of a call, returning the listing with the issue
+            if it matches the filters, or None for listings it cannot be placed in.
+
+        """
+        labels = {label.name.lower() for label in issue.labels or ()}
+        assignees = {user.login.lower() for user in issue.assignees or ()}
+        creator = issue.user.login.lower() if issue.user else None
+
+        def patch(arguments: Dict[str, Any], listed: Any) -> Any:
+            if not isinstance(listed, list):
+                # delta mode results are compared to snapshots, not patched
+                return listed
+            if arguments["sort"] not in ("created", "updated") or arguments["mentioned"]:
+                # the place of a new issue by comments, or whether its body mentions someone, is GitHub's call
+                return None
+            assignee = (arguments["assignee"] or "").lower()
+            matches = (
+                arguments["state"] in ("open", "all")
+                and {label.lower() for label in arguments["labels"] or ()} <= labels
+                and (assignee in ("", "none") if not assignees else assignee in ("", "*", *assignees))
+                and (arguments["creator"] or "").lower() in ("", creator)
+                and arguments["milestone"] in (None, "none")
+            )
+            if not matches:
+                return listed
+            return with_new_item(listed, issue, arguments["direction"] == "desc", arguments["max_results"])
+
+        return patch
 
 
 @dataclass
 class ListCommitsOp(GitHubOperation):
     """Operation to list commits in a GitHub repository."""
 
+    name = "list_commits"
+
     async def __call__(
         self,
         max_results: int = 10,
@@ -62,13 +144,22 @@ class ListCommitsOp(GitHubOperation):
         author: Optional[str] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> PaginatedList:
+    ) -> Union[PaginatedList, List[Commit]]:
         """List commits in a GitHub repository with filtering options.
 
+        When root_dir is a clone that has fetched `sha` (default branch if omitted), the commits are
+        read from the local history, without API requests. An `author` login, unknown to git,
+        is only matched by the API, an author email is matched locally.
+
         Returns:
-            PaginatedList: List of commits matching the filter options.
+            Union[PaginatedList, List[Commit]]: List of commits matching the filter options.
 
         """
+        local = self.local_checkout
+        if local is not None and (author is None or "@" in author):
+            rev = local.resolve(sha)
+            if rev is not None:
+                return local.commits(rev, max_results, path=path, author_email=author, since=since, until=until)
         commits = self._gh_repo.get_commits(
             **self.uncrooked_params(
                 sha=sha,
@@ -85,16 +176,24 @@ class ListCommitsOp(GitHubOperation):
 class ListTagsOp(GitHubOperation):
     """Operation to list tags in a GitHub repository."""
 
+    name = "list_tags"
+
     async def __call__(
         self,
         max_results: int = 10,
-    ) -> PaginatedList:
+    ) -> Union[PaginatedList, List[Tag]]:
         """List all tags in a GitHub repository.
 
+        When root_dir is a clone with tags, they are read locally, highest version first.
+
         Returns:
-            PaginatedList: List of tags in the repository.
+            Union[PaginatedList, List[Tag]]: List of tags in the repository.
 
         """
+        local = self.local_checkout
+        local_tags = local.tags(max_results) if local is not None else None
+        if local_tags is not None:
+            return local_tags
         tags = self._gh_repo.get_tags()
         return tags[:max_results]
 
@@ -103,6 +202,9 @@ class ListTagsOp(GitHubOperation):
 class ListPRsOp(GitHubOperation):
     """Operation to list Pull Requests in a GitHub repository."""
 
+    name = "list_prs"
+    serve_stale: ClassVar[bool] = True
+
     async def __call__(
         self,
         max_results: int = 10,
@@ -111,13 +213,36 @@ class ListPRsOp(GitHubOperation):
         direction: str = "desc",
         base: Optional[str] = None,
         head: Optional[str] = None,
-    ) -> List[PullRequest]:
+        delta: bool = False,
+        since_snapshot: Optional[str] = None,
+    ) -> Union[List[PullRequest], Dict[str, Any]]:
         """List pull requests in a GitHub repository with filtering options.
 
+        `delta` returns `{"snapshot": token, "items": [...]}`, passing the token back as
+        `since_snapshot`, with the same filters, returns only what changed since, as
+        `{"snapshot": new token, "added": [...], "updated": [...], "closed": [numbers]}`, where
+        closed pull requests no longer match `state`. Paging stops at the first pull request
+        not updated since.
+
         Returns:
-            List[PullRequest]: List of pull requests matching the filter options.
+            Union[List[PullRequest], Dict[str, Any]]: List of pull requests matching the filter
+            options, or the snapshot and changes in delta mode.
 
         """
+        scope = self.snapshot_scope(state=state, base=base, head=head)
+        started = datetime.now(timezone.utc)
+        if since_snapshot is not None:
+            snapshot = Snapshots.get(since_snapshot, scope)
+            updated = self._gh_repo.get_pulls(
+                **self.uncrooked_params(state="all", sort="updated", direction="desc", base=base, head=head),
+            )
+            return changes(
+                self.take(updated, until=lambda pull: self.as_utc(pull.updated_at) < snapshot.since),
+                snapshot,
+                started,
+                key=lambda pull: pull.number,
+                matches=lambda pull: state == "all" or pull.state == state,
+            )
         pulls = self._gh_repo.get_pulls(
             **self.uncrooked_params(
                 state=state,
@@ -127,4 +252,151 @@ class ListPRsOp(GitHubOperation):
                 head=head,
             ),
         )
-        return list(pulls)[:max_results]
+        listed = list(pulls)[:max_results]
+        return baseline(listed, scope, started, key=lambda pull: pull.number) if delta else listed
+
+    @staticmethod
+    def with_new_pull(pull: PullRequest) -> Callable[[Dict[str, Any], Any], Any]:
+        """Patch the stored listings with a pull request just created, see ``write_through``.
+
+        Args:
+            pull: The pull request returned by GitHub.
+
+        Returns:
+            A function of the arguments and result of a call, returning the listing with the pull
+            request if it matches the filters, or None for listings it cannot be placed in.
+
+        """
+        base = pull.base.ref if pull.base else None
+        heads = (pull.head.ref, pull.head.label) if pull.head else ()
+
+        def patch(arguments: Dict[str, Any], listed: Any) -> Any:
+            if not isinstance(listed, list):
+                # delta mode results are compared to snapshots, not patched
+                return listed
+            if arguments["sort"] not in ("created", "updated"):
+                return None
+            matches = (
+                arguments["state"] in ("open", "all")
+                and arguments["base"] in (None, base)
+                and (arguments["head"] is None or arguments["head"] in heads)
+            )
+            if not matches:
+                return listed
+            return with_new_item(listed, pull, arguments["direction"] == "desc", arguments["max_results"])
+
+        return patch
+
+
+def _fit(items: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+    # the longest prefix of items whose JSON encoding fits in budget bytes
+    kept: List[Dict[str, Any]] = []
+    for item in items:
+        budget -= len(json.dumps(item)) + 2
+        if budget < 0:
+            break
+        kept.append(item)
+    return kept
+
+
+def _size(items: List[Dict[str, Any]]) -> int:
+    return sum(len(json.dumps(item)) + 2 for item in items)
+
+
+@dataclass
+class CompareRefsOp(AsyncGitHubOperation):
+    """Operation to compare two branches, tags or commits of a GitHub repository."""
+
+    name = "compare_refs"
+
+    async def __call__(self, base: str, head: str, max_bytes: int = 20_000) -> Dict[str, Any]:
+        """Compare head to base: ahead/behind counts, commits since the merge base and per-file stats.
+
+        When root_dir is a clone that has fetched both refs, the comparison is computed by git,
+        without API requests. Commits are listed oldest first. The commits and files returned are
+        cut to fit the result in about `max_bytes` bytes of JSON, `omitted_commits` and
+        `omitted_files` count what was left out.
+
+        Returns:
+            Dict[str, Any]: The `status` ("ahead", "behind", "diverged" or "identical"), `ahead_by`,
+            `behind_by`, `merge_base`, `total_commits`, `commits` and `files`.
+
+        """
+        # about a hundred bytes per commit summary, no more commits than could be returned are listed
+        max_commits = max(1, min(250, max_bytes // 100))
+        comparison = None
+        local = self.local_checkout
+        if local is not None:
+            base_commit, head_commit = local.resolve(base), local.resolve(head)
+            if base_commit is not None and head_commit is not None:
+                comparison = await asyncio.to_thread(local.compare, base_commit, head_commit, max_commits)
+        if comparison is None:
+            comparison = await self.compare_api(base, head, max_commits)
+        return self.within_budget(comparison, max_bytes)
+
+    async def compare_api(self, base: str, head: str, max_commits: int) -> Dict[str, Any]:
+        """Compare two refs with the compare API.
+
+        Args:
+            base: The base ref.
+            head: The head ref.
+            max_commits: Number of commits requested, the oldest are listed first.
+
+        Returns:
+            The comparison, shaped like ``LocalCheckout.compare``.
+
+        """
+        _, data = await self.request_json(
+            "GET",
+            self.repo_url(f"compare/{quote(base, safe='')}...{quote(head, safe='')}"),
+            params={"page": 1, "per_page": max_commits},
+        )
+        files = []
+        for file in data.get("files") or []:
+            stats = {key: file[key] for key in ("filename", "status", "additions", "deletions", "changes")}
+            if file.get("previous_filename"):
+                stats["previous_filename"] = file["previous_filename"]
+            files.append(stats)
+        return {
+            "status": data["status"],
+            "ahead_by": data["ahead_by"],
+            "behind_by": data["behind_by"],
+            "merge_base": data["merge_base_commit"]["sha"],
+            "total_commits": data["total_commits"],
+            "commits": [
+                {
+                    "sha": commit["sha"],
+                    "message": commit["commit"]["message"].split("\n", 1)[0],
+                    "author": commit["commit"]["author"]["name"],
+                    "date": commit["commit"]["author"]["date"],
+                }
+                for commit in data["commits"]
+            ],
+            "files": files,
+        }
+
+    @staticmethod
+    def within_budget(comparison: Dict[str, Any], max_bytes: int) -> Dict[str, Any]:
+        """Cut the commits and files of a comparison to fit its JSON encoding in a size budget.
+
+        The budget left by the counts is shared between commits and files, a part one of them
+        does not use is left to the other.
+
+        Args:
+            comparison: The comparison.
+            max_bytes: The size budget.
+
+        Returns:
+            The comparison, with ``omitted_commits`` and ``omitted_files`` counts.
+
+        """
+        commits, files = comparison["commits"], comparison["files"]
+        result = {**comparison, "commits": [], "files": [], "omitted_commits": 0, "omitted_files": 0}
+        budget = max_bytes - len(json.dumps(result))
+        kept_commits = _fit(commits, budget // 2)
+        kept_files = _fit(files, budget - _size(kept_commits))
+        kept_commits = _fit(commits, budget - _size(kept_files))
+        result["commits"], result["files"] = kept_commits, kept_files
+        result["omitted_commits"] = comparison["total_commits"] - len(kept_commits)
+        result["omitted_files"] = len(files) - len(kept_files)
+        return result
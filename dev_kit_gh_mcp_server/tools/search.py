@@ -0,0 +1,289 @@
+"""GitHub issue and pull request search tool module."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from github.GithubException import RateLimitExceededException
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+from dev_kit_gh_mcp_server.core.conditional import next_link
+
+_CHOICES = {
+    "kind": ("issue", "pr"),
+    "state": ("open", "closed", "merged", "unmerged", "draft"),
+    "review": ("none", "required", "approved", "changes_requested"),
+    "linked": ("pr", "issue"),
+    "no": ("assignee", "label", "milestone", "project"),
+}
+
+
+def _check(name: str, value: str) -> str:
+    if value not in _CHOICES[name]:
+        raise ValueError(f"Invalid {name} {value!r}, choose among {list(_CHOICES[name])}.")
+    return value
+
+
+def _quoted(value: str) -> str:
+    return f'"{value}"' if any(character.isspace() or character in ',"' for character in value) else value
+
+
+def _moment(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _range(qualifier: str, after: Optional[datetime], before: Optional[datetime]) -> Optional[str]:
+    if after is not None and before is not None:
+        return f"{qualifier}:{_moment(after)}..{_moment(before)}"
+    if after is not None:
+        return f"{qualifier}:>={_moment(after)}"
+    if before is not None:
+        return f"{qualifier}:<={_moment(before)}"
+    return None
+
+
+def search_query(
+    repo: str,
+    text: Optional[str] = None,
+    kind: Optional[str] = None,
+    state: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    any_labels: Optional[List[str]] = None,
+    no: Optional[List[str]] = None,
+    author: Optional[str] = None,
+    assignee: Optional[str] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    review: Optional[str] = None,
+    linked: Optional[str] = None,
+) -> str:
+    """Build the query of a search of the issues and pull requests of a repository.
+
+    Args:
+        repo: The repository full name, e.g. "octocat/Hello-World".
+        text: Words to search for in titles, bodies and comments.
+        kind: "issue" or "pr".
+        state: "open", "closed", "merged", "unmerged" or "draft".
+        labels: Labels that must all be set.
+        any_labels: Labels of which at least one must be set.
+        no: Missing metadata among "assignee", "label", "milestone" and "project".
+        author: Login of the author.
+        assignee: Login of an assignee.
+        updated_after: Earliest update time.
+        updated_before: Latest update time.
+        created_after: Earliest creation time.
+        created_before: Latest creation time.
+        review: Review status of pull requests, "none", "required", "approved" or "changes_requested".
+        linked: "pr" for issues linked to a pull request, "issue" for pull requests linked to an issue.
+
+    Returns:
+        The query, e.g. ``repo:octocat/Hello-World is:issue is:open label:"bug","crash" no:assignee``.
+
+    """
+    terms = [f"repo:{repo}"]
+    if text:
+        terms.append(text.strip())
+    if kind is not None:
+        terms.append(f"is:{_check('kind', kind)}")
+    if state is not None:
+        terms.append(f"is:{_check('state', state)}")
+    terms.extend(f"label:{_quoted(label)}" for label in labels or [])
+    if any_labels:
+        terms.append("label:" + ",".join(_quoted(label) for label in any_labels))
+    terms.extend(f"no:{_check('no', missing)}" for missing in no or [])
+    if author is not None:
+        terms.append(f"author:{author}")
+    if assignee is not None:
+        terms.append(f"assignee:{assignee}")
+    for qualifier, after, before in (
+        ("updated", updated_after, updated_before),
+        ("created", created_after, created_before),
+    ):
+        term = _range(qualifier, after, before)
+        if term is not None:
+            terms.append(term)
+    if review is not None:
+        terms.append(f"review:{_check('review', review)}")
+    if linked is not None:
+        terms.append(f"linked:{_check('linked', linked)}")
+    return " ".join(terms)
+
+
+def summarize_issue(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a search result to the fields an agent acts on.
+
+    Args:
+        item: The issue or pull request, as returned by the search API.
+
+    Returns:
+        The number, kind ("issue" or "pr"), title, state, author, labels, assignees, comment
+        count, creation and update times and URL.
+
+    """
+    return {
+        "number": item["number"],
+        "kind": "pr" if item.get("pull_request") else "issue",
+        "title": item.get("title"),
+        "state": item.get("state"),
+        "draft": item.get("draft", False),
+        "author": (item.get("user") or {}).get("login"),
+        "labels": [label["name"] for label in item.get("labels") or []],
+        "assignees": [user["login"] for user in item.get("assignees") or []],
+        "comments": item.get("comments"),
+        "created_at": item.get("created_at"),
+        "updated_at": item.get("updated_at"),
+        "html_url": item.get("html_url"),
+    }
+
+
+@dataclass
+class SearchIssuesOp(AsyncGitHubOperation):
+    """Operation to search the issues and pull requests of a GitHub repository."""
+
+    name = "search_issues"
+
+    # Results of the search API are capped, and searches have their own, much smaller, rate limit
+    max_search_results: ClassVar[int] = 1000
+    # Seconds a search waits for its rate limit to reset before failing
+    max_rate_limit_wait: ClassVar[float] = 10.0
+
+    # Search rate limit of each credential: remaining searches, limit and reset time
+    _search_budgets: ClassVar[Dict[Tuple[str, str], Tuple[int, int, float]]] = {}
+    _search_budgets_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    async def __call__(
+        self,
+        text: Optional[str] = None,
+        kind: Optional[str] = None,
+        state: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        any_labels: Optional[List[str]] = None,
+        no: Optional[List[str]] = None,
+        author: Optional[str] = None,
+        assignee: Optional[str] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        review: Optional[str] = None,
+        linked: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "desc",
+        max_results: int = 30,
+    ) -> Dict[str, Any]:
+        """Search the issues and pull requests of the repository, filtered by GitHub instead of listing them all.
+
+        `text` searches titles, bodies and comments. `kind` is "issue" or "pr", `state` "open", "closed",
+        "merged", "unmerged" or "draft". `labels` must all be set, at least one of `any_labels` must be.
+        `no` lists missing metadata among "assignee", "label", "milestone" and "project", e.g. ["assignee"]
+        for unassigned issues. `updated_*` and `created_*` bound the update and creation times. `review`
+        is "none", "required", "approved" or "changes_requested", `linked` is "pr" for issues with a linked
+        pull request or "issue" for pull requests linked to an issue. `sort` is "created", "updated",
+        "comments" or "reactions", best match first when omitted. Pages are requested until
+        `max_results` items were found. Searches have a separate rate limit of 30 per minute, a search
+        waits for it to reset for up to 10 seconds and otherwise fails, or stops paging.
+
+        Returns:
+            Dict[str, Any]: The `query` sent, the `total_count` of matches, the `items` found (number,
+            kind, title, state, author, labels, assignees, comments, times and URL), whether more matched
+            (`truncated`), whether GitHub timed out before finding all matches (`incomplete_results`)
+            and the remaining `search_rate_limit`.
+
+        """
+        query = search_query(
+            self._gh_repo.url.split("/repos/", 1)[1],
+            text=text,
+            kind=kind,
+            state=state,
+            labels=labels,
+            any_labels=any_labels,
+            no=no,
+            author=author,
+            assignee=assignee,
+            updated_after=self.as_utc(updated_after),
+            updated_before=self.as_utc(updated_before),
+            created_after=self.as_utc(created_after),
+            created_before=self.as_utc(created_before),
+            review=review,
+            linked=linked,
+        )
+        max_results = max(0, min(max_results, self.max_search_results))
+        params: Optional[Dict[str, Any]] = {"q": query, "per_page": max(1, min(100, max_results))}
+        if sort is not None:
+            params = {**params, "sort": sort, "order": self.check_order(order)}
+        items: List[Dict[str, Any]] = []
+        total_count, incomplete = 0, False
+        next_url: Optional[str] = "/search/issues"
+        while next_url is not None and len(items) < max_results:
+            if not await self._wait_for_budget(raise_when_exhausted=not items):
+                break
+            headers, data = await self.request_json("GET", next_url, params=params)
+            self._record_budget(headers)
+            params = None
+            total_count, incomplete = data["total_count"], incomplete or data.get("incomplete_results", False)
+            items.extend(data["items"])
+            next_url = next_link(headers)
+        return {
+            "query": query,
+            "total_count": total_count,
+            "items": [summarize_issue(item) for item in items[:max_results]],
+            "truncated": total_count > min(len(items), max_results),
+            "incomplete_results": incomplete,
+            "search_rate_limit": self.search_rate_limit(),
+        }
+
+    def _record_budget(self, headers: Dict[str, Any]) -> None:
+        if headers.get("x-ratelimit-resource", "search") != "search" or "x-ratelimit-remaining" not in headers:
+            return
+        budget = (
+            int(headers["x-ratelimit-remaining"]),
+            int(headers.get("x-ratelimit-limit", 30)),
+            float(headers.get("x-ratelimit-reset", 0)),
+        )
+        with self._search_budgets_lock:
+            self._search_budgets[self.credential_key()] = budget
+
+    async def _wait_for_budget(self, raise_when_exhausted: bool) -> bool:
+        # a spent budget is waited for when it resets soon, otherwise the search stops
+        with self._search_budgets_lock:
+            budget = self._search_budgets.get(self.credential_key())
+        if budget is None or budget[0] > 0:
+            return True
+        wait = budget[2] - time.time()
+        if wait <= 0:
+            return True
+        if wait <= self.max_rate_limit_wait:
+            await asyncio.sleep(wait)
+            return True
+        if raise_when_exhausted:
+            raise RateLimitExceededException(
+                403,
+                {"message": f"The search rate limit is exhausted, it resets in {wait:.0f} seconds."},
+                {"x-ratelimit-resource": "search", "x-ratelimit-reset": str(int(budget[2]))},
+            )
+        return False
+
+    def search_rate_limit(self) -> Optional[Dict[str, Any]]:
+        """Return the last known search rate limit of the operation's credentials.
+
+        Returns:
+            The `remaining` searches, the `limit` and the `reset` time, or None before the first search.
+
+        """
+        with self._search_budgets_lock:
+            budget = self._search_budgets.get(self.credential_key())
+        if budget is None:
+            return None
+        remaining, limit, reset = budget
+        return {
+            "remaining": remaining,
+            "limit": limit,
+            "reset": datetime.fromtimestamp(reset, timezone.utc).isoformat(),
+        }
@@ -3,11 +3,46 @@
 from pathlib import Path
 
 import pytest
+import responses
 from git import Repo
 
+from dev_kit_gh_mcp_server.core import CredentialPool, GitHubOperation, RepoMetadataIndex
+from dev_kit_gh_mcp_server.core.cassette import Cassette
+from dev_kit_gh_mcp_server.core.circuit import CircuitBreaker
+from dev_kit_gh_mcp_server.core.snapshots import Snapshots
+from dev_kit_gh_mcp_server.core.stale import StaleResults
+from dev_kit_gh_mcp_server.tools import BlameFileOp, ListOrgPRsOp, ListTreeOp
+from tests.mock_github import MockGitHub
+
 
 @pytest.fixture(scope="function")
 def temp_dir(tmp_path) -> str:
     """Create a temporary directory for testing."""
     Repo.init(tmp_path)
     return Path(tmp_path).as_posix()
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_state():
+    """Drop state shared between operations of the same repository."""
+    yield
+    RepoMetadataIndex.clear()
+    GitHubOperation.clear_repositories()
+    CredentialPool.clear()
+    ListTreeOp.clear_trees()
+    BlameFileOp.clear_blames()
+    ListOrgPRsOp.clear_org_repositories()
+    StaleResults.clear()
+    CircuitBreaker.reset_all()
+    Cassette.clear()
+    Snapshots.clear()
+
+
+@pytest.fixture
+def mock_github():
+    """A local mock of the GitHub API listening on 127.0.0.1."""
+    server = MockGitHub().start()
+    # requests sent by PyGithub reach the server even while ``responses`` mocks are active
+    responses.add_passthru(server.url)
+    yield server
+    server.stop()
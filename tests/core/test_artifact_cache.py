@@ -0,0 +1,54 @@
+import asyncio
+import os
+
+import pytest
+
+from dev_kit_gh_mcp_server.core.artifact_cache import ArtifactCache
+
+
+def writer(content):
+    async def download(file):
+        file.write(content)
+        return len(content)
+
+    return download
+
+
+@pytest.mark.asyncio
+async def test_least_recently_read_archives_are_evicted(tmp_path):
+    cache = ArtifactCache(tmp_path, max_bytes=250)
+    for age, key in enumerate(("first", "second")):
+        path = await cache.fetch(key, writer(bytes([age]) * 100))
+        os.utime(path, (age, age))
+    assert cache.get("first") is not None
+    await cache.fetch("third", writer(b"3" * 100))
+    assert cache.get("second") is None
+    assert [cache.get(key).read_bytes()[:1] for key in ("first", "third")] == [b"\0", b"3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_download_leaves_nothing_behind(tmp_path):
+    cache = ArtifactCache(tmp_path)
+
+    async def failing(file):
+        file.write(b"partial")
+        raise ValueError("too large")
+
+    with pytest.raises(ValueError, match="too large"):
+        await cache.fetch("broken", failing)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_are_counted_once(tmp_path):
+    cache = ArtifactCache(tmp_path, max_bytes=1000)
+    await cache.fetch("first", writer(b"1" * 100))
+
+    async def slow(file):
+        await asyncio.sleep(0.05)
+        return await writer(b"2" * 100)(file)
+
+    paths = await asyncio.gather(cache.fetch("second", slow), cache.fetch("second", slow))
+    assert paths[0] == paths[1]
+    assert cache._size == 200
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first.zip", "second.zip"]
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import pytest
+from github.GithubException import UnknownObjectException
+from github.PullRequest import PullRequest
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation
+
+
+@dataclass
+class AsyncListPRsOp(AsyncGitHubOperation):
+    """A tool opting into the async-native base, with the signature and result shape of ListPRsOp."""
+
+    async def __call__(self, max_results: int = 10, state: str = "open") -> list:
+        return await self.paginate(PullRequest, self.repo_url("pulls"), {"state": state}, max_results)
+
+
+@pytest.fixture
+def pulls_api(mock_github):
+    pulls = "/repos/octocat/Hello-World/pulls"
+    mock_github.add(
+        "GET",
+        f"{pulls}?per_page=100&state=open",
+        [{"number": 1, "title": "Add new feature"}, {"number": 2, "title": "Fix bug"}],
+        headers={"Link": f'<{{url}}{pulls}?state=open&page=2>; rel="next"'},
+    )
+    mock_github.add("GET", f"{pulls}?state=open&page=2", [{"number": 3, "title": "Docs"}])
+    return mock_github
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_links_and_stops_early(pulls_api):
+    op = AsyncListPRsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=pulls_api.url)
+    prs = await op(max_results=3)
+    assert [(pr.number, pr.title) for pr in prs] == [(1, "Add new feature"), (2, "Fix bug"), (3, "Docs")]
+    assert all(isinstance(pr, PullRequest) for pr in prs)
+    assert pulls_api.requests[0][2]["Authorization"] == "token fake-token"
+
+    pulls_api.requests.clear()
+    assert len(await op(max_results=2)) == 2
+    assert len(pulls_api.requests) == 1
+    await op.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises_github_exception(mock_github):
+    op = AsyncListPRsOp(root_dir="octocat/Missing", token="fake-token", base_url=mock_github.url)
+    with pytest.raises(UnknownObjectException):
+        await op()
+    await op.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_a_connection_pool(mock_github):
+    mock_github.add("GET", "/repos/octocat/Hello-World/pulls", [{"number": 1}], delay=0.2)
+    op = AsyncListPRsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(op() for _ in range(50)))
+    assert time.perf_counter() - start < 50 * 0.2 / 4
+    assert all(len(prs) == 1 for prs in results)
+
+    mock_github.connections.clear()
+    for _ in range(5):
+        await op()
+    assert len(mock_github.connections) == 1
+    await op.aclose_clients()
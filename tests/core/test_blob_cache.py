@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from dev_kit_gh_mcp_server.core.blob_cache import BlobCache, blob_sha
+
+
+def test_blob_sha_matches_git():
+    # git hash-object of "hello\n"
+    assert blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_least_recently_read_blobs_are_evicted(tmp_path):
+    cache = BlobCache(tmp_path, max_bytes=250)
+    blobs = [bytes([n]) * 100 for n in range(3)]
+    for age, content in enumerate(blobs[:2]):
+        cache.put(blob_sha(content), content)
+        os.utime(cache._path(blob_sha(content)), (age, age))
+    assert cache.get(blob_sha(blobs[0])) == blobs[0]
+    cache.put(blob_sha(blobs[2]), blobs[2])
+    assert cache.get(blob_sha(blobs[1])) is None
+    assert [cache.get(blob_sha(content)) for content in (blobs[0], blobs[2])] == [blobs[0], blobs[2]]
+    with pytest.raises(ValueError, match="does not match"):
+        cache.put(blob_sha(blobs[0]), blobs[1])
+
+
+def test_rewritten_blobs_are_counted_once(tmp_path):
+    cache = BlobCache(tmp_path, max_bytes=250)
+    content = b"a" * 100
+    cache.put(blob_sha(content), content)
+    for _ in range(3):
+        cache.put(blob_sha(content), content)
+    assert cache._size == 100
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [blob_sha(content)[2:]]
@@ -0,0 +1,121 @@
+import json
+import time
+
+import pytest
+
+from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.core.cassette import Cassette, CassetteMissError
+from dev_kit_gh_mcp_server.tools import ListIssuesOp, SearchIssuesOp
+
+REPO = "/repos/octocat/Hello-World"
+# nothing listens there, replayed calls must not reach the network
+OFFLINE = "http://127.0.0.1:9"
+
+
+@pytest.fixture
+def api(mock_github):
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add(
+        "GET",
+        f"{REPO}/issues",
+        [{"number": 1, "title": "First"}],
+        headers={"ETag": '"v1"', "Link": f'<{{url}}{REPO}/issues?page=2>; rel="next"'},
+    )
+    mock_github.add("GET", f"{REPO}/issues?page=2", [{"number": 2, "title": "Second"}])
+    mock_github.add(
+        "GET",
+        "/search/issues",
+        {"total_count": 1, "incomplete_results": False, "items": [{"number": 3, "title": "Found"}]},
+        headers={"X-RateLimit-Resource": "search", "X-RateLimit-Remaining": "29"},
+    )
+    return mock_github
+
+
+@pytest.fixture
+def use_cassette(tmp_path, monkeypatch):
+    path = tmp_path / "cassettes" / "issues.jsonl"
+
+    def use(mode, latency=None):
+        # operations created from now on record into, or replay, the cassette
+        Cassette.clear()
+        GitHubOperation.clear_repositories()
+        monkeypatch.setenv("DEV_KIT_GH_CASSETTE", str(path))
+        monkeypatch.setenv("DEV_KIT_GH_CASSETTE_MODE", mode)
+        if latency is not None:
+            monkeypatch.setenv("DEV_KIT_GH_CASSETTE_LATENCY", latency)
+        return path
+
+    return use
+
+
+@pytest.mark.asyncio
+async def test_pygithub_requests_replay_offline(api, use_cassette):
+    path = use_cassette("record")
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="secret-token", base_url=api.url)
+    recorded = [(issue.number, issue.title) for issue in await op()]
+    assert recorded == [(1, "First"), (2, "Second")]
+    cassette = path.read_text()
+    assert "secret-token" not in cassette
+    interactions = [json.loads(line) for line in cassette.splitlines()]
+    assert [interaction["request"] for interaction in interactions] == [
+        f"GET {REPO}",
+        f"GET {REPO}/issues?state=open&sort=created&direction=desc",
+        f"GET {REPO}/issues?page=2",
+    ]
+    headers = interactions[1]["headers"]
+    assert headers["ETag"] == '"v1"'
+    assert headers["Link"] == f'<{{origin}}{REPO}/issues?page=2>; rel="next"'
+    assert "Date" not in headers
+
+    sent = len(api.requests)
+    use_cassette("replay")
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=OFFLINE)
+    assert [(issue.number, issue.title) for issue in await op()] == recorded
+    assert len(api.requests) == sent
+    with pytest.raises(CassetteMissError, match="state=closed"):
+        await op(state="closed")
+
+
+@pytest.mark.asyncio
+async def test_httpx_requests_replay_with_latency(api, use_cassette):
+    use_cassette("record")
+    recorded = await SearchIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)(text="found")
+    await SearchIssuesOp.aclose_clients()
+    SearchIssuesOp._search_budgets.clear()
+
+    use_cassette("replay", latency="0.2")
+    op = SearchIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=OFFLINE)
+    started = time.perf_counter()
+    replayed = await op(text="found")
+    assert time.perf_counter() - started >= 0.2
+    await SearchIssuesOp.aclose_clients()
+    SearchIssuesOp._search_budgets.clear()
+    assert replayed == recorded
+    assert replayed["items"][0]["title"] == "Found"
+
+
+@pytest.mark.asyncio
+async def test_minted_tokens_are_redacted_and_media_types_kept_apart(api, use_cassette):
+    api.add("POST", "/app/installations/7/access_tokens", {"token": "ghs_secret", "expires_at": "2030-01-01T00:00:00Z"})
+    api.add("GET", f"{REPO}/pulls/1", {"number": 1})
+    path = use_cassette("record")
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    requester = op._gh_repo._requester
+    # installation tokens are minted by a requester of the App, through the same connections
+    _, minted = requester.requestJsonAndCheck("POST", "/app/installations/7/access_tokens")
+    assert minted["token"] == "ghs_secret"
+    requester.requestJsonAndCheck("GET", f"{REPO}/pulls/1")
+    requester.requestJsonAndCheck("GET", f"{REPO}/pulls/1", headers={"Accept": "application/vnd.github.diff"})
+    cassette = path.read_text()
+    assert "ghs_secret" not in cassette
+    assert [json.loads(line)["request"] for line in cassette.splitlines()][-2:] == [
+        f"GET {REPO}/pulls/1",
+        f"GET {REPO}/pulls/1 (application/vnd.github.diff)",
+    ]
+
+    use_cassette("replay")
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=OFFLINE)
+    with pytest.raises(CassetteMissError, match="vnd.github.patch"):
+        op._gh_repo._requester.requestJsonAndCheck(
+            "GET", f"{REPO}/pulls/1", headers={"Accept": "application/vnd.github.patch"}
+        )
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from dev_kit_gh_mcp_server.core.circuit import CircuitBreaker, CircuitOpenError
+from dev_kit_gh_mcp_server.tools import ListIssuesOp, WatchActivityOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github, monkeypatch):
+    monkeypatch.setattr(CircuitBreaker, "failure_threshold", 2)
+    monkeypatch.setattr(CircuitBreaker, "reset_timeout", 0.5)
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("GET", f"{REPO}/issues", {"message": "Server Error"}, status=502)
+    mock_github.add("GET", f"{REPO}/events", {"message": "Server Error"}, status=503)
+    return mock_github
+
+
+def test_breaker_opens_after_consecutive_failures_and_probes(monkeypatch):
+    monkeypatch.setattr(CircuitBreaker, "reset_timeout", 0.2)
+    breaker = CircuitBreaker("api.github.com")
+    for _ in range(CircuitBreaker.failure_threshold - 1):
+        breaker.record(False)
+    breaker.record(True)
+    breaker.record(False)
+    assert not breaker.is_open
+    for _ in range(CircuitBreaker.failure_threshold):
+        breaker.record(False)
+    with pytest.raises(CircuitOpenError, match="api.github.com failed 6 times in a row"):
+        breaker.before_request()
+    time.sleep(0.2)
+    # one probe is let through, the next requests fail fast until it succeeds
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(True)
+    breaker.before_request()
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_pygithub_requests_fast(api):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    for _ in range(2):
+        with pytest.raises(Exception) as error:
+            await op()
+        assert not isinstance(error.value, CircuitOpenError)
+    sent = len(api.requests)
+    with pytest.raises(CircuitOpenError):
+        await op()
+    assert len(api.requests) == sent
+    # the host recovered, the probe closes the circuit
+    api.add("GET", f"{REPO}/issues", [{"number": 1, "title": "Back"}])
+    time.sleep(0.5)
+    assert [issue.title for issue in await op()] == ["Back"]
+    assert not CircuitBreaker.for_url(api.url).is_open
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_async_requests_fast(api):
+    op = WatchActivityOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    for _ in range(2):
+        with pytest.raises(Exception) as error:
+            await op()
+        assert not isinstance(error.value, CircuitOpenError)
+    sent = len(api.requests)
+    with pytest.raises(CircuitOpenError):
+        await op()
+    assert len(api.requests) == sent
@@ -0,0 +1,17 @@
+from github import Github
+
+from dev_kit_gh_mcp_server.core.conditional import ConditionalGet
+
+API = "https://api.github.com:443/repos/octocat/Hello-World"
+
+
+def test_least_recently_requested_responses_are_evicted(responses, monkeypatch):
+    monkeypatch.setattr(ConditionalGet, "max_responses", 2)
+    for resource in ("labels", "milestones", "assignees"):
+        responses.add(responses.GET, f"{API}/{resource}", json=[], headers={"ETag": f'"{resource}"'})
+    get = ConditionalGet(Github("fake-token").get_repo("octocat/Hello-World", lazy=True)._requester)
+    for resource in ("labels", "milestones", "labels", "assignees", "labels", "milestones"):
+        get(f"/repos/octocat/Hello-World/{resource}")
+    revalidations = [call.request.headers.get("If-None-Match") for call in responses.calls]
+    # milestones was evicted by assignees, labels was kept as the most recently requested
+    assert revalidations == [None, None, '"labels"', None, '"labels"', None]
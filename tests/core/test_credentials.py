@@ -0,0 +1,117 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation, CredentialPool
+from dev_kit_gh_mcp_server.tools import ListTagsOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+def _rate_limited(remaining_by_token):
+    """Responses callback answering with the rate-limit budget of the request's token."""
+
+    def callback(request):
+        token = request.headers["Authorization"].split()[-1]
+        headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": str(remaining_by_token[token]),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": "core",
+        }
+        body = '{"full_name": "octocat/Hello-World", "url": "https://api.github.com/repos/octocat/Hello-World"}'
+        return 200, headers, body if request.url.endswith("World") else '[{"name": "v1.0.0"}]'
+
+    return callback
+
+
+@pytest.mark.asyncio
+async def test_pool_rotates_to_the_token_with_most_budget(responses):
+    for path in ("", "/tags"):
+        responses.add_callback(
+            responses.GET,
+            f"https://api.github.com:443{REPO}{path}",
+            callback=_rate_limited({"low": 10, "high": 4000}),
+        )
+    pool = CredentialPool.from_tokens(["low", "high"])
+    op = ListTagsOp(root_dir="octocat/Hello-World", credentials=pool)
+    for _ in range(3):
+        list(await op())
+    used = [call.request.headers["Authorization"] for call in responses.calls]
+    # the unused token is tried once, then the token with most budget is preferred
+    assert used == ["token low", "token high", "token high", "token high"]
+    assert pool.budgets() == [10, 4000]
+
+
+def test_pool_from_environment(monkeypatch, responses):
+    responses.add(responses.GET, f"https://api.github.com:443{REPO}", json={"full_name": "octocat/Hello-World"})
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("GITHUB_TOKENS", "first, second")
+    ops = [ListTagsOp(root_dir="octocat/Hello-World"), ListTagsOp(root_dir="octocat/Hello-World")]
+    assert ops[0]._auth is ops[1]._auth is CredentialPool.from_env()
+    assert ops[0]._gh_repo is ops[1]._gh_repo
+    assert responses.calls[0].request.headers["Authorization"] == "token first"
+
+
+def test_missing_credentials(monkeypatch):
+    for name in ("GITHUB_TOKEN", "GITHUB_TOKENS", "GITHUB_APP_ID"):
+        monkeypatch.delenv(name, raising=False)
+    with pytest.raises(ValueError, match="GitHub token is required"):
+        ListTagsOp(root_dir="octocat/Hello-World")
+
+
+@pytest.fixture
+def private_key():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+@pytest.fixture
+def token_endpoint(mock_github):
+    """A fake installation token endpoint minting tokens that expire within the refresh margin."""
+    minted = []
+
+    def mint(path):
+        minted.append(path)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        return {"token": f"ghs_{len(minted)}", "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+    mock_github.add("POST", "/app/installations/42/access_tokens", mint, status=201)
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("GET", f"{REPO}/tags", [{"name": "v1.0.0"}])
+    return mock_github, minted
+
+
+@dataclass
+class AsyncTagsOp(AsyncGitHubOperation):
+    async def __call__(self) -> list:
+        _, tags = await self.request_json("GET", self.repo_url("tags"))
+        return tags
+
+
+@pytest.mark.asyncio
+async def test_app_installation_tokens_are_minted_and_refreshed(token_endpoint, private_key):
+    server, minted = token_endpoint
+    pool = CredentialPool.for_app("123", private_key, [42])
+    op = ListTagsOp(root_dir="octocat/Hello-World", credentials=pool, base_url=server.url)
+    list(await op())
+    await AsyncTagsOp(root_dir="octocat/Hello-World", credentials=pool, base_url=server.url)()
+    requests = [(method, path, headers["Authorization"]) for method, path, headers, _ in server.requests]
+    assert requests[0][:2] == ("POST", "/app/installations/42/access_tokens")
+    assert requests[0][2].startswith("Bearer ")
+    # tokens expiring within the refresh margin are minted again before each request
+    assert [request[1:] for request in requests if request[0] == "GET"] == [
+        (REPO, "token ghs_1"),
+        (f"{REPO}/tags", "token ghs_2"),
+        (f"{REPO}/tags", "token ghs_3"),
+    ]
+    assert len(minted) == 3
+    # refreshed tokens replace the previous one of their installation
+    assert pool._authorizations == ["token ghs_3"]
+    await AsyncTagsOp.aclose_clients()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from dev_kit_gh_mcp_server.core.deadline import CallCancelledError, Deadline
+from dev_kit_gh_mcp_server.tools import ListIssuesOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github):
+    """Six pages of issues, each taking 0.1 seconds to serve, PyGithub waits 0.25 seconds between requests."""
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    for page in range(1, 7):
+        mock_github.add(
+            "GET",
+            f"{REPO}/issues" if page == 1 else f"{REPO}/issues?page={page}",
+            [{"number": page, "title": f"Issue {page}"}],
+            headers={"Link": f'<{{url}}{REPO}/issues?page={page + 1}>; rel="next"'} if page < 6 else {},
+            delay=0.1,
+        )
+    return mock_github
+
+
+def issue_requests(api):
+    return [path for method, path, *_ in api.requests if path.startswith(f"{REPO}/issues")]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_sends_no_more_requests(api):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    call = asyncio.ensure_future(op(max_results=100))
+    await asyncio.sleep(0.3)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    sent = len(issue_requests(api))
+    # the request in flight when the call was cancelled completes, no other page is requested
+    await asyncio.sleep(0.6)
+    assert len(issue_requests(api)) == sent < 6
+
+
+@pytest.mark.asyncio
+async def test_call_past_its_deadline_times_out(api, monkeypatch):
+    monkeypatch.setenv("DEV_KIT_GH_CALL_TIMEOUT", "0.8")
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    with pytest.raises(TimeoutError, match="ListIssuesOp did not finish within 0.8 seconds"):
+        await op(max_results=100)
+    await asyncio.sleep(0.6)
+    assert 1 < len(issue_requests(api)) <= 3
+
+
+@pytest.mark.asyncio
+async def test_calls_do_not_block_the_event_loop(api):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker = asyncio.ensure_future(tick())
+    issues = await op(max_results=100)
+    ticker.cancel()
+    assert [issue.number for issue in issues] == list(range(1, 7))
+    assert ticks >= 20
+
+
+def test_deadline():
+    deadline = Deadline(60)
+    assert 59 < deadline.remaining() <= 60
+    deadline.check()
+    deadline.cancel()
+    with pytest.raises(CallCancelledError):
+        deadline.check()
+    assert Deadline().remaining() is None
+    assert Deadline(0).cancelled
@@ -0,0 +1,46 @@
+import pytest
+from github import Github
+
+from dev_kit_gh_mcp_server.core import RepoMetadataIndex
+
+API = "https://api.github.com:443/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def metadata_api(responses):
+    responses.add(responses.GET, API, json={"url": API, "default_branch": "main"}, headers={"ETag": '"repo"'})
+    for resource, data in {
+        "labels": [{"name": "bug"}],
+        "milestones": [{"number": 1, "title": "v1.0"}],
+        "assignees": [{"login": "octocat"}],
+    }.items():
+        responses.add(responses.GET, f"{API}/{resource}", json=data, headers={"ETag": f'"{resource}"'})
+    return responses
+
+
+def test_refresh_revalidates_with_etags(metadata_api):
+    repo = Github("fake-token").get_repo("octocat/Hello-World", lazy=True)
+    index = RepoMetadataIndex(repo).refresh()
+    assert index.default_branch == "main"
+    assert index.resolve_labels(["BUG"]) == ["bug"]
+    for resource in ["", "/labels", "/milestones", "/assignees"]:
+        metadata_api.add(metadata_api.GET, f"{API}{resource}", status=304)
+    index.refresh(force=True)
+    revalidations = metadata_api.calls[4:]
+    assert [c.request.headers["If-None-Match"] for c in revalidations] == [
+        '"repo"',
+        '"labels"',
+        '"milestones"',
+        '"assignees"',
+    ]
+    assert index.resolve_milestone("1").title == "v1.0"
+    assert index.resolve_assignees(["OctoCat"]) == ["octocat"]
+
+
+def test_unknown_name_forces_one_revalidation(metadata_api):
+    repo = Github("fake-token").get_repo("octocat/Hello-World", lazy=True)
+    index = RepoMetadataIndex(repo)
+    with pytest.raises(ValueError, match="Unknown labels: feature"):
+        index.resolve_labels(["feature"])
+    assert len(metadata_api.calls) == 8
+    assert index.resolve_milestone("*") == "*"
@@ -0,0 +1,73 @@
+import json
+import os
+import pstats
+import tracemalloc
+
+import pytest
+from dev_kit_mcp_server.tool_factory import RepoFastMCPServerError, ToolFactory
+
+from dev_kit_gh_mcp_server.tools import ListIssuesOp, ListTagsOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github):
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("GET", f"{REPO}/tags", [{"name": "v1.0.0"}])
+    mock_github.add("GET", f"{REPO}/issues", [{"number": 1, "title": "Slow"}], delay=0.2)
+    return mock_github
+
+
+@pytest.fixture
+def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_THRESHOLD", "0.1")
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_SAMPLE_RATE", "1")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_reported(api, profile_dir):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    assert [issue.title for issue in await op(max_results=1)] == ["Slow"]
+    (report,) = profile_dir.iterdir()
+    assert report.name.endswith(f"-ListIssuesOp-{os.getpid()}")
+    call = json.loads((report / "call.json").read_text())
+    assert call["arguments"] == {"max_results": 1}
+    assert call["seconds"] >= 0.2
+    # blocking operations are profiled in their own thread and event loop
+    assert call["other_tasks"] == 0
+    assert [(request["method"], request["url"].split("?")[0]) for request in call["requests"]] == [
+        ("GET", f"{api.url}{REPO}/issues")
+    ]
+    assert pstats.Stats(str(report / "profile.pstats")).total_calls > 0
+    assert (report / "allocations.txt").read_text()
+
+
+@pytest.mark.asyncio
+async def test_fast_and_unsampled_calls_are_not_reported(api, profile_dir, monkeypatch):
+    op = ListTagsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_THRESHOLD", "60")
+    list(await op())
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_THRESHOLD", "0")
+    monkeypatch.setenv("DEV_KIT_GH_PROFILE_SAMPLE_RATE", "0")
+    list(await op())
+    assert not list(profile_dir.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_profiler_is_released_when_profiling_fails(api, profile_dir, monkeypatch):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    with monkeypatch.context() as patch:
+        patch.setattr(tracemalloc, "take_snapshot", lambda: (_ for _ in ()).throw(MemoryError()))
+        with pytest.raises(MemoryError):
+            await op(max_results=1)
+    await op(max_results=1)
+    assert len(list(profile_dir.iterdir())) == 1
+
+
+def test_profiled_tools_keep_their_schema(api):
+    op = ListTagsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    tool = ToolFactory(RepoFastMCPServerError(name="test")).create_tool(op)
+    assert "max_results" in tool.parameters["properties"]
@@ -0,0 +1,113 @@
+import time
+from dataclasses import dataclass
+
+import pytest
+from github.GithubException import RateLimitExceededException
+
+from dev_kit_gh_mcp_server.core import AsyncGitHubOperation, GitHubOperation, transport
+from dev_kit_gh_mcp_server.core.shared_cache import SharedCache
+from dev_kit_gh_mcp_server.tools import ListTagsOp, ListWorkflowRunsOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github):
+    headers = {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+    repo = {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"}
+    mock_github.add("GET", REPO, repo, headers={"ETag": '"repo-v1"', **headers})
+    mock_github.add("GET", f"{REPO}/tags", [{"name": "v1.0.0"}], headers={"ETag": '"tags-v1"', **headers})
+    return mock_github
+
+
+@pytest.fixture
+def use_cache():
+    """Install a cache as the only middleware, the way a worker process does."""
+    installed = []
+
+    def use(cache):
+        for previous in installed:
+            transport.remove_middleware(previous)
+        transport.add_middleware(cache)
+        installed.append(cache)
+        GitHubOperation.clear_repositories()
+
+    yield use
+    for cache in installed:
+        transport.remove_middleware(cache)
+
+
+@pytest.mark.asyncio
+async def test_workers_share_responses(api, use_cache, tmp_path):
+    path = tmp_path / "shared.sqlite"
+    for worker in (SharedCache(path), SharedCache(path)):
+        use_cache(worker)
+        op = ListTagsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+        assert [tag.name for tag in await op()] == ["v1.0.0"]
+    revalidations = [headers.get("If-None-Match") for _, _, headers, _ in api.requests]
+    # the second worker revalidates what the first one stored, and serves the body of the 304s
+    assert revalidations == [None, None, '"repo-v1"', '"tags-v1"']
+    assert oct(path.stat().st_mode & 0o777) == "0o600"
+
+
+@pytest.mark.asyncio
+async def test_spent_budget_is_shared(api, use_cache, tmp_path):
+    path = tmp_path / "shared.sqlite"
+    use_cache(SharedCache(path, reserve=10))
+    op = ListTagsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    # another worker spent the budget down to the reserve
+    credential = SharedCache._credential(transport.Request("GET", api.url, {"Authorization": "token fake-token"}))
+    SharedCache(path).record(credential, {"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(time.time() + 60)})
+    with pytest.raises(RateLimitExceededException):
+        list(await op())
+    assert [path for _, path, _, _ in api.requests] == [REPO]
+
+
+@pytest.mark.asyncio
+async def test_async_operations_share_responses_and_budget(api, use_cache, tmp_path):
+    runs = {"total_count": 1, "workflow_runs": [{"id": 9, "name": "CI", "status": "completed"}]}
+    headers = {"ETag": '"runs-v1"', "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+    api.add("GET", f"{REPO}/actions/runs", runs, headers=headers)
+    path = tmp_path / "shared.sqlite"
+    for worker in (SharedCache(path, reserve=10), SharedCache(path, reserve=10)):
+        use_cache(worker)
+        op = ListWorkflowRunsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+        assert [run["id"] for run in await op()] == [9]
+        await ListWorkflowRunsOp.aclose_clients()
+    # the second worker revalidates what the first one stored, and serves the body of the 304
+    assert [headers.get("If-None-Match") for _, _, headers, _ in api.requests] == [None, '"runs-v1"']
+    # PyGithub requests spend the budget left by the asyncio ones, with the same token
+    credential = SharedCache._credential(transport.Request("GET", api.url, {"Authorization": "token fake-token"}))
+    SharedCache(path).record(credential, {"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(time.time() + 60)})
+    with pytest.raises(RateLimitExceededException):
+        await ListWorkflowRunsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)()
+    assert len(api.requests) == 2
+
+
+@dataclass
+class AsyncTagsOp(AsyncGitHubOperation):
+    async def __call__(self) -> list:
+        _, tags = await self.request_json("GET", self.repo_url("tags"))
+        return tags
+
+
+@pytest.mark.asyncio
+async def test_pygithub_responses_are_served_to_asyncio_requests(api, use_cache, tmp_path):
+    use_cache(SharedCache(tmp_path / "shared.sqlite"))
+    kwargs = {"root_dir": "octocat/Hello-World", "token": "fake-token", "base_url": api.url}
+    assert [tag.name for tag in await ListTagsOp(**kwargs)()] == ["v1.0.0"]
+    assert await AsyncTagsOp(**kwargs)() == [{"name": "v1.0.0"}]
+    await AsyncTagsOp.aclose_clients()
+    tags = [headers.get("If-None-Match") for _, path, headers, _ in api.requests if path.startswith(f"{REPO}/tags")]
+    assert tags == [None, '"tags-v1"']
+
+
+def test_keys_ignore_default_ports_and_media_types():
+    pygithub = SharedCache.key("", "https://api.github.com:443/repos/octocat/Hello-World/tags")
+    assert pygithub == SharedCache.key(
+        "application/vnd.github+json", "https://api.github.com/repos/octocat/Hello-World/tags"
+    )
+    assert pygithub != SharedCache.key(
+        "application/vnd.github.raw", "https://api.github.com/repos/octocat/Hello-World/tags"
+    )
+    assert SharedCache.key("", "http://localhost:8080/api/v3") == " http://localhost:8080/api/v3"
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from dev_kit_gh_mcp_server.tools import ListIssuesOp, ListPRsOp, ReadIssueCommentsOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+def moment(minutes_ago=0):
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def item(number, state="open", updated_at=None):
+    return {"id": 100 + number, "number": number, "title": f"Item {number}", "state": state, "updated_at": updated_at}
+
+
+@pytest.fixture
+def api(mock_github):
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    return mock_github
+
+
+def queries(server, path):
+    return [parse_qs(urlsplit(sent).query) for _, sent, *_ in server.requests if urlsplit(sent).path == path]
+
+
+def numbers(items):
+    return [found.number for found in items]
+
+
+@pytest.mark.asyncio
+async def test_issue_changes_since_snapshot(api):
+    api.add("GET", f"{REPO}/issues", [item(1, updated_at=moment(60)), item(2, updated_at=moment(60))])
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    first = await op(delta=True)
+    assert numbers(first["items"]) == [1, 2]
+
+    # 3 was opened, 1 edited and 2 closed, 4 was opened and closed without the caller seeing it
+    api.add(
+        "GET",
+        f"{REPO}/issues",
+        [
+            item(3, updated_at=moment()),
+            item(1, updated_at=moment(1)),
+            item(2, state="closed", updated_at=moment(2)),
+            item(4, state="closed", updated_at=moment(3)),
+        ],
+    )
+    second = await op(since_snapshot=first["snapshot"])
+    assert numbers(second["added"]) == [3]
+    assert numbers(second["updated"]) == [1]
+    assert second["closed"] == [2]
+    query = queries(api, f"{REPO}/issues")[-1]
+    assert query["state"] == ["all"] and query["sort"] == ["updated"] and "since" in query
+
+    # the same listing again: nothing changed since the second snapshot
+    third = await op(since_snapshot=second["snapshot"])
+    assert (third["added"], third["updated"], third["closed"]) == ([], [], [])
+    with pytest.raises(ValueError, match="other filters"):
+        await op(state="closed", since_snapshot=third["snapshot"])
+    with pytest.raises(ValueError, match="Unknown or expired snapshot"):
+        await op(since_snapshot="unknown")
+
+
+@pytest.mark.asyncio
+async def test_pull_request_changes_stop_paging_at_older_updates(api):
+    api.add("GET", f"{REPO}/pulls", [item(1, updated_at=moment(60))])
+    op = ListPRsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    first = await op(delta=True)
+    api.add(
+        "GET",
+        f"{REPO}/pulls",
+        [item(2, updated_at=moment()), item(1, state="closed", updated_at=moment(1)), item(3, updated_at=moment(600))],
+        headers={"Link": f'<{{url}}{REPO}/pulls?page=2>; rel="next"'},
+    )
+    api.add("GET", f"{REPO}/pulls?page=2", [item(5, updated_at=moment(600))])
+    second = await op(since_snapshot=first["snapshot"])
+    assert numbers(second["added"]) == [2]
+    assert second["closed"] == [1]
+    # the first pull request not updated since the snapshot ends the listing
+    assert {"page": ["2"]} not in queries(api, f"{REPO}/pulls")
+
+
+@pytest.mark.asyncio
+async def test_comment_changes_since_snapshot(api):
+    comments = f"{REPO}/issues/7/comments"
+    api.add("GET", comments, [{"id": 1, "body": "First", "updated_at": moment(60)}])
+    op = ReadIssueCommentsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    first = await op(issue_number=7, delta=True)
+    assert [comment.body for comment in first["items"]] == ["First"]
+    api.add(
+        "GET",
+        comments,
+        [
+            {"id": 1, "body": "First, edited", "updated_at": moment(1)},
+            {"id": 2, "body": "Second", "updated_at": moment()},
+        ],
+    )
+    second = await op(issue_number=7, since_snapshot=first["snapshot"])
+    assert [comment.body for comment in second["updated"]] == ["First, edited"]
+    assert [comment.body for comment in second["added"]] == ["Second"]
+    assert "since" in queries(api, comments)[-1]
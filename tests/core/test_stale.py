@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+from github.GithubException import UnknownObjectException
+from requests.exceptions import RetryError
+
+from dev_kit_gh_mcp_server.tools import CreateIssueOp, ListIssuesOp, ReadIssueCommentsOp, WritePRCommentOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github, monkeypatch):
+    monkeypatch.setattr(ListIssuesOp, "serve_stale_after", 0.3)
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("GET", f"{REPO}/issues", [{"number": 1, "title": "First"}])
+    return mock_github
+
+
+def titles(issues):
+    return [issue.title for issue in issues]
+
+
+@pytest.mark.asyncio
+async def test_slow_call_serves_last_result_and_refreshes_it(api):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    assert titles(await op()) == ["First"]
+    api.add("GET", f"{REPO}/issues", [{"number": 2, "title": "Second"}], delay=0.5)
+    stale = await op()
+    assert stale["stale"] is True
+    assert stale["age_seconds"] >= 0
+    assert titles(stale["result"]) == ["First"]
+    # other arguments are another call, without a last result to serve
+    assert titles(await op(max_results=5)) == ["Second"]
+    # the refresh finished in the background, it is the result served during an outage
+    await asyncio.sleep(0.3)
+    api.add("GET", f"{REPO}/issues", {"message": "Server Error"}, status=502)
+    stale = await op()
+    assert titles(stale["result"]) == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_errors_that_are_not_outages_are_raised(api):
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    await op()
+    api.add("GET", f"{REPO}/issues", {"message": "Not Found"}, status=404)
+    with pytest.raises(UnknownObjectException):
+        await op()
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_wait_unless_patience_is_set(api, monkeypatch):
+    monkeypatch.setattr(ListIssuesOp, "serve_stale_after", None)
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    await op()
+    api.add("GET", f"{REPO}/issues", [{"number": 2, "title": "Second"}], delay=0.5)
+    assert titles(await asyncio.wait_for(op(), 5)) == ["Second"]
+    # outages still serve the last result
+    api.add("GET", f"{REPO}/issues", {"message": "Server Error"}, status=502)
+    assert titles((await op())["result"]) == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_operations_without_stale_results_raise(api, monkeypatch):
+    monkeypatch.setattr(ListIssuesOp, "serve_stale", False)
+    monkeypatch.setattr(ListIssuesOp, "serve_stale_after", None)
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    await op()
+    api.add("GET", f"{REPO}/issues", {"message": "Server Error"}, status=502)
+    with pytest.raises(RetryError):
+        await op()
+
+
+def test_tools_serving_stale_results_document_them():
+    docstring = ListIssuesOp.__call__.__doc__
+    assert '`{"stale": true, "age_seconds": ..., "result": ...}`' in docstring
+    assert docstring.index('"stale": true') < docstring.index("Returns:")
+    assert "stale" not in CreateIssueOp.__call__.__doc__
+
+
+@pytest.mark.asyncio
+async def test_created_issue_is_served_in_listings_read_before(api):
+    api.add("POST", f"{REPO}/issues", {"number": 2, "title": "Second", "user": {"login": "octocat"}}, status=201)
+    op = ListIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    await op()
+    await op(state="closed")
+    create = CreateIssueOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    await create(title="Second", body="Opened by a test", assignees=[], labels=[])
+    sent = len(api.requests)
+    assert titles(await op()) == ["Second", "First"]
+    assert len(api.requests) == sent
+    # listings the new issue is not part of are read again
+    await op(state="closed")
+    assert len(api.requests) == sent + 1
+
+
+@pytest.mark.asyncio
+async def test_pull_request_comment_is_served_in_the_conversation_read_before(api):
+    comments = f"{REPO}/issues/7/comments"
+    api.add("GET", f"{REPO}/pulls/7", {"number": 7, "issue_url": f"{api.url}{REPO}/issues/7"})
+    api.add("GET", comments, [{"id": 1, "body": "First", "user": {"login": "octocat"}}])
+    api.add("POST", comments, {"id": 2, "body": "Second", "user": {"login": "hubot"}}, status=201)
+    op = ReadIssueCommentsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+    for order in ("asc", "desc"):
+        await op(issue_number=7, order=order)
+    await op(issue_number=7, author="octocat")
+    await WritePRCommentOp(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)(7, "Second")
+    sent = len(api.requests)
+    assert [comment.body for comment in await op(issue_number=7)] == ["First", "Second"]
+    assert [comment.body for comment in await op(issue_number=7, order="desc")] == ["Second", "First"]
+    assert len(api.requests) == sent
+    await op(issue_number=7, author="octocat")
+    assert len(api.requests) == sent + 1
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from dev_kit_gh_mcp_server.core.async_base import AsyncGitHubOperation
+from dev_kit_gh_mcp_server.core.lazy import LazyOperation
+from dev_kit_gh_mcp_server.core.metadata import RepoMetadataIndex
+from dev_kit_gh_mcp_server.core.warmup import start_warm_up, warm_up, warm_up_targets
+from dev_kit_gh_mcp_server.tools import BlameFileOp, ListIssuesOp, ListPRsOp, ListTagsOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+@pytest.fixture
+def api(mock_github):
+    repo = {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}", "default_branch": "master"}
+    mock_github.add("GET", REPO, repo)
+    mock_github.add("GET", f"{REPO}/pulls", [{"number": 1, "title": "Open PR"}])
+    mock_github.add("GET", f"{REPO}/issues", [{"number": 2, "title": "Recent issue"}])
+    mock_github.add("GET", f"{REPO}/tags", [{"name": "v1.0.0"}])
+    mock_github.add("GET", f"{REPO}/labels", [{"name": "bug"}])
+    mock_github.add("GET", f"{REPO}/milestones", [])
+    mock_github.add("GET", f"{REPO}/assignees", [])
+    return mock_github
+
+
+def operations(api):
+    return [
+        cls(root_dir="octocat/Hello-World", token="fake-token", base_url=api.url)
+        for cls in (ListPRsOp, ListIssuesOp, ListTagsOp)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_first_calls_are_served_from_the_warm_up(api):
+    list_prs, list_issues, list_tags = operations(api)
+    assert await warm_up([list_prs, list_issues, list_tags], warm_up_targets(), pause=0) == [
+        "prs",
+        "issues",
+        "labels",
+        "tags",
+    ]
+    assert RepoMetadataIndex.for_repo(list_prs._gh_repo).resolve_labels(["BUG"]) == ["bug"]
+    sent = len(api.requests)
+    assert [pr.title for pr in await list_prs()] == ["Open PR"]
+    assert [issue.title for issue in await list_issues(max_results=10)] == ["Recent issue"]
+    assert [tag.name for tag in await list_tags()] == ["v1.0.0"]
+    assert len(api.requests) == sent
+    # other arguments, and the calls after the first, are sent to GitHub
+    await list_prs(state="closed")
+    await list_prs()
+    assert len(api.requests) == sent + 2
+
+
+@pytest.mark.asyncio
+async def test_failing_prefetches_are_skipped(api):
+    api.add("GET", f"{REPO}/pulls", {"message": "Server Error"}, status=500)
+    assert await warm_up(operations(api), ["prs", "tags"], pause=0) == ["tags"]
+
+
+def test_warm_up_targets(monkeypatch):
+    assert warm_up_targets("issues, Tags") == ["issues", "tags"]
+    monkeypatch.setenv("DEV_KIT_GH_WARMUP", "none")
+    assert warm_up_targets() == []
+    assert start_warm_up([]) is None
+    with pytest.raises(ValueError, match="Unknown warm-up targets"):
+        warm_up_targets("prs,stars")
+
+
+@pytest.mark.asyncio
+async def test_labels_are_loaded_through_the_issues_operation(api):
+    kwargs = {"root_dir": "octocat/Hello-World", "token": "fake-token", "base_url": api.url}
+    blame, list_issues = LazyOperation(BlameFileOp, **kwargs), LazyOperation(ListIssuesOp, **kwargs)
+    assert await warm_up([blame], ["labels"], pause=0) == []
+    assert await warm_up([blame, list_issues], ["labels"], pause=0) == ["labels"]
+    # other tools are not instantiated by the warm-up
+    assert (blame.created, list_issues.created) == (False, True)
+    assert RepoMetadataIndex.for_repo(list_issues.operation._gh_repo).resolve_labels(["BUG"]) == ["bug"]
+
+
+def test_warm_up_thread_closes_its_clients(api, monkeypatch):
+    closed = []
+
+    async def aclose_clients(cls):
+        closed.append(asyncio.get_running_loop())
+
+    monkeypatch.setattr(AsyncGitHubOperation, "aclose_clients", classmethod(aclose_clients))
+    thread = start_warm_up(operations(api), ["tags"])
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert len(closed) == 1
@@ -0,0 +1,363 @@
+"""Load harness driving the MCP server with many concurrent client sessions.
+
+The server is started from ``start_server()`` in this process, or from ``arun_server()`` in a
+subprocess serving streamable HTTP, and answers from a local mock of the GitHub API. Each client
+session replays a weighted mix of tool calls until the run ends. The report gives throughput,
+p50/p99 latency per tool, event-loop lag and memory growth, so that calls blocking the event
+loop and leaks show up as regressions. Run ``python -m tests.load --help`` for the options.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import Client
+from git import Repo
+
+from dev_kit_gh_mcp_server import start_server
+from dev_kit_gh_mcp_server.core.blob_cache import blob_sha
+from tests.mock_github import MockGitHub
+
+REPO = "/repos/octocat/Hello-World"
+README = b"# Hello-World\n\nMy first repository on GitHub!\n"
+
+# (tool, arguments, weight), roughly what an agent triaging a repository calls; read_pr_comments and
+# list_pr_reviews are left out, their PyGithub results are not serializable by the MCP layer yet
+DEFAULT_MIX: List[Tuple[str, Dict[str, Any], int]] = [
+    ("list_issues", {"max_results": 10}, 3),
+    ("list_prs", {"max_results": 10}, 3),
+    ("list_commits", {"max_results": 5}, 1),
+    ("read_file", {"path": "README.md"}, 2),
+    ("list_tree", {"pattern": "**/*.md"}, 1),
+    ("watch_activity", {}, 1),
+]
+
+
+def mock_api(latency: float = 0.02) -> MockGitHub:
+    """Start a mock of the GitHub API serving the calls of ``DEFAULT_MIX``.
+
+    Args:
+        latency: Seconds every response takes.
+
+    Returns:
+        MockGitHub: The started server.
+
+    """
+    api = MockGitHub().start()
+    user = {"login": "octocat", "id": 1, "type": "User"}
+    api.add(
+        "GET",
+        REPO,
+        {"full_name": "octocat/Hello-World", "url": f"{api.url}{REPO}", "default_branch": "master"},
+        delay=latency,
+    )
+    issues = [{"number": n, "title": f"Issue {n}", "state": "open", "user": user} for n in range(1, 51)]
+    api.add(
+        "GET",
+        f"{REPO}/issues",
+        issues[:30],
+        headers={"Link": f'<{{url}}{REPO}/issues?page=2>; rel="next"'},
+        delay=latency,
+    )
+    api.add("GET", f"{REPO}/issues?page=2", issues[30:], delay=latency)
+    pulls = [{"number": n, "title": f"PR {n}", "state": "open", "user": user} for n in range(1, 11)]
+    api.add("GET", f"{REPO}/pulls", pulls, delay=latency)
+    comments = [{"id": n, "body": f"Comment {n}", "user": user} for n in range(1, 21)]
+    api.add("GET", f"{REPO}/pulls/1/comments", comments, delay=latency)
+    reviews = [{"id": n, "state": "APPROVED", "user": user, "submitted_at": "2025-05-01T00:00:00Z"} for n in (1, 2)]
+    api.add("GET", f"{REPO}/pulls/1/reviews", reviews, delay=latency)
+    commits = [{"sha": f"{n:040x}", "commit": {"message": f"Commit {n}"}} for n in range(1, 11)]
+    api.add("GET", f"{REPO}/commits", commits, delay=latency)
+    sha = blob_sha(README)
+    api.add(
+        "POST",
+        "/graphql",
+        {"data": {"repository": {"object": {"__typename": "Blob", "oid": sha}}}},
+        delay=latency,
+    )
+    blob = {"sha": sha, "content": base64.b64encode(README).decode(), "encoding": "base64"}
+    api.add("GET", f"{REPO}/git/blobs/{sha}", blob, delay=latency)
+    api.add(
+        "GET",
+        f"{REPO}/git/trees/master",
+        {"sha": "1" * 40, "tree": [{"path": "README.md", "type": "blob", "sha": sha, "size": len(README)}]},
+        delay=latency,
+    )
+    api.add(
+        "GET",
+        f"{REPO}/git/trees/{'1' * 40}?recursive=1",
+        {"sha": "1" * 40, "truncated": False, "tree": [{"path": "README.md", "type": "blob", "sha": sha}]},
+        delay=latency,
+    )
+    events = [{"id": str(n), "type": "PushEvent", "actor": user, "payload": {"size": 1}} for n in range(30, 0, -1)]
+    api.add("GET", f"{REPO}/events", events, headers={"ETag": '"events"', "X-Poll-Interval": "60"}, delay=latency)
+    return api
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+
+    mode: str
+    clients: int
+    seconds: float
+    calls: int = 0
+    errors: int = 0
+    calls_per_second: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    # per tool: calls, errors, p50_ms and p99_ms
+    tools: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # how late the event loop ran a task scheduled every 10 ms, in the server process for in-process runs
+    loop_lag_p99_ms: float = 0.0
+    loop_lag_max_ms: float = 0.0
+    # resident memory of the server process after warm-up and at the end of the run
+    memory_start_mb: float = 0.0
+    memory_end_mb: float = 0.0
+    memory_growth_mb: float = 0.0
+    first_errors: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Format the report as a table.
+
+        Returns:
+            The report, one line per tool.
+
+        """
+        lines = [
+            f"{self.mode}: {self.clients} clients, {self.seconds:.1f}s, {self.calls} calls, {self.errors} errors, "
+            f"{self.calls_per_second:.1f} calls/s, p50 {self.p50_ms:.1f} ms, p99 {self.p99_ms:.1f} ms",
+            f"event loop lag: p99 {self.loop_lag_p99_ms:.1f} ms, max {self.loop_lag_max_ms:.1f} ms",
+            f"memory: {self.memory_start_mb:.1f} MB -> {self.memory_end_mb:.1f} MB ({self.memory_growth_mb:+.1f} MB)",
+        ]
+        for name, stats in sorted(self.tools.items()):
+            lines.append(
+                f"  {name:<20} {stats['calls']:>7.0f} calls {stats['errors']:>5.0f} errors "
+                f"p50 {stats['p50_ms']:>8.1f} ms  p99 {stats['p99_ms']:>8.1f} ms"
+            )
+        lines.extend(f"  error: {error}" for error in self.first_errors)
+        return "\n".join(lines)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return a percentile of values by the nearest-rank method.
+
+    Args:
+        values: The values.
+        fraction: The percentile, between 0 and 1.
+
+    Returns:
+        The value, 0 when there are none.
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _rss_mb(pid: Optional[int] = None) -> float:
+    # current resident memory on Linux, the peak elsewhere
+    try:
+        pages = int(Path(f"/proc/{pid or 'self'}/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _monitor(lags: List[float], memory: List[float], pid: Optional[int], stop: asyncio.Event) -> None:
+    interval, last_sample = 0.01, 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+        if start - last_sample >= 0.5:
+            memory.append(_rss_mb(pid))
+            last_sample = start
+
+
+async def _session(
+    target: Any,
+    mix: List[Tuple[str, Dict[str, Any], int]],
+    until: float,
+    seed: int,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, List[str]],
+) -> None:
+    rng = random.Random(seed)
+    weights = [weight for _, _, weight in mix]
+    async with Client(target, timeout=60) as client:
+        while time.monotonic() < until:
+            name, arguments, _ = rng.choices(mix, weights)[0]
+            start = time.perf_counter()
+            try:
+                await client.call_tool(name, arguments)
+            except Exception as error:
+                errors.setdefault(name, []).append(f"{name}: {error}")
+            latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+
+async def run_load(
+    clients: int = 10,
+    duration: float = 10.0,
+    mode: str = "memory",
+    mix: Optional[List[Tuple[str, Dict[str, Any], int]]] = None,
+    latency: float = 0.02,
+    workers: int = 1,
+) -> LoadReport:
+    """Drive the server with concurrent client sessions for a while.
+
+    Args:
+        clients: Number of concurrent client sessions.
+        duration: Seconds the sessions call tools for.
+        mode: "memory" to serve the sessions in this process from ``start_server()``, or "http" to
+            serve them over streamable HTTP from ``arun_server()`` in a subprocess.
+        mix: Weighted tool calls, ``DEFAULT_MIX`` by default.
+        latency: Seconds every response of the mock GitHub API takes.
+        workers: Worker processes of the HTTP server.
+
+    Returns:
+        LoadReport: The report. Over HTTP, the event-loop lag is the one of this process.
+
+    Raises:
+        ValueError: If the mode is unknown.
+
+    """
+    if mode not in ("memory", "http"):
+        raise ValueError(f"Unknown mode {mode}, use 'memory' or 'http'.")
+    mix = mix or DEFAULT_MIX
+    api = mock_api(latency)
+    server = None
+    with tempfile.TemporaryDirectory() as scratch:
+        environment = {
+            "GITHUB_API_URL": api.url,
+            "GITHUB_TOKEN": "load-test-token",
+            "DEV_KIT_GH_BLOB_CACHE": str(Path(scratch, "blobs")),
+        }
+        saved = {name: os.environ.get(name) for name in environment}
+        os.environ.update(environment)
+        try:
+            if mode == "memory":
+                target: Any = start_server("octocat/Hello-World")
+                pid = None
+            else:
+                server, target = _start_http_server(scratch, workers)
+                pid = server.pid
+            report = await _drive(target, mode, clients, duration, mix, pid)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(10)
+            api.stop()
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    return report
+
+
+def _start_http_server(scratch: str, workers: int) -> Tuple[subprocess.Popen, str]:
+    # arun_server validates that root_dir is a directory, a clone without commits resolves no ref locally
+    checkout = Path(scratch, "checkout")
+    Repo.init(checkout).create_remote("origin", "git@github.com:octocat/Hello-World")
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    command = "from dev_kit_gh_mcp_server.fastmcp_server import arun_server; arun_server()"
+    server = subprocess.Popen(
+        [sys.executable, "-c", command, "--root-dir", str(checkout), "--transport", "http"]
+        + ["--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server, f"http://127.0.0.1:{port}/mcp/"
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("The HTTP server did not start within 30 seconds.")
+
+
+async def _drive(
+    target: Any,
+    mode: str,
+    clients: int,
+    duration: float,
+    mix: List[Tuple[str, Dict[str, Any], int]],
+    pid: Optional[int],
+) -> LoadReport:
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, List[str]] = {}
+    lags: List[float] = []
+    memory: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(_monitor(lags, memory, pid, stop))
+    start = time.monotonic()
+    await asyncio.gather(*(_session(target, mix, start + duration, seed, latencies, errors) for seed in range(clients)))
+    elapsed = time.monotonic() - start
+    stop.set()
+    await monitor
+    memory.append(_rss_mb(pid))
+    everything = [value for values in latencies.values() for value in values]
+    # the first samples include imports and the first responses filling the caches
+    warm = memory[min(len(memory) - 1, max(1, len(memory) // 5))]
+    return LoadReport(
+        mode=mode,
+        clients=clients,
+        seconds=round(elapsed, 3),
+        calls=len(everything),
+        errors=sum(len(messages) for messages in errors.values()),
+        calls_per_second=round(len(everything) / elapsed, 2),
+        p50_ms=round(percentile(everything, 0.5) * 1000, 2),
+        p99_ms=round(percentile(everything, 0.99) * 1000, 2),
+        tools={
+            name: {
+                "calls": len(values),
+                "errors": len(errors.get(name, [])),
+                "p50_ms": round(percentile(values, 0.5) * 1000, 2),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+            }
+            for name, values in latencies.items()
+        },
+        loop_lag_p99_ms=round(percentile(lags, 0.99) * 1000, 2),
+        loop_lag_max_ms=round(max(lags, default=0.0) * 1000, 2),
+        memory_start_mb=round(warm, 1),
+        memory_end_mb=round(memory[-1], 1),
+        memory_growth_mb=round(memory[-1] - warm, 1),
+        first_errors=[message for messages in errors.values() for message in messages][:5],
+    )
+
+
+def main() -> None:
+    """Run the harness from the command line and print its report."""
+    parser = argparse.ArgumentParser(description="Drive the MCP server with concurrent client sessions")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent client sessions (default: 10)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load (default: 10)")
+    parser.add_argument("--mode", choices=["memory", "http"], default="memory", help="Server mode (default: memory)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock API latency in seconds (default: 0.02)")
+    parser.add_argument("--workers", type=int, default=1, help="HTTP server worker processes (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    report = asyncio.run(run_load(args.clients, args.duration, args.mode, latency=args.latency, workers=args.workers))
+    print(json.dumps(asdict(report), indent=2) if args.json else report.summary())
+
+
+if __name__ == "__main__":
+    main()
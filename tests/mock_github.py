@@ -0,0 +1,78 @@
+"""A local mock of the GitHub REST API served over real sockets."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class MockGitHub:
+    """Serve canned JSON responses on 127.0.0.1 and record the requests it receives.
+
+    Routes are matched on method and path, a route registered with a query string takes
+    precedence over the same path without one. Routes with an ``ETag`` header answer a
+    matching ``If-None-Match`` with a 304.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.connections = set()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def add(self, method, path, json_body=None, status=200, headers=None, delay=0.0, body=None):
+        """Register a response, a callable json_body is called with the request path."""
+        self.routes[(method, path)] = (status, headers or {}, json_body, delay, body)
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request_body = self.rfile.read(length) if length else b""
+                mock.requests.append((self.command, self.path, dict(self.headers), request_body))
+                mock.connections.add(self.client_address)
+                path = urlsplit(self.path).path
+                route = mock.routes.get((self.command, self.path)) or mock.routes.get((self.command, path))
+                if route is None:
+                    status, headers, json_body, delay, body = 404, {}, {"message": "Not Found"}, 0.0, None
+                else:
+                    status, headers, json_body, delay, body = route
+                headers = dict(headers)
+                if callable(json_body):
+                    json_body = json_body(self.path)
+                if delay:
+                    time.sleep(delay)
+                if body is None:
+                    body = b"" if json_body is None else json.dumps(json_body).encode()
+                if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+                    # conditional requests for an unchanged resource
+                    status, body = 304, b""
+                self.send_response(status)
+                self.send_header("Content-Type", headers.pop("Content-Type", "application/json"))
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value.replace("{url}", mock.url))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond  # noqa: N815
+
+        return Handler
@@ -1,7 +1,12 @@
+from pathlib import Path
+
 import pytest
 from fastmcp import Client
 
-from dev_kit_gh_mcp_server import start_server
+from dev_kit_gh_mcp_server import start_server, tools
+from dev_kit_gh_mcp_server.core import GitHubOperation
+from dev_kit_gh_mcp_server.create_server import select_tools
+from dev_kit_gh_mcp_server.fastmcp_server import serve_http
 from dev_kit_gh_mcp_server.tools import __all__
 
 
@@ -21,3 +26,46 @@ async def test_tool_with_client(fastmcp_server):
     async with Client(fastmcp_server) as client:
         result = await client.list_tools()
         assert len(result) == len(__all__)
+
+
+def test_sse_is_served_by_a_single_worker(temp_dir):
+    with pytest.raises(ValueError, match="single process"):
+        serve_http(temp_dir, workers=2, transport_name="sse")
+
+
+def test_select_tools(temp_dir, monkeypatch):
+    assert [tool.name for tool in select_tools(temp_dir)] == [getattr(tools, name).name for name in __all__]
+    assert [tool.name for tool in select_tools(temp_dir, "search_issues, list_prs")] == ["list_prs", "search_issues"]
+    monkeypatch.setenv("DEV_KIT_GH_EXCLUDE_TOOLS", "list_prs")
+    assert "list_prs" not in [tool.name for tool in select_tools(temp_dir)]
+    monkeypatch.delenv("DEV_KIT_GH_EXCLUDE_TOOLS")
+    (Path(temp_dir) / "pyproject.toml").write_text('[tool.dkmcp.github]\ninclude = ["read_file", "list_tree"]\n')
+    assert [tool.name for tool in select_tools(temp_dir)] == ["read_file", "list_tree"]
+    # arguments take precedence over the configuration
+    assert [tool.name for tool in select_tools(temp_dir, ["list_tags"])] == ["list_tags"]
+    with pytest.raises(ValueError, match="Unknown tools \\['list_everything'\\]"):
+        select_tools(temp_dir, "list_everything")
+
+
+@pytest.mark.asyncio
+async def test_lazy_tools_are_set_up_on_first_call(mock_github, monkeypatch):
+    repo = "/repos/octocat/Hello-World"
+    mock_github.add("GET", repo, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{repo}"})
+    mock_github.add("GET", "/search/issues", {"total_count": 1, "items": [{"number": 7, "title": "Found"}]})
+    monkeypatch.setenv("GITHUB_TOKEN", "fake-token")
+    monkeypatch.setenv("GITHUB_API_URL", mock_github.url)
+    monkeypatch.setenv("DEV_KIT_GH_WARMUP", "none")
+    selected = ["search_issues", "list_tags"]
+    async with Client(start_server("octocat/Hello-World", tools=selected, lazy=False)) as client:
+        eager = {tool.name: tool.inputSchema for tool in await client.list_tools()}
+    sent = len(mock_github.requests)
+    GitHubOperation.clear_repositories()
+
+    server = start_server("octocat/Hello-World", tools=selected)
+    async with Client(server) as client:
+        # the schemas are those of the operations, which are not instantiated yet
+        assert {tool.name: tool.inputSchema for tool in await client.list_tools()} == eager
+        assert len(mock_github.requests) == sent
+        result = await client.call_tool("search_issues", {"text": "found"})
+    assert result.data["items"][0]["title"] == "Found"
+    assert len(mock_github.requests) > sent
@@ -0,0 +1,68 @@
+"""Cold-start regression tests based on ``python -X importtime``."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Importing the package used to load FastMCP, PyGithub and every tool module (about a second),
+# it now only defines the lazily resolved entry points.
+PACKAGE_IMPORT_BUDGET_US = 100_000
+# Time spent in the modules of this package themselves while importing the server entry point,
+# dependencies excluded.
+OWN_MODULES_BUDGET_US = 100_000
+HEAVY_MODULES = ["github", "fastmcp", "dev_kit_mcp_server", "dev_kit_gh_mcp_server.tools.repo"]
+
+
+def import_times(statement):
+    """Run statement in a fresh interpreter and return {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+@pytest.mark.parametrize("module", ["dev_kit_gh_mcp_server", "dev_kit_gh_mcp_server.tools"])
+def test_package_import_is_lazy(module):
+    times = import_times(f"import {module}")
+    assert not [heavy for heavy in HEAVY_MODULES if heavy in times]
+    assert times[module][1] < PACKAGE_IMPORT_BUDGET_US
+
+
+def test_entry_point_own_import_budget():
+    times = import_times("import dev_kit_gh_mcp_server.fastmcp_server")
+    assert "fastmcp" in times
+    own = sum(self_us for name, (self_us, _) in times.items() if name.startswith("dev_kit_gh_mcp_server"))
+    assert own < OWN_MODULES_BUDGET_US
+
+
+def test_lazy_attributes():
+    import dev_kit_gh_mcp_server
+    from dev_kit_gh_mcp_server import tools
+
+    assert isinstance(dev_kit_gh_mcp_server.__version__, str)
+    assert dev_kit_gh_mcp_server.start_server.__name__ == "start_server"
+    assert all(getattr(tools, name).__name__ == name for name in tools.__all__)
+    assert list(tools.TOOL_NAMES.values()) == tools.__all__
+    assert all(getattr(tools, class_name).name == name for name, class_name in tools.TOOL_NAMES.items())
+    with pytest.raises(AttributeError):
+        dev_kit_gh_mcp_server.missing  # noqa: B018
+
+
+def test_selecting_tools_imports_their_modules_only(tmp_path):
+    statement = (
+        "import sys; from dev_kit_gh_mcp_server.create_server import select_tools; "
+        f"select_tools({str(tmp_path)!r}, 'list_tags'); "
+        "print(*sorted(name for name in sys.modules if name.startswith('dev_kit_gh_mcp_server.tools.')))"
+    )
+    result = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["dev_kit_gh_mcp_server.tools.repo"]
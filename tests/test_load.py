@@ -0,0 +1,26 @@
+import re
+
+import pytest
+
+from tests.load import DEFAULT_MIX, percentile, run_load
+
+
+def test_percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) == 0
+
+
+@pytest.mark.asyncio
+async def test_short_in_process_run_reports_every_call(responses):
+    # the harness starts its own mock of the GitHub API
+    responses.add_passthru(re.compile(r"http://127\.0\.0\.1:\d+"))
+    report = await run_load(clients=4, duration=1.5, latency=0.0)
+    assert report.errors == 0, report.first_errors
+    assert report.calls == sum(stats["calls"] for stats in report.tools.values()) > 0
+    assert set(report.tools) <= {name for name, _, _ in DEFAULT_MIX}
+    assert report.p99_ms >= report.p50_ms > 0
+    assert report.calls_per_second > 0
+    assert report.memory_end_mb > 0
+    assert "calls/s" in report.summary()
@@ -1,4 +1,8 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pytest
+from git import Actor, Repo
 
 # import pytest_responses
 
@@ -197,3 +201,47 @@ def repo_responses(commits_response, repo_data, responses):
     )
 
     return responses
+
+
+@pytest.fixture
+def metadata_responses(repo_data, repo_responses):
+    """Labels, milestones and assignees of the repository, served with ETags."""
+    repo_url, repo_api_url, repo_response = repo_data
+    api_443 = f"https://api.github.com:443/repos/{repo_url}"
+    metadata = {
+        "labels": [{"id": 1, "name": "bug", "color": "f29513"}, {"id": 2, "name": "Enhancement", "color": "a2eeef"}],
+        "milestones": [{"id": 7, "number": 3, "title": "v1.0", "state": "open"}],
+        "assignees": [{"login": "octocat", "id": 1, "type": "User"}],
+    }
+    for resource, data in metadata.items():
+        repo_responses.add(
+            repo_responses.GET,
+            f"{api_443}/{resource}",
+            json=data,
+            headers={"ETag": f'"{resource}-v1"'},
+        )
+    return repo_responses
+
+
+@pytest.fixture
+def local_clone(temp_dir, repo_responses):
+    """A clone of octocat/Hello-World with three commits on the fetched default branch and two tags."""
+    repo = Repo(temp_dir)
+    repo.create_remote("origin", "git@github.com:octocat/Hello-World")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Mona").set_value("user", "email", "mona@example.com")
+    for day, (name, email) in enumerate([("Mona", "mona@example.com"), ("Hubot", "hubot@example.com")] * 2, 1):
+        path = Path(temp_dir, "README.md" if day % 2 else f"docs/{day}.md")
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"change {day}\n")
+        repo.index.add([path.as_posix()])
+        date = datetime(2025, 5, day, 12, tzinfo=timezone.utc)
+        repo.index.commit(f"Change {day}\n", author=Actor(name, email), author_date=date, commit_date=date)
+        if day == 1:
+            repo.create_tag("v1.0.0")
+        if day == 2:
+            repo.create_tag("v1.10.0", message="annotated")
+    # the last commit was not pushed
+    repo.git.update_ref("refs/remotes/origin/master", "HEAD~1")
+    repo.git.symbolic_ref("refs/remotes/origin/HEAD", "refs/remotes/origin/master")
+    return temp_dir, repo, repo_responses
@@ -0,0 +1,129 @@
+import io
+import zipfile
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from dev_kit_gh_mcp_server.tools import ListRunArtifactsOp, ListWorkflowRunsOp, ReadArtifactOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+def run(run_id, conclusion="failure"):
+    return {
+        "id": run_id,
+        "name": "CI",
+        "run_number": run_id,
+        "event": "push",
+        "status": "completed",
+        "conclusion": conclusion,
+        "head_branch": "main",
+        "head_sha": "a" * 40,
+    }
+
+
+def archive(members):
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, "w", zipfile.ZIP_DEFLATED) as zipped:
+        for name, data in members.items():
+            zipped.writestr(name, data)
+    return content.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_list_workflow_runs_stops_paging_at_max_results(mock_github):
+    mock_github.add(
+        "GET",
+        f"{REPO}/actions/workflows/ci.yml/runs",
+        {"total_count": 4, "workflow_runs": [run(1), run(2)]},
+        headers={"Link": f'<{{url}}{REPO}/actions/workflows/ci.yml/runs?page=2>; rel="next"'},
+    )
+    mock_github.add("GET", f"{REPO}/actions/workflows/ci.yml/runs?page=2", {"workflow_runs": [run(3), run(4)]})
+    op = ListWorkflowRunsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    runs = await op(branch="main", status="failure", workflow="ci.yml", max_results=2)
+    assert [found["id"] for found in runs] == [1, 2]
+    assert len(mock_github.requests) == 1
+    query = parse_qs(urlsplit(mock_github.requests[0][1]).query)
+    assert (query["branch"], query["status"], query["per_page"]) == (["main"], ["failure"], ["2"])
+    with pytest.raises(ValueError, match="Invalid status"):
+        await op(status="broken")
+
+
+@pytest.mark.asyncio
+async def test_artifact_is_downloaded_once_and_read_from_disk(mock_github, monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    artifact = {"id": 5, "name": "test-results", "size_in_bytes": 1000, "expired": False}
+    mock_github.add("GET", f"{REPO}/actions/runs/9/artifacts", {"total_count": 1, "artifacts": [artifact]})
+    mock_github.add("GET", f"{REPO}/actions/artifacts/5", artifact)
+    mock_github.add("GET", f"{REPO}/actions/artifacts/5/zip", status=302, headers={"Location": "{url}/storage/5.zip"})
+    report = "".join(f"test_{number} passed\n" for number in range(1000))
+    content = archive({"reports/junit.xml": report, "coverage.bin": b"\0\1\2"})
+    mock_github.add("GET", "/storage/5.zip", body=content, headers={"Content-Type": "application/zip"})
+    assert [
+        found["id"]
+        for found in await ListRunArtifactsOp(
+            root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url
+        )(9)
+    ] == [5]
+
+    op = ReadArtifactOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    listing = await op(5)
+    assert [(member["name"], member["size"]) for member in listing["members"]] == [
+        ("reports/junit.xml", len(report)),
+        ("coverage.bin", 3),
+    ]
+    part = await op(5, member="reports/junit.xml", offset=len("test_0 passed\n"), max_bytes=14)
+    assert (part["content"], part["encoding"], part["truncated"]) == ("test_1 passed\n", "utf-8", True)
+    assert (await op(5, member="coverage.bin"))["encoding"] == "base64"
+    with pytest.raises(ValueError, match="No file missing.txt"):
+        await op(5, member="missing.txt")
+    paths = [urlsplit(path).path for _, path, _, _ in mock_github.requests]
+    assert paths.count("/storage/5.zip") == 1
+    assert len(list((tmp_path / "artifacts").iterdir())) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_artifact_is_not_downloaded(mock_github, monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    mock_github.add(
+        "GET",
+        f"{REPO}/actions/artifacts/6",
+        {"id": 6, "name": "logs", "expired": True, "expires_at": "2025-05-01T00:00:00Z"},
+    )
+    op = ReadArtifactOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    with pytest.raises(ValueError, match="expired"):
+        await op(6)
+    assert len(mock_github.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_archive_is_reported(mock_github, monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    mock_github.add("GET", f"{REPO}/actions/artifacts/7", {"id": 7, "name": "empty", "expired": False})
+    mock_github.add("GET", f"{REPO}/actions/artifacts/7/zip", body=b"", headers={"Content-Type": "application/zip"})
+    op = ReadArtifactOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    with pytest.raises(ValueError, match="archive is empty"):
+        await op(7)
+
+
+@pytest.mark.asyncio
+async def test_archive_evicted_before_it_is_read_is_downloaded_again(mock_github, monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_ARTIFACT_CACHE", str(tmp_path / "artifacts"))
+    mock_github.add("GET", f"{REPO}/actions/artifacts/8", {"id": 8, "name": "logs", "expired": False})
+    content = archive({"log.txt": "done\n"})
+    mock_github.add("GET", f"{REPO}/actions/artifacts/8/zip", body=content, headers={"Content-Type": "application/zip"})
+    members = ReadArtifactOp._members
+    evicted = []
+
+    def evict_first(self, path):
+        if not evicted:
+            # another process evicts the archive between its download and its reading
+            evicted.append(path)
+            path.unlink()
+        return members(self, path)
+
+    monkeypatch.setattr(ReadArtifactOp, "_members", evict_first)
+    op = ReadArtifactOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    assert [member["name"] for member in (await op(8))["members"]] == ["log.txt"]
+    paths = [urlsplit(path).path for _, path, _, _ in mock_github.requests]
+    assert paths.count(f"{REPO}/actions/artifacts/8/zip") == 2
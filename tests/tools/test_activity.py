@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from dev_kit_gh_mcp_server.tools import WatchActivityOp
+
+REPO = "/repos/octocat/Hello-World"
+
+
+def event(event_id, event_type="IssueCommentEvent", **payload):
+    return {
+        "id": str(event_id),
+        "type": event_type,
+        "actor": {"login": "mona"},
+        "created_at": "2025-05-01T12:00:00Z",
+        "payload": payload,
+    }
+
+
+@pytest.fixture
+def events_api(mock_github):
+    def publish(*events):
+        headers = {"ETag": f'"{events[0]["id"]}"', "X-Poll-Interval": "0.1"}
+        mock_github.add("GET", f"{REPO}/events", list(events), headers=headers)
+
+    publish(event(2, issue={"number": 7, "title": "Bug"}, comment={"body": "Same here"}), event(1, "WatchEvent"))
+    return mock_github, publish
+
+
+@pytest_asyncio.fixture
+async def watch(events_api):
+    server, _ = events_api
+    yield WatchActivityOp(root_dir="octocat/Hello-World", token="fake-token", base_url=server.url)
+    await WatchActivityOp.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_latest_events_without_marker(watch):
+    result = await watch()
+    assert result["marker"] == "2"
+    assert result["events"][1] == {
+        "id": "2",
+        "type": "IssueCommentEvent",
+        "actor": "mona",
+        "created_at": "2025-05-01T12:00:00Z",
+        "number": 7,
+        "title": "Bug",
+        "comment": "Same here",
+    }
+    assert [summary["id"] for summary in (await watch(max_results=1))["events"]] == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_new_events(watch, events_api):
+    server, publish = events_api
+
+    async def push_later():
+        await asyncio.sleep(0.35)
+        publish(event(4, "PushEvent", ref="refs/heads/main", size=2), event(3, "WatchEvent"), event(2))
+
+    pusher = asyncio.create_task(push_later())
+    result = await watch(since_id="2", types=["PushEvent"], timeout=5)
+    await pusher
+    assert result["events"] == [
+        {
+            "id": "4",
+            "type": "PushEvent",
+            "actor": "mona",
+            "created_at": "2025-05-01T12:00:00Z",
+            "ref": "refs/heads/main",
+            "commits": 2,
+        }
+    ]
+    assert (result["marker"], result["timed_out"], result["missed"]) == ("4", False, False)
+    revalidations = [
+        headers.get("If-None-Match") for _, path, headers, _ in server.requests if path.endswith("events?per_page=100")
+    ]
+    # unchanged polls were revalidated, a few of them for 0.35 seconds at 0.1 second intervals
+    assert revalidations[0] is None
+    assert 2 <= revalidations.count('"2"') <= 5
+
+
+@pytest.mark.asyncio
+async def test_long_poll_times_out(watch, events_api):
+    server, _ = events_api
+    result = await watch(since_id="2", timeout=0.25)
+    assert (result["events"], result["marker"], result["timed_out"]) == ([], "2", True)
+    # other types of events are skipped by the marker
+    result = await watch(since_id="1", types=["PushEvent"], timeout=0)
+    assert (result["events"], result["marker"], result["timed_out"]) == ([], "2", True)
+
+
+@pytest.mark.asyncio
+async def test_more_events_than_max_results_are_returned_oldest_first(watch, events_api):
+    _, publish = events_api
+    publish(*(event(event_id) for event_id in range(6, 0, -1)))
+    result = await watch(since_id="1", max_results=2, timeout=0)
+    assert [summary["id"] for summary in result["events"]] == ["2", "3"]
+    assert (result["marker"], result["truncated"]) == ("3", True)
+    # the next call resumes after the last event returned
+    result = await watch(since_id=result["marker"], max_results=10, timeout=0)
+    assert [summary["id"] for summary in result["events"]] == ["4", "5", "6"]
+    assert (result["marker"], result["truncated"]) == ("6", False)
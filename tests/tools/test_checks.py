@@ -0,0 +1,114 @@
+import io
+import zipfile
+
+import pytest
+from github.GithubException import UnknownObjectException
+
+from dev_kit_gh_mcp_server.tools import CheckPRLogsOp, CheckPRStatusOp
+
+REPO = "/repos/octocat/Hello-World"
+SHA = "6dcb09b5b57875f334f61aebed695e2e4193db5e"
+ACTIONS = {"slug": "github-actions"}
+
+
+def _check_run(run_id, name, status, conclusion, app=ACTIONS):
+    return {"id": run_id, "name": name, "status": status, "conclusion": conclusion, "app": app}
+
+
+@pytest.fixture
+def checks_api(mock_github):
+    mock_github.add("GET", f"{REPO}/pulls/5", {"number": 5, "head": {"sha": SHA}})
+    check_runs = [
+        _check_run(11, "lint", "completed", "success"),
+        _check_run(12, "tests", "completed", "failure"),
+        _check_run(13, "docs", "in_progress", None),
+        _check_run(14, "external", "completed", "failure", app={"slug": "circleci"}),
+    ]
+    mock_github.add(
+        "GET",
+        f"{REPO}/commits/{SHA}/check-runs",
+        {"total_count": len(check_runs), "check_runs": check_runs},
+    )
+    return mock_github
+
+
+@pytest.mark.asyncio
+async def test_check_pr_status(checks_api):
+    op = CheckPRStatusOp(root_dir="octocat/Hello-World", token="fake-token", base_url=checks_api.url)
+    status = await op(pr_number=5)
+    assert status["sha"] == SHA
+    assert status["state"] == "failure"
+    assert status["counts"] == {"success": 1, "failure": 2, "in_progress": 1}
+    assert [run["name"] for run in status["check_runs"]] == ["lint", "tests", "docs", "external"]
+    assert status["check_runs"][1] == {
+        "id": 12,
+        "name": "tests",
+        "status": "completed",
+        "conclusion": "failure",
+        "details_url": None,
+    }
+    assert "filter=latest" in checks_api.requests[1][1]
+    await op.aclose_clients()
+
+
+def _logs_archive():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("0_tests (3.12).txt", "whole job log\n")
+        archive.writestr("tests (3.12)/1_Set up job.txt", "setting up\n" * 1000)
+        archive.writestr("tests (3.12)/2_Run pytest.txt", "".join(f"line {i}\n" for i in range(100_000)))
+        archive.writestr("lint/1_Run ruff.txt", "ok\n")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def logs_api(checks_api):
+    checks_api.add(
+        "GET",
+        f"{REPO}/actions/jobs/12",
+        {
+            "id": 12,
+            "run_id": 99,
+            "name": "tests (3.12)",
+            "conclusion": "failure",
+            "steps": [
+                {"name": "Set up job", "number": 1, "status": "completed", "conclusion": "success"},
+                {"name": "Run pytest", "number": 2, "status": "completed", "conclusion": "failure"},
+            ],
+        },
+    )
+    checks_api.add("GET", f"{REPO}/actions/runs/99/logs", status=302, headers={"Location": "{url}/storage/99.zip"})
+    checks_api.add("GET", "/storage/99.zip", body=_logs_archive(), headers={"Content-Type": "application/zip"})
+    return checks_api
+
+
+@pytest.mark.asyncio
+async def test_check_pr_logs_tails_failing_steps(logs_api):
+    op = CheckPRLogsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=logs_api.url)
+    logs = await op(pr_number=5, tail_lines=3)
+    assert logs == [
+        {"job": "tests (3.12)", "step": "Run pytest", "number": 2, "lines": ["line 99997", "line 99998", "line 99999"]},
+    ]
+    paths = [path for _, path, _, _ in logs_api.requests]
+    # checks of other apps have no GitHub Actions job
+    assert f"{REPO}/actions/jobs/14" not in paths
+    assert "/storage/99.zip" in paths
+    await op.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_check_pr_logs_refuses_large_archives(logs_api, monkeypatch):
+    monkeypatch.setattr(CheckPRLogsOp, "max_archive_bytes", 1024)
+    op = CheckPRLogsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=logs_api.url)
+    with pytest.raises(ValueError, match="larger than 1024 bytes"):
+        await op(pr_number=5)
+    await op.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_check_pr_logs_expired(checks_api):
+    checks_api.add("GET", f"{REPO}/actions/jobs/12", {"id": 12, "run_id": 99, "name": "tests", "steps": []})
+    op = CheckPRLogsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=checks_api.url)
+    with pytest.raises(UnknownObjectException):
+        await op(pr_number=5)
+    await op.aclose_clients()
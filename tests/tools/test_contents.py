@@ -0,0 +1,233 @@
+import base64
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from git import Actor
+
+from dev_kit_gh_mcp_server.core.blob_cache import blob_sha
+from dev_kit_gh_mcp_server.tools import BlameFileOp, ListTreeOp, ReadFileOp
+from dev_kit_gh_mcp_server.tools.contents import file_result, glob_regex
+
+REPO = "/repos/octocat/Hello-World"
+CONTENT = b"print('hello')\n"
+SHA = blob_sha(CONTENT)
+
+
+@pytest.fixture
+def contents_api(mock_github, monkeypatch, tmp_path):
+    monkeypatch.setenv("DEV_KIT_GH_BLOB_CACHE", str(tmp_path / "blobs"))
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    # blob SHAs by expression, the same file on two branches
+    objects = {"main:src/app.py": "Blob", "feature:src/app.py": "Blob", "main:src/lib": "Tree"}
+
+    def graphql(_):
+        expression = json.loads(mock_github.requests[-1][3])["variables"]["expression"]
+        kind = objects.get(expression)
+        return {"data": {"repository": {"object": kind and {"__typename": kind, "oid": SHA}}}}
+
+    mock_github.add("POST", "/graphql", graphql)
+    blob = {"sha": SHA, "size": len(CONTENT), "encoding": "base64", "content": base64.encodebytes(CONTENT).decode()}
+    mock_github.add("GET", f"{REPO}/git/blobs/{SHA}", blob)
+    return mock_github
+
+
+@pytest.mark.asyncio
+async def test_read_file_downloads_each_blob_once(contents_api):
+    op = ReadFileOp(root_dir="octocat/Hello-World", token="fake-token", base_url=contents_api.url)
+    for ref in ("main", "feature", "main"):
+        result = await op("src/app.py", ref=ref)
+        assert (result["sha"], result["content"], result["encoding"]) == (SHA, CONTENT.decode(), "utf-8")
+    # only the blob SHA is looked up at every ref, the content is downloaded once
+    paths = [path for _, path, _, _ in contents_api.requests]
+    assert paths.count(f"{REPO}/git/blobs/{SHA}") == 1
+    assert paths.count("/graphql") == 3
+
+    for path in ("src/lib", "src/gone.py"):
+        with pytest.raises(ValueError, match=f"No file {path} at main"):
+            await op(path, ref="main")
+
+
+@pytest.mark.asyncio
+async def test_read_file_from_local_clone(local_clone):
+    temp_dir, repo, repo_responses = local_clone
+    op = ReadFileOp(root_dir=temp_dir, token="fake-token")
+    result = await op("docs/2.md", ref="v1.10.0")
+    assert (result["content"], result["sha"]) == ("change 2\n", repo.commit("v1.10.0").tree["docs/2.md"].hexsha)
+    # the default branch is the fetched one, the unpushed change is not read
+    assert (await op("/README.md"))["content"] == "change 3\n"
+    with pytest.raises(ValueError, match="No file docs/4.md at the default branch"):
+        await op("docs/4.md")
+    assert len(repo_responses.calls) == 1
+
+
+def test_binary_and_truncated_content():
+    result = file_result("logo.png", None, "a" * 40, b"\x89PNG\0\0data", max_bytes=4)
+    assert (result["encoding"], result["content"], result["truncated"]) == ("base64", "iVBORw==", True)
+    assert file_result("a.txt", "main", "a" * 40, "é".encode(), max_bytes=100)["content"] == "é"
+
+
+@pytest.fixture
+def trees_api(mock_github):
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    root = [
+        {"path": "README.md", "type": "blob", "sha": "b1", "size": 5},
+        {"path": "docs", "type": "tree", "sha": "t2"},
+        {"path": "src", "type": "tree", "sha": "t1"},
+    ]
+    mock_github.add(
+        "GET", f"{REPO}/git/trees/main", {"sha": "t0", "tree": root, "truncated": False}, headers={"ETag": '"t0"'}
+    )
+    # the monorepo is too large for one recursive listing, its directories are not
+    mock_github.add("GET", f"{REPO}/git/trees/t0?recursive=1", {"sha": "t0", "tree": root[:1], "truncated": True})
+    src = [
+        {"path": "app.py", "type": "blob", "sha": "b2", "size": 3},
+        {"path": "lib", "type": "tree", "sha": "t3"},
+        {"path": "lib/util.py", "type": "blob", "sha": "b3", "size": 4},
+        {"path": "lib/data.json", "type": "blob", "sha": "b4", "size": 2},
+    ]
+    mock_github.add("GET", f"{REPO}/git/trees/t1?recursive=1", {"sha": "t1", "tree": src, "truncated": False})
+    lib = [{**entry, "path": entry["path"][4:]} for entry in src[2:]]
+    mock_github.add("GET", f"{REPO}/git/trees/t3?recursive=1", {"sha": "t3", "tree": lib, "truncated": False})
+    return mock_github
+
+
+@pytest.mark.asyncio
+async def test_list_tree_descends_truncated_trees_lazily(trees_api):
+    op = ListTreeOp(root_dir="octocat/Hello-World", token="fake-token", base_url=trees_api.url)
+    for _ in range(2):
+        result = await op(ref="main", pattern="src/**/*.py")
+        assert [entry["path"] for entry in result["entries"]] == ["src/app.py", "src/lib/util.py"]
+        assert (result["sha"], result["entries"][0]["size"], result["truncated"]) == ("t0", 3, False)
+    requests = [(path, headers.get("If-None-Match")) for _, path, headers, _ in trees_api.requests]
+    # docs cannot hold a match and is never listed, the trees are listed once and the ref revalidated
+    assert requests == [
+        (REPO, None),
+        (f"{REPO}/git/trees/main", None),
+        (f"{REPO}/git/trees/t0?recursive=1", None),
+        (f"{REPO}/git/trees/t1?recursive=1", None),
+        (f"{REPO}/git/trees/main", '"t0"'),
+    ]
+    result = await op(ref="main", path="src/lib", max_results=1)
+    assert (result["sha"], result["entries"], result["truncated"]) == (
+        "t3",
+        [{"path": "src/lib/util.py", "type": "blob", "size": 4}],
+        True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_tree_from_local_clone(local_clone):
+    temp_dir, repo, _ = local_clone
+    op = ListTreeOp(root_dir=temp_dir, token="fake-token")
+    result = await op()
+    assert result["entries"] == [
+        {"path": "README.md", "type": "blob", "size": 9},
+        {"path": "docs", "type": "tree"},
+        {"path": "docs/2.md", "type": "blob", "size": 9},
+    ]
+    assert result["sha"] == repo.commit("HEAD~1").tree.hexsha
+    assert [entry["path"] for entry in (await op(pattern="**/*.md", ref="v1.0.0"))["entries"]] == ["README.md"]
+    with pytest.raises(ValueError, match="No directory src"):
+        await op(path="src")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "matches"),
+    [
+        ("**/README.md", "README.md", True),
+        ("**/README.md", "a/b/README.md", True),
+        ("*.py", "a/b.py", False),
+        ("src/*/[!_]*.py", "src/lib/util.py", True),
+        ("src/*/[!_]*.py", "src/lib/_private.py", False),
+    ],
+)
+def test_glob_regex(pattern, path, matches):
+    assert bool(glob_regex(pattern).match(path)) is matches
+
+
+@pytest.mark.asyncio
+async def test_blame_file_from_local_clone(local_clone):
+    temp_dir, repo, _ = local_clone
+    path = Path(temp_dir, "app.py")
+    for day, (author, lines) in enumerate([("Mona", "a\nb\nc\n"), ("Hubot", "a\nB\nc\n")], 10):
+        path.write_text(lines)
+        repo.index.add(["app.py"])
+        date = datetime(2025, 5, day, 12, tzinfo=timezone.utc)
+        repo.index.commit(f"Edit by {author}", author=Actor(author, f"{author.lower()}@example.com"), author_date=date)
+    repo.git.update_ref("refs/remotes/origin/master", "HEAD")
+    first, second = repo.commit("HEAD~1").hexsha, repo.commit("HEAD").hexsha
+    op = BlameFileOp(root_dir=temp_dir, token="fake-token")
+    result = await op("app.py")
+    assert result["sha"] == second
+    assert [(found["start_line"], found["end_line"], found["sha"]) for found in result["ranges"]] == [
+        (1, 1, first),
+        (2, 2, second),
+        (3, 3, first),
+    ]
+    assert result["commits"][second]["author"] == "Hubot"
+    only_second = await op("app.py", start_line=2, end_line=2)
+    assert [found["sha"] for found in only_second["ranges"]] == [second]
+    assert list(only_second["commits"]) == [second]
+    with pytest.raises(ValueError, match="No file missing.py"):
+        await op("missing.py")
+    with pytest.raises(ValueError, match="Invalid line range"):
+        await op("app.py", start_line=3, end_line=2)
+
+
+@pytest.mark.asyncio
+async def test_blame_file_is_requested_once_per_commit(mock_github):
+    commit_sha = "c" * 40
+    ranges = [
+        {"startingLine": 1, "endingLine": 40, "commit": {"oid": "a" * 40, "messageHeadline": "Add app"}},
+        {"startingLine": 41, "endingLine": 45, "commit": {"oid": commit_sha, "messageHeadline": "Fix app"}},
+    ]
+    for element in ranges:
+        element["commit"].update(
+            authoredDate="2025-05-01T12:00:00Z", author={"name": "Mona", "user": {"login": "mona"}}
+        )
+
+    def graphql(_):
+        variables = json.loads(mock_github.requests[-1][3])["variables"]
+        found = {"oid": commit_sha, **({"blame": {"ranges": ranges}} if variables["withBlame"] else {})}
+        return {"data": {"repository": {"object": found}}}
+
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("POST", "/graphql", graphql)
+    op = BlameFileOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    result = await op("src/app.py", ref="main", start_line=39, end_line=42)
+    assert [(found["start_line"], found["end_line"]) for found in result["ranges"]] == [(39, 40), (41, 42)]
+    assert result["commits"][commit_sha]["login"] == "mona"
+    # the ref is looked up again, the blame of its commit is not
+    await op("src/app.py", ref="main")
+    await op("src/app.py", ref=commit_sha)
+    queries = [json.loads(body)["variables"] for method, _, _, body in mock_github.requests if method == "POST"]
+    assert [(variables["expression"], variables["withBlame"]) for variables in queries] == [
+        ("main^{commit}", False),
+        (commit_sha, True),
+        ("main^{commit}", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_blame_of_annotated_tag_uses_its_commit(mock_github):
+    commit_sha, tag_sha = "c" * 40, "d" * 40
+    ranges = [{"startingLine": 1, "endingLine": 3, "commit": {"oid": commit_sha, "messageHeadline": "Release"}}]
+    ranges[0]["commit"].update(authoredDate="2025-05-01T12:00:00Z", author={"name": "Mona"})
+
+    def graphql(_):
+        variables = json.loads(mock_github.requests[-1][3])["variables"]
+        expression = variables["expression"]
+        # like GitHub, the tag name alone names the tag object, whose blame is not a commit's
+        if expression == "v1.0":
+            return {"data": {"repository": {"object": {"oid": tag_sha}}}}
+        found = {"oid": commit_sha, **({"blame": {"ranges": ranges}} if variables["withBlame"] else {})}
+        return {"data": {"repository": {"object": found if expression in ("v1.0^{commit}", commit_sha) else None}}}
+
+    mock_github.add("GET", REPO, {"full_name": "octocat/Hello-World", "url": f"{mock_github.url}{REPO}"})
+    mock_github.add("POST", "/graphql", graphql)
+    op = BlameFileOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    result = await op("CHANGELOG.md", ref="v1.0")
+    assert (result["sha"], [found["sha"] for found in result["ranges"]]) == (commit_sha, [commit_sha])
+    assert (commit_sha, "CHANGELOG.md") in BlameFileOp._blames
@@ -1,4 +1,7 @@
+from datetime import datetime
+
 import pytest
+import responses
 
 from dev_kit_gh_mcp_server.tools import CreateIssueOp, ReadIssueCommentsOp, WriteIssueCommentOp
 
@@ -52,9 +55,9 @@ def issue_get_response(repo_data, repo_responses):
 
 
 @pytest.fixture
-def issue_get_response_com(repo_data, issue_get_response):
-    """Fixture for mocked issue retrieval response."""
-    repo_responses, repo_url = issue_get_response
+def issue_get_response_com(repo_data, repo_responses):
+    """Fixture for mocked issue comments response, the issue itself is never fetched."""
+    repo_url, repo_api_url, repo_response = repo_data
 
     # Add mock for issue comments endpoint
     comments_url_443 = f"https://api.github.com:443/repos/{repo_url}/issues/42/comments"
@@ -166,3 +169,56 @@ async def test_write_issue_comment(issue_get_response):
     comment = await op(issue_number=42, body="A new comment!")
     assert getattr(comment, "body", None) == "A new comment!"
     assert getattr(comment, "id", None) == 2
+
+
+@pytest.fixture
+def issue_comments_since_response(repo_data, repo_responses):
+    """Fixture for issue comments filtered by the API with `since`."""
+    repo_url, repo_api_url, repo_response = repo_data
+    comments_data = [
+        {"id": 3, "body": "Old news", "user": {"login": "hubot"}, "updated_at": "2025-05-02T00:00:00Z"},
+        {"id": 4, "body": "Fresh reply", "user": {"login": "octocat"}, "updated_at": "2025-05-03T00:00:00Z"},
+        {"id": 5, "body": "Another reply", "user": {"login": "octocat"}, "updated_at": "2025-05-04T00:00:00Z"},
+    ]
+    repo_responses.add(
+        repo_responses.GET,
+        f"https://api.github.com:443/repos/{repo_url}/issues/42/comments",
+        json=comments_data,
+        status=200,
+        match=[responses.matchers.query_param_matcher({"since": "2025-05-01T00:00:00Z"})],
+    )
+    return repo_responses, repo_url
+
+
+@pytest.mark.asyncio
+async def test_read_issue_comments_filters(issue_comments_since_response):
+    repo_responses, repo_url = issue_comments_since_response
+    read_op = ReadIssueCommentsOp(root_dir=repo_url, token="fake-token")
+    comments = await read_op(issue_number=42, since=datetime(2025, 5, 1), author="OctoCat", max_results=1)
+    assert [c.id for c in comments] == [4]
+    assert len(repo_responses.calls) == 2  # the repository and a single page of comments
+
+
+@pytest.mark.asyncio
+async def test_read_issue_comments_newest_first(issue_comments_since_response):
+    repo_responses, repo_url = issue_comments_since_response
+    read_op = ReadIssueCommentsOp(root_dir=repo_url, token="fake-token")
+    comments = await read_op(issue_number=42, since=datetime(2025, 5, 1), order="desc", max_results=2)
+    assert [c.id for c in comments] == [5, 4]
+
+
+@pytest.mark.asyncio
+async def test_read_issue_comments_invalid_order(repo_data, repo_responses):
+    repo_url, repo_api_url, repo_response = repo_data
+    read_op = ReadIssueCommentsOp(root_dir=repo_url, token="fake-token")
+    with pytest.raises(ValueError, match="order"):
+        await read_op(issue_number=42, order="newest")
+
+
+@pytest.mark.asyncio
+async def test_create_issue_rejects_unknown_label(repo_data, metadata_responses):
+    repo_url, repo_api_url, repo_response = repo_data
+    op = CreateIssueOp(root_dir=repo_url, token="fake-token")
+    with pytest.raises(ValueError, match="Unknown labels: wontfix"):
+        await op(title="Test Issue", labels=["bug", "wontfix"], assignees=["octocat"])
+    assert all(c.request.method == "GET" for c in metadata_responses.calls)
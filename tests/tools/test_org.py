@@ -0,0 +1,137 @@
+import pytest
+import pytest_asyncio
+
+from dev_kit_gh_mcp_server.tools import ListOrgIssuesOp, ListOrgPRsOp
+
+
+def pull(number, updated_at, reviewers=(), author="mona"):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "open",
+        "user": {"login": author},
+        "requested_reviewers": [{"login": login} for login in reviewers],
+        "head": {"ref": f"feature-{number}"},
+        "base": {"ref": "main"},
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture
+def org_api(mock_github):
+    mock_github.add(
+        "GET",
+        "/orgs/acme/repos",
+        [
+            {"full_name": "acme/api", "pushed_at": "2025-05-03T00:00:00Z"},
+            {"full_name": "acme/old", "pushed_at": "2025-05-04T00:00:00Z", "archived": True},
+        ],
+        headers={"Link": '<{url}/orgs/acme/repos?page=2>; rel="next"'},
+    )
+    mock_github.add(
+        "GET",
+        "/orgs/acme/repos?page=2",
+        [{"full_name": "acme/web", "pushed_at": "2025-05-05T00:00:00Z"}, {"full_name": "acme/secret"}],
+    )
+    mock_github.add(
+        "GET",
+        "/repos/acme/api/pulls",
+        [pull(1, "2025-05-03T00:00:00Z", ["octocat"]), pull(2, "2025-05-01T00:00:00Z")],
+        headers={"X-RateLimit-Remaining": "4000"},
+    )
+    mock_github.add(
+        "GET",
+        "/repos/acme/web/pulls",
+        [pull(7, "2025-05-04T00:00:00Z", ["octocat"], author="hubot"), pull(8, "2025-05-02T00:00:00Z")],
+        headers={"X-RateLimit-Remaining": "4000"},
+    )
+    mock_github.add("GET", "/repos/acme/secret/pulls", {"message": "Not Found"}, status=404)
+    mock_github.add(
+        "GET",
+        "/repos/acme/api/issues",
+        [
+            {"number": 3, "title": "Bug", "updated_at": "2025-05-02T00:00:00Z"},
+            {"number": 4, "title": "PR", "updated_at": "2025-05-06T00:00:00Z", "pull_request": {}},
+        ],
+    )
+    mock_github.add(
+        "GET", "/repos/acme/web/issues", [{"number": 9, "title": "Crash", "updated_at": "2025-05-03T00:00:00Z"}]
+    )
+    mock_github.add("GET", "/repos/acme/secret/issues", [])
+    return mock_github
+
+
+@pytest_asyncio.fixture
+async def org_prs(org_api):
+    yield ListOrgPRsOp(root_dir="acme/api", token="fake-token", base_url=org_api.url)
+    await ListOrgPRsOp.aclose_clients()
+
+
+def listed(result):
+    return [(item["repository"], item["number"]) for item in result["items"]]
+
+
+@pytest.mark.asyncio
+async def test_org_prs_are_merged_newest_first(org_prs, org_api):
+    result = await org_prs(max_results=3)
+    assert result["org"] == "acme"
+    assert listed(result) == [("acme/web", 7), ("acme/api", 1), ("acme/web", 8)]
+    assert result["truncated"] is True
+    assert result["repositories"] == 3
+    assert list(result["failed"]) == ["acme/secret"]
+    # repositories are listed once, archived ones are not queried
+    await org_prs(review_requested="octocat", author="mona")
+    paths = [path for _, path, *_ in org_api.requests]
+    assert sum(path.startswith("/orgs/acme/repos") for path in paths) == 2
+    assert not any(path.startswith("/repos/acme/old") for path in paths)
+
+
+@pytest.mark.asyncio
+async def test_org_prs_filters_and_repos(org_prs):
+    assert listed(await org_prs(review_requested="OctoCat")) == [("acme/web", 7), ("acme/api", 1)]
+    assert listed(await org_prs(review_requested="octocat", author="mona")) == [("acme/api", 1)]
+    assert listed(await org_prs(repos=["api"])) == [("acme/api", 1), ("acme/api", 2)]
+    with pytest.raises(ValueError, match="state must be"):
+        await org_prs(state="merged")
+
+
+@pytest.mark.asyncio
+async def test_org_fan_out_stops_at_the_request_budget(org_prs, monkeypatch):
+    monkeypatch.setattr(ListOrgPRsOp, "concurrency", 1)
+    monkeypatch.setattr(ListOrgPRsOp, "rate_limit_reserve", 5000)
+    result = await org_prs()
+    # the first response reports a rate limit below the reserve, no other repository is queried
+    assert result["skipped"] == ["acme/api", "acme/secret"]
+    monkeypatch.setattr(ListOrgPRsOp, "rate_limit_reserve", 0)
+    monkeypatch.setattr(ListOrgPRsOp, "max_requests", 2)
+    result = await org_prs()
+    assert result["skipped"] == ["acme/secret"]
+
+
+@pytest.mark.asyncio
+async def test_org_issues_leave_pull_requests_out(org_api):
+    op = ListOrgIssuesOp(root_dir="acme/api", token="fake-token", base_url=org_api.url)
+    result = await op(labels=["bug", "crash"])
+    await ListOrgIssuesOp.aclose_clients()
+    assert listed(result) == [("acme/web", 9), ("acme/api", 3)]
+    assert result["failed"] == {}
+    query = [path for _, path, *_ in org_api.requests if path.startswith("/repos/acme/api/issues")][0]
+    assert "labels=bug%2Ccrash" in query
+
+
+@pytest.mark.asyncio
+async def test_org_fan_out_reports_timeouts_and_unfetched_pages(org_prs, org_api, monkeypatch):
+    monkeypatch.setattr(ListOrgPRsOp, "timeout", 0.2)
+    monkeypatch.setattr(ListOrgPRsOp, "max_pages_per_repo", 1)
+    org_api.add("GET", "/repos/acme/secret/pulls", [], delay=1.0)
+    org_api.add(
+        "GET",
+        "/repos/acme/api/pulls",
+        [pull(1, "2025-05-03T00:00:00Z")],
+        headers={"Link": '<{url}/repos/acme/api/pulls?page=2>; rel="next"'},
+    )
+    result = await org_prs(repos=["api", "secret"])
+    assert listed(result) == [("acme/api", 1)]
+    # the second page of acme/api was not fetched
+    assert result["truncated"] is True
+    assert list(result["failed"]) == ["acme/secret"]
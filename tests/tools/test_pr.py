@@ -1,6 +1,9 @@
+from datetime import datetime
+
 import pytest
+import responses
 
-from dev_kit_gh_mcp_server.tools import ListPRReviewsOp
+from dev_kit_gh_mcp_server.tools import ListPRReviewsOp, ReadPRCommentsOp
 
 
 @pytest.fixture
@@ -9,17 +12,6 @@ def pr_reviews_response(repo_data, repo_responses):
     repo_url, repo_api_url, repo_response = repo_data
     pr_number = 5
     reviews_url_443 = f"https://api.github.com:443/repos/{repo_url}/pulls/{pr_number}/reviews"
-    pr_url_443 = f"https://api.github.com:443/repos/{repo_url}/pulls/{pr_number}"
-    pr_url = f"https://api.github.com/repos/{repo_url}/pulls/{pr_number}"
-    pr_data = {
-        "id": 201,
-        "number": pr_number,
-        "state": "open",
-        "title": "Test PR",
-        "user": {"login": "octocat"},
-        "body": "This is a test PR",
-        "url": pr_url,
-    }
     reviews_data = [
         {
             "id": 80,
@@ -57,15 +49,7 @@ def pr_reviews_response(repo_data, repo_responses):
             "author_association": "COLLABORATOR",
         }
     ]
-    # Only add mocks with :443 in the URL (PyGithub expects this in your environment)
-    pr_url_443 = f"https://api.github.com:443/repos/{repo_url}/pulls/{pr_number}"
-    repo_responses.add(
-        repo_responses.GET,
-        pr_url_443,
-        json=pr_data,
-        status=200,
-    )
-    # Register both :443 and non-ported URLs for reviews endpoint
+    # The pull request itself is never fetched, only its reviews
 
     reviews_url_443 = f"https://api.github.com:443/repos/{repo_url}/pulls/{pr_number}/reviews"
     repo_responses.add(
@@ -85,3 +69,71 @@ async def test_list_pr_reviews(pr_reviews_response):
     assert len(reviews) == 1
     assert getattr(reviews[0], "body", None) == "Here is the body for the review."
     assert getattr(reviews[0], "state", None) == "APPROVED"
+
+
+def _review(review_id, login, submitted_at):
+    return {"id": review_id, "user": {"login": login}, "state": "COMMENTED", "submitted_at": submitted_at}
+
+
+@pytest.fixture
+def pr_reviews_pages(repo_data, repo_responses):
+    """Fixture for two pages of pull request reviews, linked like the GitHub API does."""
+    repo_url, repo_api_url, repo_response = repo_data
+    reviews_url_443 = f"https://api.github.com:443/repos/{repo_url}/pulls/5/reviews"
+    reviews_url = f"https://api.github.com/repos/{repo_url}/pulls/5/reviews"
+    repo_responses.add(
+        repo_responses.GET,
+        reviews_url_443,
+        json=[_review(1, "octocat", "2025-05-01T00:00:00Z"), _review(2, "hubot", "2025-05-02T00:00:00Z")],
+        headers={"Link": f'<{reviews_url}?page=2>; rel="next", <{reviews_url}?page=2>; rel="last"'},
+        match=[responses.matchers.query_param_matcher({})],
+    )
+    repo_responses.add(
+        repo_responses.GET,
+        reviews_url_443,
+        json=[_review(3, "octocat", "2025-05-03T00:00:00Z"), _review(4, "hubot", "2025-05-04T00:00:00Z")],
+        headers={"Link": f'<{reviews_url}?page=1>; rel="prev", <{reviews_url}?page=1>; rel="first"'},
+        match=[responses.matchers.query_param_matcher({"page": "2"})],
+    )
+    return repo_responses, repo_url
+
+
+@pytest.mark.asyncio
+async def test_list_pr_reviews_since_stops_paging(pr_reviews_pages):
+    repo_responses, repo_url = pr_reviews_pages
+    op = ListPRReviewsOp(root_dir=repo_url, token="fake-token")
+    reviews = await op(pr_number=5, since=datetime(2025, 5, 3, 12))
+    assert [r.id for r in reviews] == [4]
+    # the first page is only read for its Link header, paging stops at the first older review
+    assert [c.request.url for c in repo_responses.calls[1:]] == [
+        f"https://api.github.com:443/repos/{repo_url}/pulls/5/reviews",
+        f"https://api.github.com:443/repos/{repo_url}/pulls/5/reviews?page=2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_pr_reviews_author_newest_first(pr_reviews_pages):
+    repo_responses, repo_url = pr_reviews_pages
+    op = ListPRReviewsOp(root_dir=repo_url, token="fake-token")
+    reviews = await op(pr_number=5, author="hubot", order="desc", max_results=1)
+    assert [r.id for r in reviews] == [4]
+
+
+@pytest.mark.asyncio
+async def test_read_pr_comments_pushes_filters_to_api(repo_data, repo_responses):
+    repo_url, repo_api_url, repo_response = repo_data
+    repo_responses.add(
+        repo_responses.GET,
+        f"https://api.github.com:443/repos/{repo_url}/pulls/5/comments",
+        json=[{"id": 9, "body": "nit", "user": {"login": "octocat"}}],
+        match=[
+            responses.matchers.query_param_matcher({
+                "sort": "created",
+                "direction": "desc",
+                "since": "2025-05-01T00:00:00Z",
+            })
+        ],
+    )
+    op = ReadPRCommentsOp(root_dir=repo_url, token="fake-token")
+    comments = await op(pr_number=5, since=datetime(2025, 5, 1), order="desc")
+    assert [c.body for c in comments] == ["nit"]
@@ -1,10 +1,14 @@
 """Tests for the GitHub Repository operations using responses for mocking only (no PyGithub object mocking)."""
 
-from datetime import datetime
+import json
+import time
+from datetime import datetime, timezone
 
 import pytest
+import responses
 
 from dev_kit_gh_mcp_server.tools import (
+    CompareRefsOp,
     ListCommitsOp,
     ListIssuesOp,
     ListPRsOp,
@@ -132,3 +136,192 @@ async def test_list_tags_op_success(repo_data, tags_responses):
     assert len(tags) == 2
     assert tags[0].name == "v1.0.0"
     assert tags[1].name == "v2.0.0"
+
+
+@pytest.mark.asyncio
+async def test_list_issues_resolves_metadata_locally(repo_data, metadata_responses, issues_response):
+    repo_url, repo_api_url, repo_response = repo_data
+    metadata_responses.add(
+        metadata_responses.GET,
+        f"https://api.github.com:443/repos/{repo_url}/issues",
+        json=issues_response,
+        match=[
+            responses.matchers.query_param_matcher({
+                "state": "open",
+                "sort": "created",
+                "direction": "desc",
+                "labels": "bug,Enhancement",
+                "milestone": "3",
+            })
+        ],
+    )
+    op = ListIssuesOp(root_dir=repo_url, token="fake-token")
+    issues = await op(labels=["BUG", "enhancement"], milestone="v1.0")
+    assert len(issues) == 2
+    issues = await op(labels=["bug", "Enhancement"], milestone="3")
+    assert len(issues) == 2
+    # metadata was loaded once and served locally for the second call
+    assert sum("/labels" in c.request.url for c in metadata_responses.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_issues_unknown_milestone(repo_data, metadata_responses):
+    repo_url, repo_api_url, repo_response = repo_data
+    op = ListIssuesOp(root_dir=repo_url, token="fake-token")
+    with pytest.raises(ValueError, match=r"Unknown milestones: v9\.9\. Available milestones: v1\.0"):
+        await op(milestone="v9.9")
+    assert not any("/issues" in c.request.url for c in metadata_responses.calls)
+
+
+def test_operations_share_repository(repo_data, repo_responses):
+    repo_url, repo_api_url, repo_response = repo_data
+    ops = [ListIssuesOp(root_dir=repo_url, token="fake-token"), ListPRsOp(root_dir=repo_url, token="fake-token")]
+    assert ops[0]._gh_repo is ops[1]._gh_repo
+    assert len(repo_responses.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_commits_from_local_clone(local_clone):
+    temp_dir, repo, repo_responses = local_clone
+    op = ListCommitsOp(root_dir=temp_dir, token="fake-token")
+    commits = await op(max_results=2)
+    assert [commit.commit.message for commit in commits] == ["Change 3", "Change 2"]
+    assert commits[0].sha == repo.commit("HEAD~1").hexsha
+    assert commits[0].commit.author.date == datetime(2025, 5, 3, 12, tzinfo=timezone.utc)
+    assert commits[0].parents[0].sha == repo.commit("HEAD~2").hexsha
+
+    commits = await op(path="README.md", author="MONA@example.com", since=datetime(2025, 5, 2))
+    assert [commit.commit.message for commit in commits] == ["Change 3"]
+    assert [commit.commit.message for commit in await op(sha="v1.10.0")] == ["Change 2", "Change 1"]
+    # only the repository itself was requested
+    assert len(repo_responses.calls) == 1
+
+
+@pytest.fixture
+def new_york_time():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("TZ", "America/New_York")
+        time.tzset()
+        yield
+    # the local time zone is reset once TZ is restored
+    time.tzset()
+
+
+@pytest.mark.asyncio
+async def test_local_history_treats_naive_times_as_utc(local_clone, new_york_time):
+    temp_dir, _, _ = local_clone
+    commits = await ListCommitsOp(root_dir=temp_dir, token="fake-token")(since=datetime(2025, 5, 3, 12))
+    assert [commit.commit.message for commit in commits] == ["Change 3"]
+
+
+@pytest.mark.asyncio
+async def test_list_commits_falls_back_to_api(local_clone, repo_data, commits_response):
+    temp_dir, repo, repo_responses = local_clone
+    repo_url, repo_api_url, repo_response = repo_data
+    repo_responses.add(
+        repo_responses.GET,
+        f"https://api.github.com:443/repos/{repo_url}/commits",
+        json=commits_response,
+        match=[responses.matchers.query_param_matcher({"sha": "feature"})],
+    )
+    repo_responses.add(
+        repo_responses.GET,
+        f"https://api.github.com:443/repos/{repo_url}/commits",
+        json=commits_response[:1],
+        match=[responses.matchers.query_param_matcher({"author": "octocat"})],
+    )
+    op = ListCommitsOp(root_dir=temp_dir, token="fake-token")
+    assert [commit.sha for commit in await op(sha="feature")] == ["abc123", "def456"]
+    # logins are unknown to git
+    assert [commit.sha for commit in await op(author="octocat")] == ["abc123"]
+
+
+@pytest.mark.asyncio
+async def test_list_tags_from_local_clone(local_clone):
+    temp_dir, repo, _ = local_clone
+    op = ListTagsOp(root_dir=temp_dir, token="fake-token")
+    tags = await op()
+    assert [tag.name for tag in tags] == ["v1.10.0", "v1.0.0"]
+    assert tags[0].commit.sha == repo.commit("HEAD~2").hexsha
+    assert [tag.name for tag in await op(max_results=1)] == ["v1.10.0"]
+
+
+@pytest.mark.asyncio
+async def test_unpushed_tag_lists_tags_from_api(local_clone, tags_responses):
+    temp_dir, repo, _ = local_clone
+    # the tag of the unpushed commit may not be on GitHub
+    repo.create_tag("v2.0.0")
+    tags = await ListTagsOp(root_dir=temp_dir, token="fake-token")()
+    assert [tag.name for tag in tags] == ["v1.0.0", "v2.0.0"]
+
+
+@pytest.mark.asyncio
+async def test_compare_refs_from_local_clone(local_clone):
+    temp_dir, repo, repo_responses = local_clone
+    repo.git.mv("docs/2.md", "docs/two.md")
+    repo.index.commit("Rename\n\nwith a body")
+    repo.git.update_ref("refs/remotes/origin/feature", "HEAD")
+    # the async operation builds the repository without fetching it
+    repo_responses.assert_all_requests_are_fired = False
+    op = CompareRefsOp(root_dir=temp_dir, token="fake-token")
+
+    comparison = await op(base="v1.0.0", head="master")
+    assert (comparison["status"], comparison["ahead_by"], comparison["behind_by"]) == ("ahead", 2, 0)
+    assert comparison["merge_base"] == repo.commit("v1.0.0").hexsha
+    assert [commit["message"] for commit in comparison["commits"]] == ["Change 2", "Change 3"]
+    assert [(file["filename"], file["status"], file["additions"]) for file in comparison["files"]] == [
+        ("README.md", "modified", 1),
+        ("docs/2.md", "added", 1),
+    ]
+
+    comparison = await op(base="v1.10.0", head="feature")
+    assert comparison["commits"][-1]["message"] == "Rename"
+    assert [file["filename"] for file in comparison["files"]] == ["README.md", "docs/4.md", "docs/two.md"]
+    assert comparison["files"][2] == {
+        "filename": "docs/two.md",
+        "status": "renamed",
+        "additions": 0,
+        "deletions": 0,
+        "changes": 0,
+        "previous_filename": "docs/2.md",
+    }
+    assert (await op(base="feature", head="v1.10.0"))["status"] == "behind"
+    assert not repo_responses.calls
+
+
+@pytest.mark.asyncio
+async def test_compare_refs_with_api(mock_github):
+    commits = [
+        {
+            "sha": f"{n:040x}",
+            "commit": {"message": f"Change {n}\n\nbody", "author": {"name": "Mona", "date": "2025-05-01T12:00:00Z"}},
+        }
+        for n in range(1, 4)
+    ]
+    files = [
+        {"filename": f"src/{n}.py", "status": "modified", "additions": n, "deletions": 0, "changes": n, "patch": "@@"}
+        for n in range(200)
+    ]
+    mock_github.add(
+        "GET",
+        "/repos/octocat/Hello-World/compare/main...feature%2Fx",
+        {
+            "status": "diverged",
+            "ahead_by": 3,
+            "behind_by": 1,
+            "total_commits": 3,
+            "merge_base_commit": {"sha": "b" * 40},
+            "commits": commits,
+            "files": files,
+        },
+    )
+    op = CompareRefsOp(root_dir="octocat/Hello-World", token="fake-token", base_url=mock_github.url)
+    comparison = await op(base="main", head="feature/x", max_bytes=4_000)
+    assert [commit["message"] for commit in comparison["commits"]] == ["Change 1", "Change 2", "Change 3"]
+    assert "patch" not in comparison["files"][0]
+    # the files that do not fit are counted
+    assert comparison["omitted_files"] == 200 - len(comparison["files"]) > 0
+    assert comparison["omitted_commits"] == 0
+    assert len(json.dumps(comparison)) <= 4_000
+    assert mock_github.requests[0][1] == "/repos/octocat/Hello-World/compare/main...feature%2Fx?page=1&per_page=40"
+    await CompareRefsOp.aclose_clients()
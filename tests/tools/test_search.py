@@ -0,0 +1,124 @@
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import pytest_asyncio
+from github.GithubException import RateLimitExceededException
+
+from dev_kit_gh_mcp_server.tools import SearchIssuesOp
+from dev_kit_gh_mcp_server.tools.search import search_query
+
+
+def item(number, pull_request=False, **fields):
+    return {
+        "number": number,
+        "title": f"Item {number}",
+        "state": "open",
+        "user": {"login": "mona"},
+        "labels": [{"name": "bug"}],
+        "assignees": [],
+        **({"pull_request": {"url": "..."}} if pull_request else {}),
+        **fields,
+    }
+
+
+@pytest.fixture
+def search_api(mock_github):
+    def results(items, total_count, next_page=None, remaining=29, reset=None):
+        headers = {
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(reset or time.time() + 60)),
+        }
+        if next_page:
+            headers["Link"] = f'<{{url}}/search/issues?page={next_page}>; rel="next"'
+        return {"total_count": total_count, "incomplete_results": False, "items": items}, headers
+
+    body, headers = results([item(1), item(2, pull_request=True)], 5, next_page=2)
+    mock_github.add("GET", "/search/issues", body, headers=headers)
+    body, headers = results([item(3), item(4)], 5, next_page=3, remaining=28)
+    mock_github.add("GET", "/search/issues?page=2", body, headers=headers)
+    return mock_github, results
+
+
+@pytest_asyncio.fixture
+async def search(search_api):
+    server, _ = search_api
+    yield SearchIssuesOp(root_dir="octocat/Hello-World", token="fake-token", base_url=server.url)
+    await SearchIssuesOp.aclose_clients()
+    SearchIssuesOp._search_budgets.clear()
+
+
+def searches(server):
+    return [urlsplit(path) for _, path, *_ in server.requests if path.startswith("/search/issues")]
+
+
+def test_search_query():
+    moment = datetime(2025, 5, 1, 12, tzinfo=timezone.utc)
+    assert search_query(
+        "octocat/Hello-World",
+        text="crash on start",
+        kind="issue",
+        state="open",
+        labels=["good first issue"],
+        any_labels=["bug", "crash"],
+        no=["assignee"],
+        updated_after=moment,
+        created_before=moment,
+        linked="pr",
+    ) == (
+        'repo:octocat/Hello-World crash on start is:issue is:open label:"good first issue" label:bug,crash '
+        "no:assignee updated:>=2025-05-01T12:00:00Z created:<=2025-05-01T12:00:00Z linked:pr"
+    )
+    assert search_query("o/r", updated_after=moment, updated_before=moment, review="approved") == (
+        "repo:o/r updated:2025-05-01T12:00:00Z..2025-05-01T12:00:00Z review:approved"
+    )
+    with pytest.raises(ValueError, match="Invalid review"):
+        search_query("o/r", review="lgtm")
+
+
+@pytest.mark.asyncio
+async def test_search_pages_until_enough_items(search, search_api):
+    server, _ = search_api
+    result = await search(text="crash", kind="issue", no=["assignee"], sort="updated", max_results=3)
+    assert [found["number"] for found in result["items"]] == [1, 2, 3]
+    assert [found["kind"] for found in result["items"]] == ["issue", "pr", "issue"]
+    assert result["truncated"] is True
+    assert result["total_count"] == 5
+    assert result["search_rate_limit"]["remaining"] == 28
+    first, second = searches(server)
+    query = parse_qs(first.query)
+    assert query["q"] == ["repo:octocat/Hello-World crash is:issue no:assignee"]
+    assert query["per_page"] == ["3"] and query["sort"] == ["updated"] and query["order"] == ["desc"]
+    assert second.query == "page=2"
+
+
+@pytest.mark.asyncio
+async def test_search_stops_at_the_first_page_with_enough_items(search, search_api):
+    server, _ = search_api
+    result = await search(max_results=2)
+    assert len(result["items"]) == 2
+    assert len(searches(server)) == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_search_rate_limit(search, search_api, monkeypatch):
+    server, results = search_api
+    body, headers = results([item(1)], 1, remaining=0, reset=time.time() + 3600)
+    server.add("GET", "/search/issues", body, headers=headers)
+    await search()
+    with pytest.raises(RateLimitExceededException, match="search rate limit"):
+        await search()
+    assert len(searches(server)) == 1
+    # a limit that resets soon is waited for
+    monkeypatch.setattr(SearchIssuesOp, "max_rate_limit_wait", 3600.0)
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("dev_kit_gh_mcp_server.tools.search.asyncio.sleep", sleep)
+    await search()
+    assert len(sleeps) == 1 and sleeps[0] > 3000